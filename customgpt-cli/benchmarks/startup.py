@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the CLI.
+
+Runs each command as a fresh process, the way cron jobs and shell pipelines
+call the CLI, and reports wall-clock percentiles. API commands go to an
+in-process mock server so no network is needed.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 50 --format json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from customgpt_cli.mock_server import MockServer
+
+# (label, arguments); {url} is replaced with the mock server URL
+COMMANDS = [
+    ('python (baseline)', None),
+    ('--help', ['--help']),
+    ('get-user --help', ['get-user', '--help']),
+    ('list-projects --help', ['list-projects', '--help']),
+    ('get-user', ['--base-url', '{url}', 'get-user']),
+    ('show-project', ['--base-url', '{url}', 'show-project', '--project-id', '1']),
+]
+
+
+def time_command(args, runs, env):
+    """Run a command `runs` times and return wall-clock durations in milliseconds."""
+    if args is None:
+        command = [sys.executable, '-c', 'pass']
+    else:
+        command = [sys.executable, '-m', 'customgpt_cli.cli', *args]
+    durations = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def summarize(durations):
+    cuts = statistics.quantiles(durations, n=10, method='inclusive') if len(durations) > 1 else durations * 9
+    return {
+        'min_ms': round(min(durations), 1),
+        'p50_ms': round(statistics.median(durations), 1),
+        'p90_ms': round(cuts[8], 1),
+        'max_ms': round(max(durations), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI startup time')
+    parser.add_argument('--runs', type=int, default=20, help='Runs per command (default: 20)')
+    parser.add_argument('--format', choices=['table', 'json'], default='table', help='Output format')
+    args = parser.parse_args()
+
+    env = dict(os.environ, CUSTOMGPT_API_KEY='benchmark')
+    results = {}
+    with MockServer(projects=10) as server:
+        for label, command in COMMANDS:
+            if command is not None:
+                command = [arg.format(url=server.url) for arg in command]
+            time_command(command, 1, env)  # warm the bytecode cache
+            results[label] = summarize(time_command(command, args.runs, env))
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'command':<24} {'min':>8} {'p50':>8} {'p90':>8} {'max':>8}  (ms, {args.runs} runs)")
+    for label, summary in results.items():
+        print(f"{label:<24} {summary['min_ms']:>8} {summary['p50_ms']:>8} {summary['p90_ms']:>8} {summary['max_ms']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,19 +7,58 @@ allowing users to manage projects, conversations, and pages through simple comma
 """
 
 import argparse
+import contextlib
+import importlib
 import sys
 import logging
 import os
 import time
 import json
 import ast
+import random
+import threading
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from customgpt_client import CustomGPT
-from customgpt_client.types import File
+
+class LazyImport:
+    """
+    Stand-in for a module attribute that is imported on first use.
+    
+    Importing customgpt_client loads every model class in the SDK, which is most
+    of the CLI's startup time, so it is deferred until a command actually calls
+    the API. Attribute access, assignment and calls are forwarded to the target.
+    """
+    
+    def __init__(self, module, name):
+        object.__setattr__(self, '_module', module)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_target', None)
+        
+    def _load(self):
+        if self._target is None:
+            target = getattr(importlib.import_module(self._module), self._name)
+            object.__setattr__(self, '_target', target)
+        return self._target
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+    
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+        
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+        
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+CustomGPT = LazyImport('customgpt_client', 'CustomGPT')
+File = LazyImport('customgpt_client.types', 'File')
 
 def setup_logging() -> logging.Logger:
     """
@@ -43,7 +82,8 @@ def setup_logging() -> logging.Logger:
     if log_file:
         handlers.append(logging.FileHandler(log_file))
     else:
-        handlers.append(logging.StreamHandler(sys.stdout))
+        # stdout carries command output (JSON, NDJSON, CSV), so log notices go to stderr
+        handlers.append(logging.StreamHandler(sys.stderr))
     
     # Setup basic configuration
     logging.basicConfig(
@@ -62,8 +102,8 @@ def setup_logging() -> logging.Logger:
     
     return logger
 
-# Setup logging once at module level
-logger = setup_logging()
+# Configured by setup_logging() in main(), not at import time
+logger = logging.getLogger(__name__)
 
 # Type aliases
 ProjectID = str
@@ -71,44 +111,927 @@ SessionID = str
 PageID = str
 JsonDict = Dict[str, Any]
 
-class CustomGPTCLI:
-    def __init__(self):
-        self.parser = self._create_parser()
+class DateTimeEncoder(json.JSONEncoder):
+    """JSON encoder that serializes datetime values as ISO 8601 strings."""
+    
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        return super().default(obj)
+
+class StreamingTableWriter:
+    """
+    Fixed-width table renderer that prints rows as they arrive.
+    
+    Column widths are sized from the first `sample_size` rows. Only that sample
+    is buffered; later values wider than their column are truncated, so memory
+    stays flat however many rows are written.
+    """
+    
+    def __init__(self, headers, sample_size=50, max_width=40, stream=None):
+        """
+        Args:
+            headers: Column headers
+            sample_size: Number of rows buffered to size the columns
+            max_width: Maximum width of any column
+            stream: Output stream (default: sys.stdout)
+        """
+        self.headers = [str(h) for h in headers]
+        self.sample_size = max(1, sample_size)
+        self.max_width = max_width
+        self.stream = stream or sys.stdout
+        self._sample = []
+        self._widths = None
         
-    def _create_parser(self) -> argparse.ArgumentParser:
-        # Create main parser
-        parser = argparse.ArgumentParser(description='CustomGPT CLI Tool')
-        parser.add_argument('--api-key', help='CustomGPT API Key (can also be set via CUSTOMGPT_API_KEY env var)', required=False)
+    def write_row(self, row):
+        """Write a row, or buffer it while the column widths are still unknown."""
+        values = ['' if v is None else str(v) for v in row]
+        if self._widths is None:
+            self._sample.append(values)
+            if len(self._sample) >= self.sample_size:
+                self._flush_sample()
+            return
+        self._write_line(values)
         
-        # Create subparsers for different commands
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    def close(self):
+        """Flush any buffered rows, printing the header even if no rows were written."""
+        if self._widths is None:
+            self._flush_sample()
+            
+    def _flush_sample(self):
+        widths = [len(h) for h in self.headers]
+        for values in self._sample:
+            for i, value in enumerate(values):
+                widths[i] = max(widths[i], len(value))
+        self._widths = [min(w, self.max_width) for w in widths]
+        
+        self._write_line(self.headers)
+        self._write_line(['-' * w for w in self._widths])
+        for values in self._sample:
+            self._write_line(values)
+        self._sample = []
+        
+    def _write_line(self, values):
+        cells = []
+        for value, width in zip(values, self._widths):
+            if len(value) > width:
+                value = value[:width - 3] + '...' if width > 3 else value[:width]
+            cells.append(value.ljust(width))
+        self.stream.write('  '.join(cells).rstrip() + '\n')
+        self.stream.flush()
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry settings shared by every API call in one CLI run.
+    
+    Transient failures (connection errors, timeouts and the statuses in
+    retry_statuses) are retried with capped exponential backoff and full
+    jitter, so concurrent workers do not retry in lockstep. Rate-limited
+    requests wait for Retry-After instead but count against the same limits.
+    
+    Attributes:
+        max_retries: Maximum number of retries for a single call
+        base_delay: Backoff delay before the first retry, in seconds
+        max_delay: Upper bound for a single backoff delay, in seconds
+        deadline: Maximum seconds a single call may spend including retries
+        retry_budget: Maximum number of retries across the whole run
+        retry_statuses: HTTP status codes treated as transient
+    """
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    deadline: Optional[float] = None
+    retry_budget: Optional[int] = None
+    retry_statuses: tuple = (502, 503, 504)
+    _retries_used: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    
+    @property
+    def transient_exceptions(self):
+        """Network errors worth retrying (requests is only imported once a call fails)."""
+        import requests
+        return (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        )
+    
+    def backoff(self, attempt):
+        """Return a full-jitter delay for the given retry attempt (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def allow_retry(self, started, delay):
+        """
+        Check the per-call deadline and take one retry from the run's budget.
+        
+        Args:
+            started: time.monotonic() value when the call started
+            delay: Seconds the caller is about to wait before retrying
+            
+        Returns:
+            bool: True if the retry may go ahead
+        """
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return False
+        with self._lock:
+            if self.retry_budget is not None and self._retries_used >= self.retry_budget:
+                return False
+            self._retries_used += 1
+        return True
+
+def percentile(values, pct):
+    """
+    Return the pct-th percentile of values using linear interpolation.
+    
+    Args:
+        values: Sequence of numbers
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        float or None if values is empty
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+@dataclass
+class StreamTimings:
+    """
+    Latency measurements for one streamed response.
+    
+    All values are time.monotonic() readings. connected is taken when the
+    response headers arrive; each chunk is marked as its content is received.
+    """
+    started: float
+    connected: Optional[float] = None
+    finished: Optional[float] = None
+    chunk_times: List[float] = field(default_factory=list)
+    
+    def mark_connected(self):
+        self.connected = time.monotonic()
+        
+    def mark_chunk(self):
+        self.chunk_times.append(time.monotonic())
+        
+    def mark_finished(self):
+        self.finished = time.monotonic()
+        
+    def summary(self) -> JsonDict:
+        """Summarize the measurements in milliseconds."""
+        def ms(seconds):
+            return round(seconds * 1000, 1) if seconds is not None else None
+        
+        finished = self.finished or time.monotonic()
+        gaps = [b - a for a, b in zip(self.chunk_times, self.chunk_times[1:])]
+        duration = finished - self.started
+        return {
+            'connect_ms': ms(self.connected - self.started) if self.connected else None,
+            'ttft_ms': ms(self.chunk_times[0] - self.started) if self.chunk_times else None,
+            'gap_p50_ms': ms(percentile(gaps, 50)),
+            'gap_p90_ms': ms(percentile(gaps, 90)),
+            'gap_p99_ms': ms(percentile(gaps, 99)),
+            'gap_max_ms': ms(max(gaps)) if gaps else None,
+            'total_ms': ms(duration),
+            'chunks': len(self.chunk_times),
+            'chunks_per_sec': round(len(self.chunk_times) / duration, 2) if duration > 0 else None
+        }
+
+class RateLimiter:
+    """
+    Thread-safe token bucket paced by the API's rate limit headers.
+    
+    Every response updates the bucket from X-RateLimit-Remaining and
+    X-RateLimit-Reset, spreading the remaining budget evenly over the time
+    left until the reset. Until the first headers arrive (or once the reset
+    time has passed) requests are not paced. A 429 blocks every caller until
+    the Retry-After delay has elapsed.
+    """
+    
+    def __init__(self, burst=10):
+        """
+        Args:
+            burst: Maximum number of requests that may be sent back to back
+        """
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._capacity = float(burst)
+        self._rate = None  # Tokens per second; None means unpaced
+        self._reset_at = 0.0
+        self._blocked_until = 0.0
+        self._updated = time.monotonic()
+        
+    def acquire(self):
+        """Block until a request may be sent, then take one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._rate is None or now >= self._reset_at:
+                        self._rate = None
+                        return
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    if self._rate > 0:
+                        wait = (1 - self._tokens) / self._rate
+                    else:
+                        wait = self._reset_at - now
+            time.sleep(wait)
+            
+    def update(self, headers):
+        """
+        Re-pace the bucket from a response's rate limit headers.
+        
+        X-RateLimit-Reset may be either a Unix timestamp or a number of
+        seconds until the window resets.
+        """
+        if not headers:
+            return
+        try:
+            remaining = int(headers.get('X-RateLimit-Remaining'))
+            reset = float(headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return
+        
+        seconds = reset - time.time() if reset > 1e9 else reset
+        if seconds <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            if self._rate is None:
+                self._tokens = self._capacity
+            else:
+                self._refill(now)
+            self._reset_at = now + seconds
+            self._rate = max(remaining, 0) / seconds
+            self._capacity = max(1.0, min(float(self.burst), float(remaining)))
+            self._tokens = min(self._tokens, self._capacity, float(max(remaining, 0)))
+            self._updated = now
+            
+    def block(self, seconds):
+        """Hold back every caller for the given number of seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            
+    def _refill(self, now):
+        if self._rate:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+class MultipartStream:
+    """
+    multipart/form-data request body that reads file parts from disk as it is sent.
+    
+    requests builds multipart bodies in memory, reading every file completely
+    first. This body has a known length (so Content-Length is still sent) and
+    hands out file contents one block at a time, so memory use does not depend
+    on file size. File payloads are always sent from their beginning, which
+    makes the body safe to rebuild for a retried request.
+    """
+    
+    chunk_size = 1024 * 1024
+    
+    def __init__(self, fields, on_complete=None):
+        """
+        Args:
+            fields: Dict of field name to value or requests-style (filename, payload[, content_type]) tuple
+            on_complete: Optional callback(file_names, file_bytes, seconds) called once the body is sent
+        """
+        from urllib3.fields import RequestField
+        from urllib3.filepost import choose_boundary
+        
+        self.boundary = choose_boundary()
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self._on_complete = on_complete
+        self._parts = []  # bytes, or (file object, length)
+        self._file_names = []
+        self._file_bytes = 0
+        
+        for name, value in fields.items():
+            filename, payload, content_type = (tuple(value) + (None, None))[:3] if isinstance(value, tuple) else (None, value, None)
+            field = RequestField(name=name, data=b'', filename=filename)
+            field.make_multipart(content_type=content_type)
+            self._parts.append(f'--{self.boundary}\r\n'.encode() + field.render_headers().encode())
+            if hasattr(payload, 'read'):
+                payload.seek(0, os.SEEK_END)
+                length = payload.tell()
+                payload.seek(0)
+                self._parts.append((payload, length))
+                self._file_names.append(filename or name)
+                self._file_bytes += length
+            else:
+                self._parts.append(payload.encode() if isinstance(payload, str) else bytes(payload))
+            self._parts.append(b'\r\n')
+        self._parts.append(f'--{self.boundary}--\r\n'.encode())
+        
+        self._length = sum(part[1] if isinstance(part, tuple) else len(part) for part in self._parts)
+        self._index = 0
+        self._offset = 0
+        self._started = None
+        
+    def __len__(self):
+        return self._length
+    
+    def read(self, size=-1):
+        """Return up to size bytes of the body (one chunk if size is negative), b'' at the end."""
+        if size is None or size < 0:
+            size = self.chunk_size
+        if self._started is None:
+            self._started = time.monotonic()
+        
+        out = []
+        while size > 0 and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, tuple):
+                data = part[0].read(min(size, part[1] - self._offset))
+                done = not data or self._offset + len(data) >= part[1]
+            else:
+                data = part[self._offset:self._offset + size]
+                done = self._offset + len(data) >= len(part)
+            out.append(data)
+            size -= len(data)
+            self._offset += len(data)
+            if done:
+                self._index += 1
+                self._offset = 0
+                
+        if self._index == len(self._parts) and self._on_complete and self._file_names:
+            self._on_complete(self._file_names, self._file_bytes, time.monotonic() - self._started)
+            self._on_complete = None
+        return b''.join(out)
+    
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+class HttpTransport:
+    """
+    One pooled, keep-alive HTTP session shared by every SDK call in a run.
+    
+    The SDK calls requests.request() for every API call, which opens a new
+    session and connection each time. install() replaces the `requests` name
+    inside the SDK's API modules with this object, so those calls go through a
+    single requests.Session instead. Connections opened and reused are read
+    from urllib3's pool counters.
+    """
+    
+    def __init__(self, pool_size=10):
+        """
+        Args:
+            pool_size: Maximum connections kept per host; callers beyond this wait for one
+        """
+        import requests
+        
+        self._requests = requests
+        self._lock = threading.Lock()
+        self._retired_opened = 0
+        self._retired_requests = 0
+        self.session = requests.Session()
+        self.pool_size = 0
+        self.ensure_pool_size(pool_size)
+        
+    def ensure_pool_size(self, pool_size):
+        """Grow the connection pool to hold at least pool_size connections per host."""
+        from requests.adapters import HTTPAdapter
+        
+        with self._lock:
+            if pool_size <= self.pool_size:
+                return
+            old_adapter = self.session.adapters.get('https://')
+            if old_adapter is not None:
+                opened, requests_sent = self._pool_counts(old_adapter)
+                self._retired_opened += opened
+                self._retired_requests += requests_sent
+                old_adapter.close()
+            # pool_block keeps the number of open connections at pool_size
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.pool_size = pool_size
+            
+    def install(self):
+        """Route the SDK's HTTP calls through this transport."""
+        import customgpt_client  # noqa: F401 - loads the API modules patched below
         
-        # Project commands
-        self._add_project_commands(subparsers)
+        for name, module in list(sys.modules.items()):
+            if name.startswith('customgpt_client.api.') and hasattr(module, 'requests'):
+                module.requests = self
+                
+    def request(self, method, url, **kwargs):
+        """
+        Drop-in for requests.request() that reuses pooled connections.
         
-        # Conversation commands
-        self._add_conversation_commands(subparsers)
+        Multipart uploads of open files are sent as a MultipartStream, so files
+        are streamed from disk instead of being read into memory.
+        """
+        files = kwargs.get('files')
+        if files and 'data' not in kwargs and any(
+                isinstance(value, tuple) and len(value) > 1 and hasattr(value[1], 'read') for value in files.values()):
+            body = MultipartStream(kwargs.pop('files'), on_complete=self._report_upload)
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'Content-Type': body.content_type})
+            kwargs['data'] = body
+        return self.session.request(method, url, **kwargs)
+    
+    @staticmethod
+    def _report_upload(file_names, file_bytes, seconds):
+        megabytes = file_bytes / (1024 * 1024)
+        size = f"{megabytes:.1f} MB" if megabytes >= 1 else f"{file_bytes / 1024:.1f} KB"
+        rate = f" ({megabytes / seconds:.1f} MB/s)" if seconds > 0 else ""
+        sys.stderr.write(f"Uploaded {', '.join(file_names)}: {size} in {seconds:.2f}s{rate}\n")
+    
+    def __getattr__(self, name):
+        # Anything else the SDK reads from `requests` (e.g. exceptions)
+        return getattr(self._requests, name)
+    
+    @staticmethod
+    def _pool_counts(adapter):
+        opened = requests_sent = 0
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+        return opened, requests_sent
+    
+    def stats(self):
+        """
+        Returns:
+            Dict with connections opened and reused and requests sent so far
+        """
+        with self._lock:
+            opened, requests_sent = self._pool_counts(self.session.adapters['https://'])
+            opened += self._retired_opened
+            requests_sent += self._retired_requests
+        return {
+            'connections_opened': opened,
+            'connections_reused': max(0, requests_sent - opened),
+            'requests': requests_sent
+        }
+
+class ProjectStatsStore:
+    """
+    Per-invocation store of project stats shared by filtering and formatting.
+    
+    Each project ID is fetched at most once. Concurrent lookups of the same ID
+    wait on the request already in flight instead of issuing a second one.
+    """
+    
+    def __init__(self, fetch):
+        """
+        Args:
+            fetch: Callable taking a project ID and returning its stats (or None)
+        """
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self._futures: Dict[Any, Future] = {}
         
-        # Page commands
-        self._add_page_commands(subparsers)
+    def get(self, project_id):
+        """Return stats for project_id, fetching them only on the first lookup."""
+        with self._lock:
+            future = self._futures.get(project_id)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._futures[project_id] = future
+                
+        if is_owner:
+            try:
+                future.set_result(self._fetch(project_id))
+            except Exception as e:
+                future.set_exception(e)
+                
+        return future.result()
+    
+    def __contains__(self, project_id):
+        with self._lock:
+            return project_id in self._futures
 
-        self._add_citations_commands(subparsers)
+def file_sha256(path):
+    """Return the hex SHA-256 of a file, read in 1 MB blocks (runs in worker processes)."""
+    import hashlib
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
-        self._add_sources_commands(subparsers)
+def walk_files(root, rel_dir=''):
+    """Yield the relative paths of files under root/rel_dir, skipping hidden files and directories."""
+    for dirpath, dirnames, filenames in os.walk(os.path.join(root, rel_dir)):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for filename in sorted(filenames):
+            if not filename.startswith('.'):
+                yield os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, '/')
 
-        self._add_reports_commands(subparsers)
+class SourceManifest:
+    """
+    Record of the files uploaded from a directory, keyed by relative path.
+    
+    Stored as an append-only JSONL journal: each upload or removal is appended
+    and flushed as soon as it completes, so an interrupted run never uploads a
+    finished file twice. compact() rewrites the journal with one line per file.
+    Each entry holds the file's sha256, size, mtime_ns and the source_id and
+    page_id created for it.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.entries: Dict[str, JsonDict] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A run interrupted mid-write can leave a partial last line
+                        continue
+                    if record.get('deleted'):
+                        self.entries.pop(record.get('path'), None)
+                    elif record.get('path'):
+                        self.entries[record['path']] = record
+        self._journal = None
+        
+    def _append(self, record):
+        if self._journal is None:
+            self._journal = open(self.path, 'a')
+        self._journal.write(json.dumps(record) + '\n')
+        self._journal.flush()
+        
+    def record(self, entry):
+        """Store and journal the entry for entry['path']."""
+        with self._lock:
+            self.entries[entry['path']] = entry
+            self._append(entry)
+            
+    def remove(self, path):
+        """Forget a file and journal its removal."""
+        with self._lock:
+            self.entries.pop(path, None)
+            self._append({'path': path, 'deleted': True})
+            
+    def compact(self):
+        """Atomically rewrite the journal with the current entries only."""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                for path in sorted(self.entries):
+                    f.write(json.dumps(self.entries[path]) + '\n')
+            os.replace(tmp_path, self.path)
 
-        self._add_user_commands(subparsers)
+class PollingWatcher:
+    """
+    Detects changed files by comparing size and mtime snapshots of a directory.
+    
+    Used where inotify is unavailable (macOS, Windows, network filesystems or
+    an exhausted inotify watch limit).
+    """
+    
+    method = 'polling'
+    
+    def __init__(self, root, interval=2.0):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+        self._next_poll = time.monotonic() + interval
+        
+    def _scan(self):
+        snapshot = {}
+        for rel_path in walk_files(self.root):
+            try:
+                st = os.stat(os.path.join(self.root, rel_path))
+            except OSError:
+                continue
+            snapshot[rel_path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+    
+    def wait(self, timeout):
+        """
+        Wait up to timeout seconds for changes.
+        
+        Returns:
+            set: Relative paths of files created, modified or removed since the last poll
+        """
+        delay = self._next_poll - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(0, delay))
+        self._next_poll = time.monotonic() + self.interval
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+    
+    def close(self):
+        pass
 
-        self._add_project_settings_commands(subparsers)
+class InotifyWatcher:
+    """
+    Reports changed paths under a directory tree using Linux inotify through libc.
+    
+    Every non-hidden directory gets a watch; directories created or moved in
+    are watched as they appear and their files reported. Raises OSError when
+    inotify is unavailable so callers can fall back to PollingWatcher.
+    """
+    
+    method = 'inotify'
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+        
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is only available on Linux')
+        self.root = root
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches: Dict[int, str] = {}
+        try:
+            self._watch_tree('')
+        except OSError:
+            os.close(self.fd)
+            raise
+        
+    def _watch_tree(self, rel_dir):
+        """Watch rel_dir and every non-hidden directory below it."""
+        for dirpath, dirnames, _ in os.walk(os.path.join(self.root, rel_dir)):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            rel_path = os.path.relpath(dirpath, self.root).replace(os.sep, '/')
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.WATCH_MASK)
+            if wd < 0:
+                errno = self._ctypes.get_errno()
+                if errno == 28:  # ENOSPC: fs.inotify.max_user_watches reached
+                    raise OSError(errno, 'inotify watch limit reached')
+                continue  # Removed before it could be watched
+            self.watches[wd] = '' if rel_path == '.' else rel_path
+            
+    def _unwatch_tree(self, rel_dir):
+        """Stop watching a directory that was moved out of its old location."""
+        for wd, rel_path in list(self.watches.items()):
+            if rel_path == rel_dir or rel_path.startswith(rel_dir + '/'):
+                self._libc.inotify_rm_watch(self.fd, wd)
+                self.watches.pop(wd, None)
+                
+    def wait(self, timeout):
+        """
+        Wait up to timeout seconds for events.
+        
+        Returns:
+            Optional[set]: Relative paths of changed files and removed directories,
+                or None if the kernel queue overflowed and events were lost
+        """
+        import select
+        import struct
+        
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        overflowed = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = struct.unpack_from('iIII', data, offset)
+                name = os.fsdecode(data[offset + 16:offset + 16 + length].rstrip(b'\0'))
+                offset += 16 + length
+                if mask & self.IN_Q_OVERFLOW:
+                    overflowed = True
+                    continue
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if wd not in self.watches or not name or name.startswith('.'):
+                    continue
+                rel_path = f"{self.watches[wd]}/{name}" if self.watches[wd] else name
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        self._watch_tree(rel_path)
+                        changed.update(walk_files(self.root, rel_path))
+                    elif mask & (self.IN_MOVED_FROM | self.IN_DELETE):
+                        self._unwatch_tree(rel_path)
+                        changed.add(rel_path)
+                else:
+                    changed.add(rel_path)
+        return None if overflowed else changed
+    
+    def close(self):
+        os.close(self.fd)
 
-        self._add_plugins_commands(subparsers)
+# Settings a client forwards to the daemon along with its arguments
+DAEMON_ENV_VARS = ('CUSTOMGPT_API_KEY', 'CUSTOMGPT_BASE_URL')
 
-        self._add_limits_commands(subparsers)
+class SocketStream:
+    """
+    Text stream that sends everything written to it to a daemon client as JSON frames.
+    
+    Each frame is one line: {"stream": "stdout" | "stderr", "data": text}. Writes
+    from worker threads are serialized by a lock shared with the other stream.
+    """
+    
+    def __init__(self, wfile, name, lock):
+        self._wfile = wfile
+        self._name = name
+        self._lock = lock
+        
+    def write(self, text):
+        if text:
+            frame = json.dumps({'stream': self._name, 'data': text}) + '\n'
+            with self._lock:
+                try:
+                    self._wfile.write(frame.encode('utf-8'))
+                    self._wfile.flush()
+                except OSError:
+                    pass  # client went away; let the command finish
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def isatty(self):
+        return False
 
-        self._add_page_metadata_commands(subparsers)
+def forward_to_daemon(socket_path, argv):
+    """
+    Run a command in the daemon listening on socket_path and relay its output.
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        argv: Command line arguments (without the program name)
+        
+    Returns:
+        Optional[int]: The command's exit code, or None if no daemon is listening
+    """
+    import socket
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    
+    with sock, sock.makefile('rwb') as conn:
+        request = {
+            'argv': argv,
+            'cwd': os.getcwd(),
+            'env': {name: os.environ[name] for name in DAEMON_ENV_VARS if os.environ.get(name)}
+        }
+        conn.write(json.dumps(request).encode('utf-8') + b'\n')
+        conn.flush()
+        try:
+            for line in conn:
+                frame = json.loads(line)
+                if 'exit' in frame:
+                    return frame['exit']
+                stream = sys.stderr if frame.get('stream') == 'stderr' else sys.stdout
+                stream.write(frame.get('data', ''))
+                stream.flush()
+        except BrokenPipeError:
+            # Output was closed early (e.g. piped into head); stop quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+    
+    print("Error: CustomGPT CLI daemon closed the connection", file=sys.stderr)
+    return 1
 
-        self._add_preview_commands(subparsers)
+class CustomGPTCLI:
+    # (commands, parser builder, handler) per command group. Only the group of the
+    # selected command gets its parsers built; all groups are built for help and errors.
+    _COMMAND_GROUPS = [
+        (['create-project', 'show-project', 'list-projects', 'update-project', 'delete-projects', 'replicate-project', 'project-stats'],
+         '_add_project_commands', '_handle_project_commands'),
+        (['create-conversation', 'update-conversation', 'delete-conversation', 'send-message', 'batch-send', 'bench-chat', 'get-messages', 'get-message', 'update-message-feedback', 'export-conversations', 'changes'],
+         '_add_conversation_commands', '_handle_conversation_commands'),
+        (['get-pages', 'delete-page', 'reindex-page', 'reindex-pages', 'delete-pages'],
+         '_add_page_commands', '_handle_page_commands'),
+        (['get-citation'],
+         '_add_citations_commands', '_handle_citations_commands'),
+        (['list-sources', 'create-source', 'update-source', 'delete-source', 'sync-source'],
+         '_add_sources_commands', '_handle_sources_commands'),
+        (['get-traffic-report', 'get-queries-report', 'get-conversations-report', 'get-analysis-report'],
+         '_add_reports_commands', '_handle_reports_commands'),
+        (['get-user'],
+         '_add_user_commands', '_handle_user_commands'),
+        (['get-project-settings', 'update-project-settings', 'apply-settings'],
+         '_add_project_settings_commands', '_handle_project_settings_commands'),
+        (['list-plugins', 'create-plugin', 'update-plugin'],
+         '_add_plugins_commands', '_handle_plugins_commands'),
+        (['get-limits'],
+         '_add_limits_commands', '_handle_limits_commands'),
+        (['get-page-metadata', 'update-page-metadata', 'sync-page-metadata'],
+         '_add_page_metadata_commands', '_handle_page_metadata_commands'),
+        (['preview-file'],
+         '_add_preview_commands', '_handle_preview_commands'),
+        (['ingest-dir', 'watch-dir'],
+         '_add_ingest_commands', '_handle_ingest_commands'),
+        (['mirror'],
+         '_add_mirror_commands', '_handle_mirror_commands'),
+        (['serve'],
+         '_add_daemon_commands', '_handle_daemon_commands'),
+    ]
+    
+    # Global options that take no value
+    _GLOBAL_FLAGS = ['--transport-stats']
+    
+    # Commands that read stdin or ask for confirmation always run in the calling process
+    _LOCAL_COMMANDS = ['serve', 'batch-send', 'delete-projects', 'delete-conversation', 'watch-dir',
+                       'reindex-pages', 'delete-pages', 'sync-page-metadata']
+    
+    def __init__(self, argv=None):
+        self.parser = self._create_parser(argv)
+        self._stats_store = ProjectStatsStore(self._fetch_project_stats)
+        self._rate_limiter = RateLimiter()
+        self._retry_policy = RetryPolicy()
+        self._daemon_stats_stores = {}
+        self._transport = None
+        
+    @classmethod
+    def _selected_command(cls, argv):
+        """
+        Find the subcommand named in argv without building the full parser.
+        
+        Args:
+            argv: Command line arguments (without the program name)
+            
+        Returns:
+            Optional[str]: A known command name, or None if help was requested
+            before the command or no known command was given
+        """
+        known = {command for commands, _, _ in cls._COMMAND_GROUPS for command in commands}
+        args = iter(argv)
+        for arg in args:
+            if arg in ('-h', '--help'):
+                return None
+            if arg.startswith('-'):
+                if '=' not in arg and arg not in cls._GLOBAL_FLAGS:
+                    next(args, None)  # skip the option's value
+                continue
+            return arg if arg in known else None
+        return None
+    
+    def _create_parser(self, argv=None) -> argparse.ArgumentParser:
+        # Create main parser
+        parser = argparse.ArgumentParser(description='CustomGPT CLI Tool')
+        parser.add_argument('--api-key', help='CustomGPT API Key (can also be set via CUSTOMGPT_API_KEY env var)', required=False)
+        parser.add_argument('--base-url',
+                            help='API base URL, e.g. a local mock server (can also be set via CUSTOMGPT_BASE_URL env var)')
+        parser.add_argument('--max-retries', type=int, default=3,
+                            help='Maximum retries per API call for rate limits, network errors and 502/503/504 (default: 3)')
+        parser.add_argument('--retry-budget', type=int,
+                            help='Maximum total retries across the whole run (default: unlimited)')
+        parser.add_argument('--request-deadline', type=float,
+                            help='Maximum seconds a single API call may take including retries')
+        parser.add_argument('--pool-size', type=int,
+                            help='Maximum open HTTP connections (default: twice the command\'s --concurrency, at least 4)')
+        parser.add_argument('--transport-stats', action='store_true',
+                            help='Print HTTP connections opened and reused to stderr when the command finishes')
+        
+        # Create subparsers for different commands
+        subparsers = parser.add_subparsers(dest='command', help='Available commands')
+        
+        command = self._selected_command(sys.argv[1:] if argv is None else argv)
+        for commands, add_commands, _ in self._COMMAND_GROUPS:
+            if command is None or command in commands:
+                getattr(self, add_commands)(subparsers)
         
         return parser
     
@@ -153,8 +1076,17 @@ class CustomGPTCLI:
         list_projects.add_argument('--max-crawl-credits', type=int, help='Filter projects with at most X crawl credits used')
         list_projects.add_argument('--min-query-credits', type=int, help='Filter projects with at least X query credits used')
         list_projects.add_argument('--max-query-credits', type=int, help='Filter projects with at most X query credits used')
-        list_projects.add_argument('--format', choices=['table', 'json', 'csv', 'id-only'], default='table', 
-                                help='Output format')
+        list_projects.add_argument('--format', choices=['table', 'json', 'csv', 'ndjson', 'id-only'], default='table', 
+                                help='Output format (ndjson is always streamed)')
+        list_projects.add_argument('--stream', action='store_true',
+                                help='Print each row as soon as its stats arrive (csv, json and table formats)')
+        list_projects.add_argument('--sample-size', type=int, default=50,
+                                help='Rows used to size table columns when streaming (default: 50)')
+        list_projects.add_argument('--concurrency', type=int, default=4,
+                                help='Number of parallel listing and stats requests (default: 4)')
+        list_projects.add_argument('--from-mirror', action='store_true',
+                                help='Run the filters against the local mirror instead of the API (see mirror sync)')
+        list_projects.add_argument('--mirror', help='Mirror database (default: ~/.customgpt-cli/mirror.sqlite3)')
                 
         # Update project
         update_project = subparsers.add_parser('update-project', help='Update project')
@@ -195,6 +1127,10 @@ class CustomGPTCLI:
         delete_projects.add_argument('--project-ids', required=True, help='Comma-separated list of project IDs')
         delete_projects.add_argument('--dry-run', action='store_true', help='Show what would be deleted without actually deleting')
         delete_projects.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+        delete_projects.add_argument('--concurrency', type=int, default=4,
+                                help='Number of parallel lookup and delete requests (default: 4)')
+        delete_projects.add_argument('--checkpoint',
+                                help='File recording deleted projects; re-running with it skips them')
     
     def _handle_default_format(self, response):
         try:
@@ -290,6 +1226,78 @@ class CustomGPTCLI:
                                 choices=['table', 'json', 'id-only'],
                                 default='table',
                                 help='Output format (default: table)')
+            send_msg.add_argument('--timings',
+                                action='store_true',
+                                help='Report connect time, time-to-first-token, chunk gaps and throughput on stderr')
+            
+            # Batch send
+            batch_send = subparsers.add_parser('batch-send',
+                                            help='Send many prompts concurrently from a JSONL file',
+                                            description='Each input line is a JSON object with project_id and prompt, '
+                                                        'and optionally session_id, persona, model and response_source. '
+                                                        'Lines without a session_id get a new conversation. Results are '
+                                                        'written as JSONL in completion order, tagged with the 0-based '
+                                                        'input line index.')
+            batch_send.add_argument('--input',
+                                default='-',
+                                help='JSONL input file (default: stdin)')
+            batch_send.add_argument('--output',
+                                default='-',
+                                help='JSONL output file (default: stdout)')
+            batch_send.add_argument('--concurrency',
+                                type=int,
+                                default=4,
+                                help='Number of prompts in flight (default: 4)')
+            batch_send.add_argument('--conversation-name',
+                                default='batch-send',
+                                help='Name for conversations created on demand (default: batch-send)')
+            
+            # Benchmark chat
+            bench_chat = subparsers.add_parser('bench-chat',
+                                            help='Load test a project and report latency percentiles',
+                                            description='Send messages to a project at a fixed concurrency (closed loop) '
+                                                        'or request rate (open loop) for a number of requests or a '
+                                                        'duration, using the same send path as send-message.')
+            bench_chat.add_argument('--project-id',
+                                required=True,
+                                type=int,
+                                help='Project ID')
+            bench_chat.add_argument('--session-id',
+                                help='Session ID to send every message to (default: one new conversation per worker)')
+            bench_chat.add_argument('--prompt',
+                                default='Hello',
+                                help='Message prompt (default: Hello)')
+            bench_chat.add_argument('--prompts-file',
+                                help='File with one prompt per line, used in rotation instead of --prompt')
+            bench_chat.add_argument('--stream',
+                                action='store_true',
+                                help='Use streaming responses and measure time-to-first-token')
+            bench_chat.add_argument('--persona',
+                                help='Custom persona instructions')
+            bench_chat.add_argument('--model',
+                                choices=['gpt-4-o', 'gpt-4-turbo', 'gpt-4', 'gpt-4o-mini', 
+                                    'claude-3-sonnet', 'claude-3.5-sonnet'],
+                                help='Chatbot model to use')
+            bench_chat.add_argument('--response-source',
+                                choices=['default', 'own_content', 'openai_content'],
+                                default='default',
+                                help='Response source configuration')
+            bench_chat.add_argument('--concurrency',
+                                type=int,
+                                help='Requests in flight (default: 1, or 32 as an upper bound with --rate)')
+            bench_chat.add_argument('--rate',
+                                type=float,
+                                help='Target requests per second (open loop)')
+            bench_chat.add_argument('--duration',
+                                type=float,
+                                help='Run for this many seconds')
+            bench_chat.add_argument('--requests',
+                                type=int,
+                                help='Stop after this many requests (default: 10 if --duration is not set)')
+            bench_chat.add_argument('--format',
+                                choices=['table', 'json'],
+                                default='table',
+                                help='Output format (default: table)')
             
             # Get messages
             get_msgs = subparsers.add_parser('get-messages',
@@ -314,9 +1322,66 @@ class CustomGPTCLI:
                                 default='table',
                                 help='Output format (default: table)')
             
-            # Get specific message
-            get_msg = subparsers.add_parser('get-message',
-                                        help='Retrieve a specific message')
+            # Export conversations
+            export_convs = subparsers.add_parser('export-conversations',
+                                            help='Export every conversation of a project with its messages as JSONL',
+                                            description='Each output line is a JSON object with a conversation and '
+                                                        'all of its messages, oldest first. Output ending in .gz is '
+                                                        'gzip-compressed.')
+            export_convs.add_argument('--project-id',
+                                required=True,
+                                type=int,
+                                help='Project ID')
+            export_convs.add_argument('--output',
+                                default='-',
+                                help='Output file, .jsonl or .jsonl.gz (default: stdout)')
+            export_convs.add_argument('--concurrency',
+                                type=int,
+                                default=8,
+                                help='Number of conversations fetched in parallel (default: 8)')
+            export_convs.add_argument('--order',
+                                choices=['asc', 'desc'],
+                                default='asc',
+                                help='Conversation order (default: asc)')
+            export_convs.add_argument('--order-by',
+                                choices=['id', 'created_at'],
+                                default='id',
+                                help='Field conversations are ordered by (default: id)')
+            export_convs.add_argument('--user-filter',
+                                choices=['all', 'anonymous', 'team_member'],
+                                default='all',
+                                help='Only export conversations started by these users (default: all)')
+            
+            # Change feed
+            changes = subparsers.add_parser('changes',
+                                            help='Emit conversations and messages created since the last run as NDJSON',
+                                            description='Keeps a high-water mark per project and outputs only records '
+                                                        'newer than it: {"type": "conversation", ...} for new '
+                                                        'conversations and {"type": "message", ...} for new messages, '
+                                                        'oldest first. The mark is saved only after every record has '
+                                                        'been written, so a failed run is repeated in full next time.')
+            changes.add_argument('--project-id',
+                                required=True,
+                                type=int,
+                                help='Project ID')
+            changes.add_argument('--state',
+                                help='High-water mark file (default: ~/.customgpt-cli/changes-PROJECT_ID.json)')
+            changes.add_argument('--output',
+                                default='-',
+                                help='NDJSON file to append to (default: stdout)')
+            changes.add_argument('--concurrency',
+                                type=int,
+                                default=4,
+                                help='Number of conversations fetched in parallel (default: 4)')
+            changes.add_argument('--rescan-recent',
+                                type=int,
+                                default=100,
+                                help='Already-seen conversations, newest first, checked for follow-up messages '
+                                     '(default: 100)')
+            
+            # Get specific message
+            get_msg = subparsers.add_parser('get-message',
+                                        help='Retrieve a specific message')
             get_msg.add_argument('--project-id',
                             required=True,
                             type=int,
@@ -363,6 +1428,15 @@ class CustomGPTCLI:
         get_pages.add_argument('--page', type=int, default=1, help='Page number to return')
         get_pages.add_argument('--duration', type=int, help='The duration of the projects to list. Defaults to 90 days.')
         get_pages.add_argument('--order', choices=['asc', 'desc'], default='desc', help='The order of the projects to list. Defaults to desc.')
+        get_pages.add_argument('--all', action='store_true',
+                               help='Stream every page of the listing, fetched concurrently once the total is known')
+        get_pages.add_argument('--format', choices=['json', 'ndjson', 'csv'], default='json',
+                               help='Output format (default: json; ndjson and csv are one row per page)')
+        get_pages.add_argument('--fields',
+                               help='Comma-separated page fields to output (default: all fields; for csv: '
+                                    f"{','.join(self._PAGE_CSV_FIELDS)})")
+        get_pages.add_argument('--concurrency', type=int, default=4,
+                               help='Number of listing pages fetched in parallel with --all (default: 4)')
         
         # Delete page
         delete_page = subparsers.add_parser('delete-page', help='Delete a page')
@@ -373,6 +1447,45 @@ class CustomGPTCLI:
         reindex_page = subparsers.add_parser('reindex-page', help='Reindex a page')
         reindex_page.add_argument('--project-id', required=True, help='Project ID')
         reindex_page.add_argument('--page-id', required=True, help='Page ID')
+        
+        # Reindex pages
+        reindex_pages = subparsers.add_parser('reindex-pages', help='Reindex many pages selected by ID, URL, status or age')
+        self._add_page_selection_arguments(reindex_pages)
+        reindex_pages.add_argument('--dry-run', action='store_true', help='List the selected pages without reindexing them')
+        reindex_pages.add_argument('--concurrency', type=int, default=4,
+                                   help='Number of parallel listing and reindex requests (default: 4)')
+        reindex_pages.add_argument('--checkpoint',
+                                   help='File recording reindexed pages; re-running with it skips them')
+        
+        # Delete pages
+        delete_pages = subparsers.add_parser('delete-pages', help='Delete many pages selected by ID, URL, status or age',
+                                             description='Writes one JSON result per page to stdout and a summary '
+                                                         'to stderr.')
+        self._add_page_selection_arguments(delete_pages)
+        delete_pages.add_argument('--dry-run', action='store_true', help='List the selected pages without deleting them')
+        delete_pages.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+        delete_pages.add_argument('--concurrency', type=int, default=4,
+                                  help='Number of parallel listing and delete requests (default: 4)')
+        delete_pages.add_argument('--checkpoint',
+                                  help='File recording deleted pages; re-running with it skips them')
+    
+    def _add_page_selection_arguments(self, parser):
+        """Add the page selection arguments shared by the bulk page commands."""
+        statuses = ['ok', 'queued', 'failed', 'n/a', 'limited']
+        parser.add_argument('--project-id', required=True, help='Project ID')
+        parser.add_argument('--page-ids', help='Comma-separated list of page IDs')
+        parser.add_argument('--page-ids-file', help='File with one page ID per line (- for stdin)')
+        parser.add_argument('--url-regex', help='Only pages whose URL matches this regex')
+        parser.add_argument('--crawl-status', action='append', choices=statuses,
+                            help='Only pages with this crawl status (repeatable)')
+        parser.add_argument('--index-status', action='append', choices=statuses,
+                            help='Only pages with this index status (repeatable)')
+        parser.add_argument('--older-than', type=int, metavar='DAYS',
+                            help='Only pages last updated more than DAYS days ago')
+        parser.add_argument('--newer-than', type=int, metavar='DAYS',
+                            help='Only pages last updated within the last DAYS days')
+        parser.add_argument('--duration', type=int,
+                            help='Listing window in days passed to the API (API default: 90)')
 
     def _add_citations_commands(self, subparsers):
         """Add all citations-related command parsers."""
@@ -507,6 +1620,21 @@ class CustomGPTCLI:
         update_project_settings.add_argument('--is-selling-enabled', action='store_true', help='Is selling enabled')
         update_project_settings.add_argument('--license-slug', help='License slug')
         update_project_settings.add_argument('--selling-url', help='Selling URL')
+        
+        # Apply settings
+        apply_settings = subparsers.add_parser(
+            'apply-settings', help='Apply a settings file to many projects, updating only what differs',
+            description='The settings file is a YAML or JSON mapping of setting names (as returned by '
+                        'get-project-settings) to their desired values.')
+        apply_settings.add_argument('--file', required=True, help='Settings file (.yaml/.yml needs PyYAML, otherwise JSON)')
+        apply_settings.add_argument('--projects', required=True,
+                                    help='Comma-separated list of project IDs, or "all"')
+        apply_settings.add_argument('--name-filter', help='Only projects whose name matches this regex')
+        apply_settings.add_argument('--dry-run', action='store_true', help='Report drift without updating any project')
+        apply_settings.add_argument('--format', choices=['text', 'ndjson'], default='text',
+                                    help='Output format (default: text; ndjson is one result per project)')
+        apply_settings.add_argument('--concurrency', type=int, default=4,
+                                    help='Number of projects fetched and updated in parallel (default: 4)')
     
     def _add_plugins_commands(self, subparsers):
         """Add all plugins-related command parsers."""
@@ -551,6 +1679,20 @@ class CustomGPTCLI:
         update_page_metadata.add_argument('--url', help='Url')
         update_page_metadata.add_argument('--description', help='Description')
         update_page_metadata.add_argument('--image', help='Image')
+        
+        # Sync page metadata
+        sync_page_metadata = subparsers.add_parser(
+            'sync-page-metadata', help='Update page metadata from a CSV or JSONL file, sending only changes',
+            description='Each row needs a page_id (or id) column plus any of title, url, description and image. '
+                        'Empty CSV cells are ignored; in JSONL every given key is synced, including null.')
+        sync_page_metadata.add_argument('--project-id', required=True, help='Project ID')
+        sync_page_metadata.add_argument('--input', required=True, help='Metadata file, or - for stdin')
+        sync_page_metadata.add_argument('--input-format', choices=['csv', 'jsonl'],
+                                        help='Input format (default: jsonl for .jsonl/.ndjson files, otherwise csv)')
+        sync_page_metadata.add_argument('--concurrency', type=int, default=4,
+                                        help='Number of pages fetched and updated in parallel (default: 4)')
+        sync_page_metadata.add_argument('--dry-run', action='store_true',
+                                        help='Show the changes without updating any page')
 
     def _add_preview_commands(self, subparsers):
         """Add all preview-related command parsers."""
@@ -558,6 +1700,79 @@ class CustomGPTCLI:
         preview_file = subparsers.add_parser('preview-file', help='Preview file')
         preview_file.add_argument('--id', required=True, help='Page Id')
 
+    def _add_ingest_commands(self, subparsers):
+        """Add directory ingestion command parsers."""
+        ingest_dir = subparsers.add_parser('ingest-dir',
+                                           help='Upload new and changed files under a directory as project sources')
+        self._add_ingest_arguments(ingest_dir)
+        ingest_dir.add_argument('--rehash', action='store_true',
+                                help='Hash every file, even if its size and mtime match the manifest')
+        ingest_dir.add_argument('--dry-run', action='store_true',
+                                help='Show what would be uploaded and deleted without doing it')
+        
+        watch_dir = subparsers.add_parser('watch-dir',
+                                          help='Keep project sources in sync with a directory as files change')
+        self._add_ingest_arguments(watch_dir)
+        watch_dir.add_argument('--debounce', type=float, default=2.0,
+                               help='Seconds a file must be quiet before it is uploaded (default: 2.0)')
+        watch_dir.add_argument('--poll', action='store_true',
+                               help='Detect changes by polling instead of inotify')
+        watch_dir.add_argument('--poll-interval', type=float, default=2.0,
+                               help='Seconds between polls when polling (default: 2.0)')
+        watch_dir.add_argument('--no-initial-sync', action='store_true',
+                               help='Skip uploading changes made while the watcher was not running')
+        
+    def _add_ingest_arguments(self, parser):
+        """Add the arguments shared by ingest-dir and watch-dir."""
+        parser.add_argument('path', help='Directory to ingest (hidden files and directories are skipped)')
+        parser.add_argument('--project-id', required=True, help='Project to add the files to')
+        parser.add_argument('--manifest',
+                            help='Manifest of uploaded files (default: PATH/.customgpt-manifest-PROJECT_ID.jsonl)')
+        parser.add_argument('--include', action='append',
+                            help='Only ingest files whose relative path matches this glob (repeatable)')
+        parser.add_argument('--exclude', action='append',
+                            help='Skip files whose relative path matches this glob (repeatable)')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of parallel uploads (default: 4)')
+        parser.add_argument('--hash-workers', type=int, default=os.cpu_count() or 1,
+                            help='Processes used to hash files (default: number of CPUs)')
+        parser.add_argument('--delete-removed', action='store_true',
+                            help='Delete the content of files that no longer exist')
+        parser.add_argument('--file-data-retension', action='store_true', help='Retain file data for future reference')
+        parser.add_argument('--is-ocr-enabled', action='store_true', help='Enable Optical Character Recognition (OCR) for documents')
+        parser.add_argument('--is-anonymized', action='store_true', help='Anonymize the source data')
+
+    def _add_mirror_commands(self, subparsers):
+        """Add local mirror command parsers."""
+        mirror = subparsers.add_parser('mirror', help='Maintain a local SQLite mirror of the account')
+        mirror_commands = mirror.add_subparsers(dest='mirror_command', required=True)
+        
+        sync = mirror_commands.add_parser('sync', help='Update the mirror from the API')
+        sync.add_argument('--mirror', help='Mirror database (default: ~/.customgpt-cli/mirror.sqlite3)')
+        sync.add_argument('--concurrency', type=int, default=4,
+                          help='Number of projects fetched in parallel (default: 4)')
+        sync.add_argument('--resources', default='stats,pages,sources,settings,plugins',
+                          help='Comma-separated resources to mirror besides projects '
+                               '(default: stats,pages,sources,settings,plugins)')
+        sync.add_argument('--full', action='store_true',
+                          help='Refetch pages, sources, settings and plugins of unchanged projects too')
+        sync.add_argument('--interval', type=float,
+                          help='Keep running and sync again every this many seconds')
+        
+        status = mirror_commands.add_parser('status', help='Show what the mirror holds')
+        status.add_argument('--mirror', help='Mirror database (default: ~/.customgpt-cli/mirror.sqlite3)')
+        status.add_argument('--format', choices=['table', 'json'], default='table',
+                            help='Output format (default: table)')
+
+    def _add_daemon_commands(self, subparsers):
+        """Add the daemon command parser."""
+        serve = subparsers.add_parser('serve',
+                                      help='Run a background daemon that executes CLI commands sent over a Unix socket')
+        serve.add_argument('--socket', required=True,
+                           help='Path of the Unix socket to listen on (clients use CUSTOMGPT_CLI_SOCKET)')
+        serve.add_argument('--cache-ttl', type=float, default=60,
+                           help='Seconds cached project stats are reused across commands (default: 60)')
+
     def _handle_rate_limit(self, response, retry_count, max_retries):
         """
         Handle rate limiting for API responses.
@@ -573,94 +1788,247 @@ class CustomGPTCLI:
             - retry_after: Number of seconds to wait before retry
         """
         if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 30))
             remaining = response.headers.get('X-RateLimit-Remaining', 'unknown')
             reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
+            retry_after = self._get_retry_after(response.headers)
             
             logger.warning(f"Rate limited. Remaining requests: {remaining}, "
                         f"Reset time: {reset_time}, "
                         f"Retry after: {retry_after}s")
             
             if retry_count < max_retries:
-                print(f"Rate limited, waiting {retry_after} seconds before retry...")
                 return True, retry_after
             
             return False, 0
         return False, 0
 
-    def _make_api_call(self, api_func, max_retries=3, **kwargs):
+    def _get_retry_after(self, headers, default=30):
+        """
+        Work out how long to wait after a 429 response.
+        
+        Uses Retry-After when present, then the time left until
+        X-RateLimit-Reset, and only falls back to the default otherwise.
+        """
+        try:
+            return max(0, int(headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            pass
+        try:
+            reset = float(headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return default
+        seconds = reset - time.time() if reset > 1e9 else reset
+        return max(1, int(seconds + 0.999)) if seconds > 0 else default
+
+    def _make_api_call(self, api_func, max_retries=None, **kwargs):
         """
-        Make an API call with retry logic for rate limiting.
+        Make an API call with retry logic for rate limiting and transient errors.
+        
+        Every call first takes a token from the shared rate limiter, which is
+        then re-paced from the response's X-RateLimit-* headers. 429 responses
+        wait for Retry-After; connection errors, timeouts and 502/503/504
+        responses are retried with jittered exponential backoff. All retries
+        are bounded by the run's retry policy (deadline and retry budget).
         
         Args:
             api_func: Function to call (e.g., CustomGPT.Project.list)
-            max_retries: Maximum number of retries for rate-limited requests
+            max_retries: Maximum number of retries (default: --max-retries)
             **kwargs: Arguments to pass to the API function
             
         Returns:
-            API response or None if failed after retries
+            API response, or None if the call raised and could not be retried
         """
+        policy = self._retry_policy
+        if max_retries is None:
+            max_retries = policy.max_retries
+        name = getattr(api_func, '__name__', str(api_func))
+        started = time.monotonic()
         retry_count = 0
-        while retry_count <= max_retries:
+        
+        while True:
             try:
+                self._rate_limiter.acquire()
                 response = api_func(**kwargs)
-                
-                should_retry, retry_after = self._handle_rate_limit(response, retry_count, max_retries)
-                if should_retry:
-                    time.sleep(retry_after)
+                self._rate_limiter.update(getattr(response, 'headers', None))
+            except AttributeError as e:
+                return None
+            except policy.transient_exceptions as e:
+                delay = policy.backoff(retry_count)
+                if retry_count < max_retries and policy.allow_retry(started, delay):
+                    logger.warning(f"Transient error in API call to {name}: {str(e)}. "
+                                   f"Retrying in {delay:.1f}s ({retry_count + 1}/{max_retries})")
+                    time.sleep(delay)
                     retry_count += 1
                     continue
-                
-                return response
-            except AttributeError as e:
+                logger.error(f"Exception in API call to {name}: {str(e)}", exc_info=True)
                 return None
             except Exception as e:
-                logger.error(f"Exception in API call to {api_func.__name__}: {str(e)}", exc_info=True)
+                logger.error(f"Exception in API call to {name}: {str(e)}", exc_info=True)
                 return None
-                
-        return None
+            
+            should_retry, retry_after = self._handle_rate_limit(response, retry_count, max_retries)
+            if should_retry and policy.allow_retry(started, retry_after):
+                print(f"Rate limited, waiting {retry_after} seconds before retry...", file=sys.stderr)
+                # Pause every worker, not just this one; acquire() waits it out
+                self._rate_limiter.block(retry_after)
+                retry_count += 1
+                continue
+            
+            if getattr(response, 'status_code', None) in policy.retry_statuses:
+                delay = policy.backoff(retry_count)
+                if retry_count < max_retries and policy.allow_retry(started, delay):
+                    logger.warning(f"API call to {name} returned {int(response.status_code)}. "
+                                   f"Retrying in {delay:.1f}s ({retry_count + 1}/{max_retries})")
+                    time.sleep(delay)
+                    retry_count += 1
+                    continue
+            
+            return response
 
-    def _get_project_stats(self, project_id, max_retries=3):
-        """Get project stats using standard API call handler."""
+    def _fetch_project_stats(self, project_id, max_retries=None):
+        """Fetch project stats from the API using standard API call handler."""
         response = self._make_api_call(
             CustomGPT.Project.stats,
             max_retries=max_retries,
             project_id=project_id
         )
-        return response.parsed.data if response and hasattr(response, 'parsed') else None
+        return getattr(getattr(response, 'parsed', None), 'data', None)
 
-    def _get_all_projects(self, max_retries=3):
-        """Fetch all projects across multiple pages using standard API call handler."""
-        all_projects = []
-        page = 1
+    def _get_project_stats(self, project_id):
+        """Get project stats, reusing any result already fetched in this invocation."""
+        return self._stats_store.get(project_id)
+
+    def _get_projects_stats(self, projects, concurrency=1):
+        """
+        Fetch stats for many projects through a bounded worker pool.
         
-        while True:
-            response = self._make_api_call(
-                CustomGPT.Project.list,
-                max_retries=max_retries,
-                page=page
-            )
+        Every worker goes through _get_project_stats, so results are shared
+        through the stats store and rate limiting is still handled by
+        _make_api_call.
+        
+        Args:
+            projects: List of project objects
+            concurrency: Maximum number of stats requests in flight
             
-            if not response or not hasattr(response, 'parsed') or not response.parsed or \
-            not hasattr(response.parsed, 'data') or not response.parsed.data or \
-            not hasattr(response.parsed.data, 'data'):
-                logger.warning(f"Incomplete or invalid response on page {page} - stopping pagination")
-                break
-                
-            projects = response.parsed.data.data
-            if not projects:
-                break
-                
-            all_projects.extend(projects)
+        Returns:
+            list: Stats objects (or None) in the same order as projects
+        """
+        missing = [p for p in projects if p.id not in self._stats_store]
+        if concurrency > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(missing))) as executor:
+                list(executor.map(lambda p: self._get_project_stats(p.id), missing))
+        
+        return [self._get_project_stats(p.id) for p in projects]
+
+    def _iter_paginated(self, api_func, get_paginator, concurrency=1, max_retries=None, **kwargs):
+        """
+        Yield every item of a paginated endpoint, in page order.
+        
+        Page 1 is fetched first. Once it reports the total and page size, the
+        remaining pages are fetched through a bounded worker pool and yielded in
+        order, with at most `concurrency` pages held in memory at a time.
+        
+        Args:
+            api_func: Paginated API function (e.g., CustomGPT.Project.list)
+            get_paginator: Callable returning the paginator object (with data,
+                total and per_page attributes) from an API response
+            concurrency: Maximum number of page requests in flight
+            max_retries: Maximum number of retries (default: --max-retries)
+            **kwargs: Extra arguments to pass to the API function
             
-            if hasattr(response.parsed.data, 'total') and len(all_projects) >= response.parsed.data.total:
-                break
-                
-            page += 1
+        Yields:
+            Items from the paginator's data list
+        """
+        def fetch_page(page):
+            response = self._make_api_call(api_func, max_retries=max_retries, page=page, **kwargs)
+            try:
+                paginator = get_paginator(response)
+            except AttributeError:
+                paginator = None
+            if paginator is None or not isinstance(getattr(paginator, 'data', None), list):
+                logger.warning(f"Incomplete or invalid response on page {page}")
+                return None
+            return paginator
+        
+        first = fetch_page(1)
+        if first is None or not first.data:
+            return
+        yield from first.data
+        
+        total = getattr(first, 'total', None)
+        per_page = getattr(first, 'per_page', None)
+        if isinstance(total, int) and isinstance(per_page, int) and per_page > 0:
+            last_page = -(-total // per_page)
+        elif isinstance(getattr(first, 'last_page', None), int):
+            last_page = first.last_page
+        else:
+            # Page count unknown - walk pages one at a time until an empty page
+            page = 2
+            while True:
+                paginator = fetch_page(page)
+                if paginator is None or not paginator.data:
+                    break
+                yield from paginator.data
+                page += 1
+            return
+        
+        if last_page < 2:
+            return
+        
+        workers = max(1, min(concurrency, last_page - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for page in range(2, last_page + 1):
+                pending.append(executor.submit(fetch_page, page))
+                if len(pending) >= workers:
+                    paginator = pending.popleft().result()
+                    if paginator is not None:
+                        yield from paginator.data
+            while pending:
+                paginator = pending.popleft().result()
+                if paginator is not None:
+                    yield from paginator.data
+
+    def _get_all_projects(self, max_retries=None, concurrency=1):
+        """Fetch all projects across multiple pages using standard API call handler."""
+        return list(self._iter_paginated(
+            CustomGPT.Project.list,
+            lambda response: response.parsed.data,
+            concurrency=concurrency,
+            max_retries=max_retries
+        ))
+
+    def _get_project(self, project_id, max_retries=None):
+        """Look up a single project by ID, returning None if it does not exist."""
+        response = self._make_api_call(
+            CustomGPT.Project.get,
+            max_retries=max_retries,
+            project_id=project_id
+        )
+        
+        if not response or response.status_code != 200:
+            return None
+            
+        return getattr(getattr(response, 'parsed', None), 'data', None) or None
+
+    def _get_projects_by_id(self, project_ids, concurrency=1):
+        """
+        Look up many projects by ID through a bounded worker pool.
+        
+        Args:
+            project_ids: List of project IDs
+            concurrency: Maximum number of lookups in flight
             
-        return all_projects
+        Returns:
+            list: Project objects (or None when not found) in the same order as project_ids
+        """
+        if concurrency <= 1 or len(project_ids) <= 1:
+            return [self._get_project(project_id) for project_id in project_ids]
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(project_ids))) as executor:
+            return list(executor.map(self._get_project, project_ids))
 
-    def _delete_single_project(self, project, max_retries=3):
+    def _delete_single_project(self, project, max_retries=None):
         """Delete a single project using standard API call handler."""
         response = self._make_api_call(
             CustomGPT.Project.delete,
@@ -682,6 +2050,82 @@ class CustomGPTCLI:
         
         return deleted_status
 
+    def _read_checkpoint(self, path):
+        """
+        Read the IDs recorded as done in a JSONL checkpoint file.
+        
+        Args:
+            path: Checkpoint file path (may not exist yet)
+            
+        Returns:
+            set: IDs of items whose status is 'success'
+        """
+        done = set()
+        if not path or not os.path.exists(path):
+            return done
+            
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run interrupted mid-write can leave a partial last line
+                    continue
+                if record.get('status') == 'success':
+                    done.add(record.get('id'))
+        return done
+
+    def _delete_projects(self, projects, concurrency=1, checkpoint=None):
+        """
+        Delete projects through a bounded worker pool.
+        
+        Each result is printed with its latency as soon as it completes and,
+        when a checkpoint file is given, appended to it so an interrupted run
+        can resume.
+        
+        Args:
+            projects: List of project objects to delete
+            concurrency: Maximum number of delete requests in flight
+            checkpoint: Optional JSONL checkpoint file path
+            
+        Returns:
+            tuple: (success_count, error_count)
+        """
+        from concurrent.futures import as_completed
+        
+        def delete(project):
+            started = time.monotonic()
+            success = self._delete_single_project(project)
+            return project, success, time.monotonic() - started
+        
+        success_count = 0
+        error_count = 0
+        checkpoint_file = open(checkpoint, 'a') if checkpoint else None
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(projects)))) as executor:
+                futures = [executor.submit(delete, project) for project in projects]
+                for future in as_completed(futures):
+                    project, success, latency = future.result()
+                    status = 'success' if success else 'failed'
+                    print(f"Deleted project {project.id}: {project.project_name} -> "
+                          f"Status: {status} ({latency * 1000:.0f} ms)")
+                    if checkpoint_file:
+                        checkpoint_file.write(json.dumps({
+                            'id': project.id,
+                            'status': status,
+                            'latency_ms': round(latency * 1000)
+                        }) + '\n')
+                        checkpoint_file.flush()
+                    if success:
+                        success_count += 1
+                    else:
+                        error_count += 1
+        finally:
+            if checkpoint_file:
+                checkpoint_file.close()
+                
+        return success_count, error_count
+
     def _parse_datetime(self, dt_value: Any) -> Optional[datetime]:
         """Safely parse a datetime value that might be a string or datetime object."""
         if isinstance(dt_value, datetime):
@@ -712,192 +2156,258 @@ class CustomGPTCLI:
                     return None
         return None
 
-    def _format_project_output(self, projects, format_type='table'):
+    # Stats fields shown for each project, in display order
+    _PROJECT_STATS_FIELDS = [
+        'pages_found', 'pages_crawled', 'pages_indexed', 'total_words_indexed',
+        'total_storage_credits_used', 'crawl_credits_used', 'query_credits_used',
+        'total_queries'
+    ]
+
+    _PROJECT_CSV_HEADERS = [
+        'ID', 'Name', 'Type', 'Created At', 'Updated At', 'Is Chat Active', 
+        'Is Shared', 'Sitemap Path', 'Pages Found', 'Pages Crawled', 
+        'Pages Indexed', 'Words Indexed', 'Storage Credits Used', 
+        'Crawl Credits Used', 'Query Credits Used', 'Total Queries'
+    ]
+
+    _PROJECT_TABLE_HEADERS = [
+        'ID', 'Name', 'Created At', 'Updated At', 'Type',
+        'Pages Found', 'Pages Crawled', 'Pages Indexed',
+        'Words Indexed', 'Storage Credits', 'Crawl Credits',
+        'Query Credits', 'Total Queries'
+    ]
+
+    def _project_to_dict(self, p, stats):
+        """Build the JSON/NDJSON record for a project and its stats."""
+        project_dict = {
+            'id': p.id,
+            'project_name': p.project_name,
+            'created_at': p.created_at,
+            'updated_at': p.updated_at,
+            'type': p.type,
+            'is_chat_active': p.is_chat_active,
+            'is_shared': p.is_shared,
+            'sitemap_path': p.sitemap_path,
+            'stats': None
+        }
+        
+        if stats:
+            project_dict['stats'] = {
+                field: getattr(stats, field, 0) for field in self._PROJECT_STATS_FIELDS
+            }
+        
+        return project_dict
+
+    def _project_csv_row(self, p, stats):
+        """Build the CSV row for a project and its stats."""
+        # Format timestamps
+        created_at = p.created_at.isoformat() if isinstance(p.created_at, datetime) else p.created_at
+        updated_at = p.updated_at.isoformat() if isinstance(p.updated_at, datetime) else p.updated_at
+        
+        # Base project data
+        row = [
+            p.id,
+            p.project_name,
+            p.type,
+            created_at,
+            updated_at,
+            p.is_chat_active,
+            p.is_shared,
+            p.sitemap_path or ''
+        ]
+        
+        # Add stats data if available
+        if stats:
+            row.extend(getattr(stats, field, 0) for field in self._PROJECT_STATS_FIELDS)
+        else:
+            row.extend(['N/A'] * len(self._PROJECT_STATS_FIELDS))  # Add N/A for missing stats
+        
+        return row
+
+    def _project_table_row(self, p, stats):
+        """Build the table row for a project and its stats."""
+        if stats:
+            stats_values = [getattr(stats, field, 'N/A') for field in self._PROJECT_STATS_FIELDS]
+        else:
+            stats_values = ['N/A'] * len(self._PROJECT_STATS_FIELDS)
+        
+        return [
+            p.id, 
+            p.project_name, 
+            p.created_at, 
+            p.updated_at, 
+            p.type,
+            *stats_values
+        ]
+
+    def _format_project_output(self, projects, format_type='table', concurrency=1):
         """
         Format project data for output.
         
         Args:
             projects: List of project objects
             format_type: Output format ('table', 'json', 'csv', or 'id-only')
+            concurrency: Number of parallel stats requests
             
         Returns:
             str: Formatted output string
         """
+        if format_type == 'id-only':
+            return '\n'.join(str(p.id) for p in projects)
+        
+        all_stats = self._get_projects_stats(projects, concurrency=concurrency)
+        
         if format_type == 'json':
-            import json
-            from datetime import datetime
-            
-            class DateTimeEncoder(json.JSONEncoder):
-                def default(self, obj):
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    return super().default(obj)
-            
-            project_data = []
-            for p in projects:
-                project_dict = {
-                    'id': p.id,
-                    'project_name': p.project_name,
-                    'created_at': p.created_at,
-                    'updated_at': p.updated_at,
-                    'type': p.type,
-                    'is_chat_active': p.is_chat_active,
-                    'is_shared': p.is_shared,
-                    'sitemap_path': p.sitemap_path,
-                    'stats': None
-                }
-                
-                stats = self._get_project_stats(p.id)
-                if stats:
-                    project_dict['stats'] = {
-                        'pages_found': getattr(stats, 'pages_found', 0),
-                        'pages_crawled': getattr(stats, 'pages_crawled', 0),
-                        'pages_indexed': getattr(stats, 'pages_indexed', 0),
-                        'total_words_indexed': getattr(stats, 'total_words_indexed', 0),
-                        'total_storage_credits_used': getattr(stats, 'total_storage_credits_used', 0),
-                        'crawl_credits_used': getattr(stats, 'crawl_credits_used', 0),
-                        'query_credits_used': getattr(stats, 'query_credits_used', 0),
-                        'total_queries': getattr(stats, 'total_queries', 0)
-                    }
-                
-                project_data.append(project_dict)
-                
+            project_data = [self._project_to_dict(p, stats) for p, stats in zip(projects, all_stats)]
             return json.dumps(project_data, indent=2, cls=DateTimeEncoder)
         
-        elif format_type == 'id-only':
-            return '\n'.join(str(p.id) for p in projects)
-        
         elif format_type == 'csv':
             import csv
             from io import StringIO
-            from datetime import datetime
-            
-            # Define CSV headers including both project info and stats
-            headers = [
-                'ID', 'Name', 'Type', 'Created At', 'Updated At', 'Is Chat Active', 
-                'Is Shared', 'Sitemap Path', 'Pages Found', 'Pages Crawled', 
-                'Pages Indexed', 'Words Indexed', 'Storage Credits Used', 
-                'Crawl Credits Used', 'Query Credits Used', 'Total Queries'
-            ]
             
             # Create StringIO to write CSV data
             output = StringIO()
             writer = csv.writer(output)
-            writer.writerow(headers)
+            writer.writerow(self._PROJECT_CSV_HEADERS)
             
             # Write data rows
-            for p in projects:
-                # Get stats with retry logic
-                stats = self._get_project_stats(p.id)
-                
-                # Format timestamps
-                created_at = p.created_at.isoformat() if isinstance(p.created_at, datetime) else p.created_at
-                updated_at = p.updated_at.isoformat() if isinstance(p.updated_at, datetime) else p.updated_at
-                
-                # Base project data
-                row = [
-                    p.id,
-                    p.project_name,
-                    p.type,
-                    created_at,
-                    updated_at,
-                    p.is_chat_active,
-                    p.is_shared,
-                    p.sitemap_path or ''
-                ]
-                
-                # Add stats data if available
-                if stats:
-                    row.extend([
-                        getattr(stats, 'pages_found', 0),
-                        getattr(stats, 'pages_crawled', 0),
-                        getattr(stats, 'pages_indexed', 0),
-                        getattr(stats, 'total_words_indexed', 0),
-                        getattr(stats, 'total_storage_credits_used', 0),
-                        getattr(stats, 'crawl_credits_used', 0),
-                        getattr(stats, 'query_credits_used', 0),
-                        getattr(stats, 'total_queries', 0)
-                    ])
-                else:
-                    row.extend(['N/A'] * 8)  # Add N/A for missing stats
-                
-                writer.writerow(row)
+            for p, stats in zip(projects, all_stats):
+                writer.writerow(self._project_csv_row(p, stats))
             
             return output.getvalue()
         
         else:  # table format
             from tabulate import tabulate
-            headers = [
-                'ID', 'Name', 'Created At', 'Updated At', 'Type',
-                'Pages Found', 'Pages Crawled', 'Pages Indexed',
-                'Words Indexed', 'Storage Credits', 'Crawl Credits',
-                'Query Credits', 'Total Queries'
-            ]
-            rows = []
+            rows = [self._project_table_row(p, stats) for p, stats in zip(projects, all_stats)]
+            return tabulate(rows, headers=self._PROJECT_TABLE_HEADERS, tablefmt='grid')
+
+    def _iter_projects_with_stats(self, projects, concurrency=1):
+        """
+        Pair each project with its stats as soon as they arrive.
+        
+        Stats are fetched through a bounded worker pool and yielded in listing
+        order. Results are not kept in the stats store, so memory stays flat no
+        matter how many projects are streamed.
+        
+        Args:
+            projects: Iterable of project objects
+            concurrency: Maximum number of stats requests in flight
+            
+        Yields:
+            tuple: (project, stats) where stats may be None
+        """
+        if concurrency <= 1:
             for p in projects:
-                stats = self._get_project_stats(p.id)  # Use the retry-enabled method
-                if stats:
-                    stats_values = [
-                        getattr(stats, 'pages_found', 'N/A'),
-                        getattr(stats, 'pages_crawled', 'N/A'),
-                        getattr(stats, 'pages_indexed', 'N/A'),
-                        getattr(stats, 'total_words_indexed', 'N/A'),
-                        getattr(stats, 'total_storage_credits_used', 'N/A'),
-                        getattr(stats, 'crawl_credits_used', 'N/A'),
-                        getattr(stats, 'query_credits_used', 'N/A'),
-                        getattr(stats, 'total_queries', 'N/A')
-                    ]
-                else:
-                    stats_values = ['N/A'] * 8
-                
-                rows.append([
-                    p.id, 
-                    p.project_name, 
-                    p.created_at, 
-                    p.updated_at, 
-                    p.type,
-                    *stats_values
-                ])
-            return tabulate(rows, headers=headers, tablefmt='grid')
-
-    def _filter_projects(self, projects, name_filter=None, inactive_days=None, **stats_filters):
+                yield p, self._fetch_project_stats(p.id)
+            return
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque()
+            for p in projects:
+                pending.append((p, executor.submit(self._fetch_project_stats, p.id)))
+                if len(pending) >= concurrency:
+                    project, future = pending.popleft()
+                    yield project, future.result()
+            while pending:
+                project, future = pending.popleft()
+                yield project, future.result()
+
+    def _stream_project_output(self, projects, format_type='ndjson', concurrency=1,
+                               sample_size=50, name_filter=None, inactive_days=None,
+                               **stats_filters):
         """
-        Filter projects based on various criteria including detailed stats.
+        Filter and print projects one row at a time.
+        
+        Each row is written and flushed as soon as its stats are available, so
+        the first row appears without waiting for the whole account.
         
         Args:
-            projects: List of projects to filter
+            projects: Iterable of project objects
+            format_type: Output format ('ndjson', 'json', 'csv', 'table' or 'id-only')
+            concurrency: Number of parallel stats requests
+            sample_size: Number of rows used to size table columns
             name_filter: Regex pattern to filter project names
             inactive_days: Filter projects inactive for X days
-            **stats_filters: Stats-based filters including:
-                - min_queries/max_queries: Filter by number of queries
-                - min_pages_found/max_pages_found: Filter by pages found
-                - min_pages_crawled/max_pages_crawled: Filter by pages crawled
-                - min_pages_indexed/max_pages_indexed: Filter by pages indexed
-                - min_words_indexed/max_words_indexed: Filter by words indexed
-                - min_storage_credits/max_storage_credits: Filter by storage credits
-                - min_crawl_credits/max_crawl_credits: Filter by crawl credits
-                - min_query_credits/max_query_credits: Filter by query credits
-        
-        Returns:
-            list: Filtered list of projects
+            **stats_filters: Stats-based filters (see _filter_projects)
         """
         import re
-
-        filtered_projects = projects
-
+        
+        active_filters = {k: v for k, v in stats_filters.items() if v is not None}
+        
         if name_filter:
             pattern = re.compile(name_filter, re.IGNORECASE)
-            filtered_projects = [p for p in filtered_projects 
-                            if pattern.search(p.project_name)]
-
+            projects = (p for p in projects if pattern.search(p.project_name))
+        
         if inactive_days is not None:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=inactive_days)
-            filtered_projects = [
-                p for p in filtered_projects 
-                if (parsed_date := self._parse_datetime(p.updated_at)) is not None 
+            projects = (
+                p for p in projects
+                if (parsed_date := self._parse_datetime(p.updated_at)) is not None
                 and parsed_date < cutoff_date
-            ]
+            )
+        
+        if format_type == 'id-only' and not active_filters:
+            for p in projects:
+                sys.stdout.write(f"{p.id}\n")
+                sys.stdout.flush()
+            return
+        
+        rows = (
+            (p, stats) for p, stats in self._iter_projects_with_stats(projects, concurrency)
+            if not active_filters or (stats and self._stats_match_filters(stats, active_filters))
+        )
+        
+        if format_type == 'id-only':
+            for p, _ in rows:
+                sys.stdout.write(f"{p.id}\n")
+                sys.stdout.flush()
+        
+        elif format_type == 'ndjson':
+            for p, stats in rows:
+                sys.stdout.write(json.dumps(self._project_to_dict(p, stats), cls=DateTimeEncoder) + '\n')
+                sys.stdout.flush()
+        
+        elif format_type == 'json':
+            # Same text as the buffered json format, written one element at a time
+            import textwrap
+            
+            count = 0
+            sys.stdout.write('[')
+            for p, stats in rows:
+                element = json.dumps(self._project_to_dict(p, stats), indent=2, cls=DateTimeEncoder)
+                sys.stdout.write((',\n' if count else '\n') + textwrap.indent(element, '  '))
+                sys.stdout.flush()
+                count += 1
+            sys.stdout.write('\n]\n' if count else ']\n')
+            sys.stdout.flush()
+        
+        elif format_type == 'csv':
+            import csv
+            
+            writer = csv.writer(sys.stdout)
+            writer.writerow(self._PROJECT_CSV_HEADERS)
+            sys.stdout.flush()
+            for p, stats in rows:
+                writer.writerow(self._project_csv_row(p, stats))
+                sys.stdout.flush()
+        
+        else:  # table format
+            table = StreamingTableWriter(self._PROJECT_TABLE_HEADERS, sample_size=sample_size)
+            for p, stats in rows:
+                table.write_row(self._project_table_row(p, stats))
+            table.close()
 
+    def _stats_match_filters(self, stats, active_filters):
+        """
+        Check project stats against min/max stats filters.
+        
+        Args:
+            stats: Project stats object
+            active_filters: Stats filters with None values removed
+            
+        Returns:
+            bool: True if stats fall within every requested range
+        """
         # Stats-based filtering
         stat_field_mappings = {
             'min_queries': ('total_queries', 0, float('inf')),
@@ -917,119 +2427,103 @@ class CustomGPTCLI:
             'min_query_credits': ('query_credits_used', 0, float('inf')),
             'max_query_credits': ('query_credits_used', 0, float('inf')),
         }
-
-        # Remove None values from stats_filters
-        active_filters = {k: v for k, v in stats_filters.items() if v is not None}
         
-        if active_filters:
-            filtered_projects_with_stats = []
-            for project in filtered_projects:
-                try:
-                    stats = self._get_project_stats(project.id)
-                    if not stats:
-                        continue
-                        
-                    include_project = True
-                    
-                    # Track min and max values for each stat field
-                    stat_ranges = {}
-                    
-                    # First pass: collect min/max values for each stat field
-                    for filter_name, filter_value in active_filters.items():
-                        if filter_name not in stat_field_mappings:
-                            continue
-                            
-                        stat_field, min_default, max_default = stat_field_mappings[filter_name]
-                        stat_value = getattr(stats, stat_field, None)
-                        
-                        if stat_value is None:
-                            include_project = False
-                            break
-                            
-                        # Initialize or update stat ranges
-                        if stat_field not in stat_ranges:
-                            stat_ranges[stat_field] = {
-                                'min': min_default,
-                                'max': max_default,
-                                'value': stat_value
-                            }
-                        
-                        # Update min/max bounds based on filters
-                        if filter_name.startswith('min_'):
-                            stat_ranges[stat_field]['min'] = max(stat_ranges[stat_field]['min'], filter_value)
-                        elif filter_name.startswith('max_'):
-                            stat_ranges[stat_field]['max'] = min(stat_ranges[stat_field]['max'], filter_value)
-                    
-                    # Second pass: check if value is within min/max range for each stat
-                    for stat_field, ranges in stat_ranges.items():
-                        if not (ranges['min'] <= ranges['value'] <= ranges['max']):
-                            include_project = False
-                            break
-                    
-                    if include_project:
-                        filtered_projects_with_stats.append(project)
-                except Exception as e:
-                    logger.warning(f"Could not get stats for project {project.id}: {e}")
+        # Track min and max values for each stat field
+        stat_ranges = {}
+        
+        # First pass: collect min/max values for each stat field
+        for filter_name, filter_value in active_filters.items():
+            if filter_name not in stat_field_mappings:
+                continue
+                
+            stat_field, min_default, max_default = stat_field_mappings[filter_name]
+            stat_value = getattr(stats, stat_field, None)
             
-            filtered_projects = filtered_projects_with_stats
-
-        return filtered_projects
+            if stat_value is None:
+                return False
+                
+            # Initialize or update stat ranges
+            if stat_field not in stat_ranges:
+                stat_ranges[stat_field] = {
+                    'min': min_default,
+                    'max': max_default,
+                    'value': stat_value
+                }
+            
+            # Update min/max bounds based on filters
+            if filter_name.startswith('min_'):
+                stat_ranges[stat_field]['min'] = max(stat_ranges[stat_field]['min'], filter_value)
+            elif filter_name.startswith('max_'):
+                stat_ranges[stat_field]['max'] = min(stat_ranges[stat_field]['max'], filter_value)
+        
+        # Second pass: check if value is within min/max range for each stat
+        for stat_field, ranges in stat_ranges.items():
+            if not (ranges['min'] <= ranges['value'] <= ranges['max']):
+                return False
+        
+        return True
 
-    def _delete_single_project(self, project, max_retries=3):
+    def _filter_projects(self, projects, name_filter=None, inactive_days=None, concurrency=1, **stats_filters):
         """
-        Delete a single project with retry logic for rate limiting.
+        Filter projects based on various criteria including detailed stats.
         
         Args:
-            project: Project object containing id and project_name
-            max_retries: Maximum number of retries for rate-limited requests
-            
+            projects: List of projects to filter
+            name_filter: Regex pattern to filter project names
+            inactive_days: Filter projects inactive for X days
+            concurrency: Number of parallel stats requests
+            **stats_filters: Stats-based filters including:
+                - min_queries/max_queries: Filter by number of queries
+                - min_pages_found/max_pages_found: Filter by pages found
+                - min_pages_crawled/max_pages_crawled: Filter by pages crawled
+                - min_pages_indexed/max_pages_indexed: Filter by pages indexed
+                - min_words_indexed/max_words_indexed: Filter by words indexed
+                - min_storage_credits/max_storage_credits: Filter by storage credits
+                - min_crawl_credits/max_crawl_credits: Filter by crawl credits
+                - min_query_credits/max_query_credits: Filter by query credits
+        
         Returns:
-            bool: True if deletion was successful, False otherwise
+            list: Filtered list of projects
         """
-        retry_count = 0
-        while retry_count <= max_retries:
-            try:
-                response = CustomGPT.Project.delete(project_id=project.id)
-                
-                # Log the response
-                logger.debug(f"Delete response for project {project.id}:")
-                logger.debug(f"Response status code: {response.status_code}")
-                logger.debug(f"Response headers: {response.headers}")
-                logger.debug(f"Response parsed: {response.parsed}")
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 30))
-                    remaining = response.headers.get('X-RateLimit-Remaining', 'unknown')
-                    reset_time = response.headers.get('X-RateLimit-Reset', 'unknown')
-                    
-                    logger.warning(f"Rate limited when deleting project {project.id}. "
-                                f"Remaining requests: {remaining}, "
-                                f"Reset time: {reset_time}, "
-                                f"Retry after: {retry_after}s")
-                    
-                    if retry_count < max_retries:
-                        logger.warning(f"Rate limited, waiting {retry_after} seconds before retry...")
-                        time.sleep(retry_after)
-                        retry_count += 1
+        import re
+
+        filtered_projects = projects
+
+        if name_filter:
+            pattern = re.compile(name_filter, re.IGNORECASE)
+            filtered_projects = [p for p in filtered_projects 
+                            if pattern.search(p.project_name)]
+
+        if inactive_days is not None:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=inactive_days)
+            filtered_projects = [
+                p for p in filtered_projects 
+                if (parsed_date := self._parse_datetime(p.updated_at)) is not None 
+                and parsed_date < cutoff_date
+            ]
+
+        # Remove None values from stats_filters
+        active_filters = {k: v for k, v in stats_filters.items() if v is not None}
+        
+        if active_filters:
+            # Fill the stats store up front; formatting reuses the same results
+            self._get_projects_stats(filtered_projects, concurrency=concurrency)
+            
+            filtered_projects_with_stats = []
+            for project in filtered_projects:
+                try:
+                    stats = self._get_project_stats(project.id)
+                    if not stats:
                         continue
-                    return False
-                
-                # Get deletion status
-                deleted_status = (response.parsed and 
-                                hasattr(response.parsed, 'data') and 
-                                response.parsed.data and 
-                                hasattr(response.parsed.data, 'deleted') and 
-                                response.parsed.data.deleted)
-                
-                if not deleted_status:
-                    logger.warning(f"Failed to delete project {project.id}. Response: {response}")
-                
-                return deleted_status
+                    
+                    if self._stats_match_filters(stats, active_filters):
+                        filtered_projects_with_stats.append(project)
+                except Exception as e:
+                    logger.warning(f"Could not get stats for project {project.id}: {e}")
+            
+            filtered_projects = filtered_projects_with_stats
 
-            except Exception as e:
-                logger.error(f"Exception deleting project {project.id}: {str(e)}", exc_info=True)
-                return False
+        return filtered_projects
 
     def _handle_create_project(self, args):
         """
@@ -1071,9 +2565,9 @@ class CustomGPTCLI:
                         print(f"Error: Not a file: {args.file}")
                         sys.exit(1)
                         
-                    with open(file_path, 'rb') as f:
-                        file_content = f.read()
-                    create_args['file'] = File(payload=file_content, file_name=str(file_path.name))
+                    # Streamed from disk by the HTTP transport; closed after the API call
+                    upload = open(file_path, 'rb')
+                    create_args['file'] = File(payload=upload, file_name=str(file_path.name))
                     logger.debug(f"Creating project with file: {file_path.name}")
                     
                 except Exception as e:
@@ -1082,7 +2576,11 @@ class CustomGPTCLI:
                     sys.exit(1)
             
             # Make API call with retry logic
-            result = self._make_api_call(CustomGPT.Project.create, **create_args)
+            try:
+                result = self._make_api_call(CustomGPT.Project.create, **create_args)
+            finally:
+                if 'file' in create_args:
+                    create_args['file'].payload.close()
             
             if not result or not hasattr(result, 'parsed'):
                 print("Error: Failed to create project - invalid API response")
@@ -1290,6 +2788,18 @@ class CustomGPTCLI:
             print(f"Error: {str(e)}")
             sys.exit(1)
     
+    def _get_stats_filters(self, args):
+        """Collect the --min-*/--max-* stats filters of list-projects into a dict."""
+        filter_names = [
+            'queries', 'pages_found', 'pages_crawled', 'pages_indexed',
+            'words_indexed', 'storage_credits', 'crawl_credits', 'query_credits'
+        ]
+        return {
+            f"{bound}_{name}": getattr(args, f"{bound}_{name}", None)
+            for name in filter_names
+            for bound in ('min', 'max')
+        }
+    
     def _handle_project_commands(self, args):
         """Handle all project-related commands."""
         if args.command == 'create-project':
@@ -1297,7 +2807,29 @@ class CustomGPTCLI:
         elif args.command == 'show-project':
             self._handle_show_project(args)             
         elif args.command == 'list-projects':
-            all_projects = self._get_all_projects()
+            stats_filters = self._get_stats_filters(args)
+            
+            if args.from_mirror:
+                self._list_projects_from_mirror(args, stats_filters)
+                return
+            
+            if args.stream or args.format == 'ndjson':
+                self._stream_project_output(
+                    self._iter_paginated(
+                        CustomGPT.Project.list,
+                        lambda response: response.parsed.data,
+                        concurrency=args.concurrency
+                    ),
+                    format_type=args.format,
+                    concurrency=args.concurrency,
+                    sample_size=args.sample_size,
+                    name_filter=args.name_filter,
+                    inactive_days=args.inactive_days,
+                    **stats_filters
+                )
+                return
+            
+            all_projects = self._get_all_projects(concurrency=args.concurrency)
             
             if not all_projects:
                 print("No projects found or unable to retrieve projects")
@@ -1308,21 +2840,16 @@ class CustomGPTCLI:
                     all_projects,
                     name_filter=args.name_filter,
                     inactive_days=args.inactive_days,
-                    min_queries=args.min_queries,
-                    max_queries=args.max_queries,
-                    min_pages_found=args.min_pages_found,
-                    min_pages_crawled=args.min_pages_crawled,
-                    min_pages_indexed=args.min_pages_indexed,
-                    min_words_indexed=args.min_words_indexed,
-                    min_storage_credits=args.min_storage_credits,
-                    min_crawl_credits=args.min_crawl_credits,
-                    min_query_credits=args.min_query_credits
+                    concurrency=args.concurrency,
+                    **stats_filters
                 )
-                print(self._format_project_output(filtered_projects, args.format))
+                print(self._format_project_output(filtered_projects, args.format,
+                                                  concurrency=args.concurrency))
             except Exception as e:
                 logger.warning(f"Error processing projects: {str(e)}")
                 print("Error processing projects - displaying unfiltered results:")
-                print(self._format_project_output(all_projects, args.format))
+                print(self._format_project_output(all_projects, args.format,
+                                                  concurrency=args.concurrency))
                 
         elif args.command == 'update-project':
             self._handle_update_project(args)
@@ -1387,30 +2914,39 @@ class CustomGPTCLI:
 
         elif args.command == 'delete-projects':
             # Get projects to delete
-            projects_to_delete = []
-            
-            if args.project_ids:
-                project_ids = [int(id.strip()) for id in args.project_ids.split(',')]
-                all_projects = self._get_all_projects()
-                projects_to_delete = [p for p in all_projects if p.id in project_ids]
-                
-                # Log which IDs were not found
-                found_ids = {p.id for p in projects_to_delete}
-                not_found_ids = set(project_ids) - found_ids
-                if not_found_ids:
-                    print(f"Warning: Could not find projects with IDs: {', '.join(str(id) for id in not_found_ids)}")
-            
-            else:
+            if not args.project_ids:
                 print("Error: Must provide --project-ids")
                 return
+                
+            project_ids = [int(id.strip()) for id in args.project_ids.split(',') if id.strip()]
+            
+            # Skip projects a previous run already deleted
+            already_deleted = self._read_checkpoint(args.checkpoint)
+            skipped_ids = [id for id in project_ids if id in already_deleted]
+            if skipped_ids:
+                print(f"Skipping {len(skipped_ids)} projects already deleted according to {args.checkpoint}")
+            project_ids = [id for id in project_ids if id not in already_deleted]
+            
+            found = self._get_projects_by_id(project_ids, concurrency=args.concurrency)
+            projects_to_delete = [p for p in found if p is not None]
+            
+            # Log which IDs were not found
+            not_found_ids = [id for id, p in zip(project_ids, found) if p is None]
+            if not_found_ids:
+                print(f"Warning: Could not find projects with IDs: {', '.join(str(id) for id in not_found_ids)}")
 
             if not projects_to_delete:
                 print("No projects found matching the criteria")
                 return
 
             # Show what will be deleted
+            from tabulate import tabulate
             print("\nProjects that will be deleted:")
-            print(self._format_project_output(projects_to_delete))
+            print(tabulate(
+                [[p.id, p.project_name, p.created_at, p.updated_at] for p in projects_to_delete],
+                headers=['ID', 'Name', 'Created At', 'Updated At'],
+                tablefmt='grid'
+            ))
             
             if args.dry_run:
                 return
@@ -1423,18 +2959,688 @@ class CustomGPTCLI:
                     return
 
             # Perform deletion
-            success_count = 0
-            error_count = 0
-            
-            for project in projects_to_delete:
-                success = self._delete_single_project(project)
-                print(f"Deleted project {project.id}: {project.project_name} -> Status: {'success' if success else 'failed'}")
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
+            started = time.monotonic()
+            success_count, error_count = self._delete_projects(
+                projects_to_delete,
+                concurrency=args.concurrency,
+                checkpoint=args.checkpoint
+            )
 
-            print(f"\nDeletion complete: {success_count} succeeded, {error_count} failed")
+            print(f"\nDeletion complete: {success_count} succeeded, {error_count} failed "
+                  f"in {time.monotonic() - started:.1f}s")
+
+    def _iter_stream_events(self, result):
+        """
+        Yield server-sent events from a streaming send as soon as they arrive.
+        
+        Iterating a requests response directly reads fixed 128-byte blocks, which
+        holds back short events until more data arrives. The underlying response
+        is re-read with chunk_size=None so each network chunk is parsed as it
+        is received.
+        """
+        source = getattr(result, '_event_source', None)
+        if hasattr(source, 'iter_content'):
+            from sseclient import SSEClient
+            result = SSEClient(source.iter_content(chunk_size=None))
+        yield from result.events()
+
+    def _stream_message(self, api_args, on_event=None):
+        """
+        Send a message with streaming enabled and time the response.
+        
+        Args:
+            api_args: Arguments from _build_send_args (stream is forced on)
+            on_event: Optional callback(data, message) called for every event,
+                where message is the text of a progress chunk or None
+                
+        Returns:
+            tuple: (status_code, timings) - status_code is None if no streaming
+            response was received
+        """
+        timings = StreamTimings(started=time.monotonic())
+        result = CustomGPT.Conversation.send(**{**api_args, 'stream': True})
+        timings.mark_connected()
+        if not result or not hasattr(result, 'events'):
+            return None, timings
+            
+        status_code = getattr(getattr(result, '_event_source', None), 'status_code', 200)
+        for event in self._iter_stream_events(result):
+            if not hasattr(event, 'data'):
+                continue
+            try:
+                event_data = json.loads(event.data)
+            except json.JSONDecodeError:
+                event_data = {}
+            message = None
+            if (isinstance(event_data, dict) and event_data.get('status') == 'progress'
+                    and 'message' in event_data):
+                message = event_data['message']
+                timings.mark_chunk()
+            if on_event:
+                on_event(event.data, message)
+        timings.mark_finished()
+        return int(status_code), timings
+
+    def _print_timings(self, summary, format_type='table'):
+        """Print a StreamTimings summary to stderr, keeping stdout for the answer."""
+        if format_type == 'json':
+            print(json.dumps({'timings': summary}), file=sys.stderr)
+            return
+            
+        def fmt(value, unit=' ms'):
+            return 'N/A' if value is None else f"{value}{unit}"
+        
+        print("Timings:", file=sys.stderr)
+        print(f"  Connect (headers received): {fmt(summary['connect_ms'])}", file=sys.stderr)
+        print(f"  Time to First Token: {fmt(summary['ttft_ms'])}", file=sys.stderr)
+        print(f"  Inter-chunk Gap p50/p90/p99: {fmt(summary['gap_p50_ms'], '')} / "
+              f"{fmt(summary['gap_p90_ms'], '')} / {fmt(summary['gap_p99_ms'])}", file=sys.stderr)
+        print(f"  Total Duration: {fmt(summary['total_ms'])}", file=sys.stderr)
+        print(f"  Chunks: {summary['chunks']} ({fmt(summary['chunks_per_sec'], '/s')})", file=sys.stderr)
+
+    def _build_send_args(self, project_id, session_id, prompt, stream=False,
+                         persona=None, model=None, response_source=None):
+        """Build the CustomGPT.Conversation.send arguments shared by all send commands."""
+        api_args = {
+            'project_id': project_id,
+            'session_id': session_id,
+            'prompt': prompt,
+            'stream': stream
+        }
+        
+        # Add optional parameters if provided
+        if persona:
+            api_args['custom_persona'] = persona
+        if model:
+            api_args['chatbot_model'] = model
+        if response_source:
+            api_args['response_source'] = response_source
+            
+        return api_args
+
+    def _create_conversation(self, project_id, name):
+        """Create a conversation and return its session ID, or None on failure."""
+        result = self._make_api_call(
+            CustomGPT.Conversation.create,
+            project_id=project_id,
+            name=name
+        )
+        
+        if not result or result.status_code >= 400:
+            return None
+            
+        try:
+            return json.loads(result.content)['data']['session_id']
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def _send_batch_item(self, index, line, conversation_name):
+        """
+        Run one batch-send input line and build its output record.
+        
+        Args:
+            index: 0-based line index in the input
+            line: Raw JSONL input line
+            conversation_name: Name for conversations created on demand
+            
+        Returns:
+            dict: Output record with the original line index attached
+        """
+        started = time.monotonic()
+        record = {'index': index, 'status': 'failed'}
+        
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            record['error'] = f"Invalid JSON: {str(e)}"
+            return record
+            
+        if not isinstance(item, dict) or not item.get('project_id') or not item.get('prompt'):
+            record['error'] = "Each line must be an object with project_id and prompt"
+            return record
+            
+        record['project_id'] = item['project_id']
+        session_id = item.get('session_id')
+        if not session_id:
+            session_id = self._create_conversation(item['project_id'], conversation_name)
+            if not session_id:
+                record['error'] = "Failed to create conversation"
+                return record
+        record['session_id'] = session_id
+        
+        result = self._make_api_call(
+            CustomGPT.Conversation.send,
+            **self._build_send_args(
+                project_id=item['project_id'],
+                session_id=session_id,
+                prompt=item['prompt'],
+                persona=item.get('persona'),
+                model=item.get('model'),
+                response_source=item.get('response_source')
+            )
+        )
+        record['latency_ms'] = round((time.monotonic() - started) * 1000)
+        
+        if not result:
+            record['error'] = "Failed to send message"
+            return record
+            
+        try:
+            response_data = json.loads(result.content)
+        except json.JSONDecodeError:
+            record['error'] = "Invalid JSON response from API"
+            return record
+            
+        if result.status_code >= 400:
+            record['status_code'] = int(result.status_code)
+            error_data = response_data.get('data') if isinstance(response_data.get('data'), dict) else {}
+            record['error'] = error_data.get('message') or response_data.get('message', 'Unknown error')
+            return record
+            
+        data = response_data.get('data') or {}
+        record['status'] = 'success'
+        record['prompt_id'] = data.get('id')
+        record['response'] = data.get('openai_response')
+        return record
+
+    def _handle_batch_send(self, args):
+        """
+        Handle the batch-send command.
+        
+        Input lines are read lazily and run through a bounded worker pool;
+        each result is written as a JSONL record as soon as it completes.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        
+        try:
+            input_file = sys.stdin if args.input == '-' else open(args.input, 'r')
+        except OSError as e:
+            print(f"Error: Cannot read input file {args.input}: {e}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            output_file = sys.stdout if args.output == '-' else open(args.output, 'w')
+        except OSError as e:
+            if input_file is not sys.stdin:
+                input_file.close()
+            print(f"Error: Cannot write output file {args.output}: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        counts = {'success': 0, 'failed': 0}
+        started = time.monotonic()
+        
+        def send(index, line):
+            # One bad line or response must not abort the rest of the batch
+            try:
+                return self._send_batch_item(index, line, args.conversation_name)
+            except Exception as e:
+                logger.debug(f"Batch line {index} failed", exc_info=True)
+                return {'index': index, 'status': 'failed', 'error': f"Unexpected error: {e}"}
+        
+        def emit(futures):
+            for future in futures:
+                record = future.result()
+                counts[record['status']] += 1
+                output_file.write(json.dumps(record) + '\n')
+                output_file.flush()
+        
+        concurrency = max(1, args.concurrency)
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending = set()
+                for index, line in enumerate(input_file):
+                    if not line.strip():
+                        continue
+                    if len(pending) >= concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        emit(done)
+                    pending.add(executor.submit(send, index, line))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    emit(done)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+            if output_file is not sys.stdout:
+                output_file.close()
+                
+        print(f"Batch complete: {counts['success']} succeeded, {counts['failed']} failed "
+              f"in {time.monotonic() - started:.1f}s", file=sys.stderr)
+
+    def _json_paginator(self, *keys, failures=None):
+        """
+        Build a get_paginator for _iter_paginated that reads the raw JSON body.
+        
+        Args:
+            *keys: Path to the paginator below the response's data object
+                (e.g., 'messages' for the conversation messages endpoint)
+            failures: Optional list that gets an entry for every page that
+                could not be fetched or parsed
+        """
+        from types import SimpleNamespace
+        
+        def get_paginator(response):
+            try:
+                paginator = json.loads(response.content)['data']
+                for key in keys:
+                    paginator = paginator[key]
+                if response.status_code < 400 and isinstance(paginator.get('data'), list):
+                    return SimpleNamespace(**paginator)
+            except (AttributeError, ValueError, KeyError, TypeError):
+                pass
+            if failures is not None:
+                failures.append(response)
+            return None
+        return get_paginator
+    
+    def _export_conversation(self, project_id, conversation):
+        """
+        Fetch all messages of a conversation, oldest first.
+        
+        Returns:
+            dict: Export record with the conversation and its messages, or an
+                error instead of messages if a page could not be fetched
+        """
+        failures = []
+        messages = list(self._iter_paginated(
+            CustomGPT.Conversation.messages,
+            self._json_paginator('messages', failures=failures),
+            project_id=project_id,
+            session_id=conversation.get('session_id'),
+            order='asc'
+        ))
+        if failures:
+            return {'conversation': conversation, 'error': 'Failed to fetch messages'}
+        return {'conversation': conversation, 'messages': messages}
+
+    def _handle_export_conversations(self, args):
+        """
+        Handle the export-conversations command.
+        
+        Conversations are listed page by page while their messages are fetched
+        through a bounded worker pool. Records are written in listing order as
+        they complete, so memory use is bounded by the concurrency rather than
+        the size of the project.
+        """
+        import gzip
+        
+        try:
+            if args.output == '-':
+                output_file = sys.stdout
+            elif args.output.endswith('.gz'):
+                output_file = gzip.open(args.output, 'wt', encoding='utf-8')
+            else:
+                output_file = open(args.output, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"Error: Cannot write output file {args.output}: {e}", file=sys.stderr)
+            sys.exit(1)
+            
+        counts = {'conversations': 0, 'messages': 0, 'failed': 0}
+        started = time.monotonic()
+        
+        def emit(future):
+            record = future.result()
+            if 'error' in record:
+                counts['failed'] += 1
+                logger.error(f"Failed to export conversation {record['conversation'].get('session_id')}")
+            else:
+                counts['conversations'] += 1
+                counts['messages'] += len(record['messages'])
+            output_file.write(json.dumps(record) + '\n')
+        
+        concurrency = max(1, args.concurrency)
+        listing_failures = []
+        conversations = self._iter_paginated(
+            CustomGPT.Conversation.get,
+            self._json_paginator(failures=listing_failures),
+            project_id=args.project_id,
+            order=args.order,
+            order_by=args.order_by,
+            user_filter=args.user_filter
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending = deque()
+                for conversation in conversations:
+                    if len(pending) >= concurrency * 2:
+                        emit(pending.popleft())
+                    pending.append(executor.submit(self._export_conversation, args.project_id, conversation))
+                while pending:
+                    emit(pending.popleft())
+        finally:
+            if output_file is not sys.stdout:
+                output_file.close()
+                
+        elapsed = time.monotonic() - started
+        rate = counts['conversations'] / elapsed if elapsed > 0 else 0
+        print(f"Exported {counts['conversations']} conversations ({counts['messages']} messages) in {elapsed:.1f}s "
+              f"({rate:.1f} conversations/s), {counts['failed']} failed", file=sys.stderr)
+        if listing_failures:
+            print(f"Error: {len(listing_failures)} pages of the conversation list could not be fetched; "
+                  f"the export is incomplete", file=sys.stderr)
+        if counts['failed'] or listing_failures:
+            sys.exit(1)
+
+    def _fetch_new_messages(self, project_id, session_id, after_id):
+        """
+        Fetch the messages of a conversation with an ID above after_id.
+        
+        Pages are read newest first and reading stops at the first message
+        already seen, so a quiet conversation costs a single request.
+        
+        Returns:
+            Optional[list]: New messages, oldest first, or None if a page failed
+        """
+        failures = []
+        messages = []
+        for message in self._iter_paginated(
+            CustomGPT.Conversation.messages,
+            self._json_paginator('messages', failures=failures),
+            project_id=project_id,
+            session_id=session_id,
+            order='desc'
+        ):
+            if message.get('id', 0) <= after_id:
+                break
+            messages.append(message)
+        if failures:
+            return None
+        messages.reverse()
+        return messages
+
+    def _handle_changes(self, args):
+        """
+        Handle the changes command.
+        
+        New conversations are found by listing conversations newest first and
+        stopping at the last conversation ID seen. Follow-up messages in older
+        conversations are found by checking the next --rescan-recent
+        conversations for an updated_at past the saved mark.
+        
+        Message marks are kept per conversation: a single run-wide mark would
+        skip a follow-up that lands in an already-listed conversation while a
+        later conversation is fetched with a higher message ID.
+        """
+        state_path = args.state or os.path.join(os.path.expanduser('~'), '.customgpt-cli',
+                                                f'changes-{args.project_id}.json')
+        state = {}
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, 'r') as f:
+                    state = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error: Cannot read state file {state_path}: {e}", file=sys.stderr)
+                sys.exit(1)
+        conversation_mark = state.get('conversation_id', 0)
+        message_marks = state.get('message_ids', {})
+        legacy_message_mark = state.get('message_id', 0)  # state files written before per-conversation marks
+        updated_mark = state.get('updated_at') or ''
+        
+        failures = []
+        to_fetch = []  # (conversation, is_new, after_id), newest first
+        seen_sessions = []
+        rescanned = 0
+        new_updated_mark = updated_mark
+        for conversation in self._iter_paginated(
+            CustomGPT.Conversation.get,
+            self._json_paginator(failures=failures),
+            project_id=args.project_id,
+            order='desc',
+            order_by='id'
+        ):
+            updated_at = conversation.get('updated_at') or ''
+            session_id = conversation.get('session_id')
+            if conversation.get('id', 0) > conversation_mark:
+                to_fetch.append((conversation, True, 0))
+            elif rescanned >= args.rescan_recent:
+                break
+            else:
+                rescanned += 1
+                if updated_at > updated_mark:
+                    to_fetch.append((conversation, False, message_marks.get(session_id, legacy_message_mark)))
+            seen_sessions.append(session_id)
+            new_updated_mark = max(new_updated_mark, updated_at)
+        to_fetch.reverse()
+        
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'a')
+        counts = {'conversation': 0, 'message': 0}
+        new_conversation_mark = conversation_mark
+        new_message_marks = {}
+        
+        def emit(conversation, is_new, after_id, future):
+            nonlocal new_conversation_mark
+            messages = future.result()
+            if messages is None:
+                failures.append(conversation)
+                logger.error(f"Failed to fetch messages of conversation {conversation.get('session_id')}")
+                return
+            records = [{'type': 'conversation', 'project_id': args.project_id, 'data': conversation}] if is_new else []
+            records += [{'type': 'message', 'project_id': args.project_id,
+                         'session_id': conversation.get('session_id'), 'data': message} for message in messages]
+            for record in records:
+                output_file.write(json.dumps(record) + '\n')
+                counts[record['type']] += 1
+            new_conversation_mark = max(new_conversation_mark, conversation.get('id', 0))
+            new_message_marks[conversation.get('session_id')] = max(
+                [after_id] + [message.get('id', 0) for message in messages])
+        
+        concurrency = max(1, args.concurrency)
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending = deque()
+                for conversation, is_new, after_id in to_fetch:
+                    if len(pending) >= concurrency * 2:
+                        emit(*pending.popleft())
+                    pending.append((conversation, is_new, after_id, executor.submit(
+                        self._fetch_new_messages, args.project_id, conversation.get('session_id'), after_id)))
+                while pending:
+                    emit(*pending.popleft())
+            output_file.flush()
+        finally:
+            if output_file is not sys.stdout:
+                output_file.close()
+        
+        print(f"{counts['conversation']} new conversations, {counts['message']} new messages", file=sys.stderr)
+        if failures:
+            print("Error: Some records could not be fetched; the high-water mark was not advanced", file=sys.stderr)
+            sys.exit(1)
+            
+        # Only conversations inside the listing window can be fetched again
+        marks = {session_id: new_message_marks.get(session_id, message_marks.get(session_id, legacy_message_mark))
+                 for session_id in seen_sessions}
+        os.makedirs(os.path.dirname(os.path.abspath(state_path)), exist_ok=True)
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'project_id': args.project_id, 'conversation_id': new_conversation_mark,
+                       'message_ids': marks, 'updated_at': new_updated_mark}, f)
+        os.replace(tmp_path, state_path)
+
+    def _bench_send(self, api_args, stream=False, scheduled=None):
+        """
+        Send one benchmark message and measure it.
+        
+        Requests bypass the shared rate limiter and are not retried, so 429s
+        show up in the results. When a scheduled start time is given (open
+        loop), latency is measured from it rather than from when a worker
+        picked the request up, so queueing delay is not left out.
+        
+        Returns:
+            dict: latency (s), ttft (s or None), status_code (or None) and error
+        """
+        started = time.monotonic() if scheduled is None else scheduled
+        try:
+            if stream:
+                status_code, timings = self._stream_message(api_args)
+                ttft = timings.chunk_times[0] - started if timings.chunk_times else None
+            else:
+                result = CustomGPT.Conversation.send(**api_args)
+                status_code = int(result.status_code) if result else None
+                ttft = None
+        except Exception as e:
+            return {'latency': time.monotonic() - started, 'ttft': None,
+                    'status_code': None, 'error': str(e)}
+            
+        error = None
+        if status_code is None:
+            error = 'No response received'
+        elif status_code >= 400:
+            error = f"HTTP {status_code}"
+        return {'latency': time.monotonic() - started, 'ttft': ttft,
+                'status_code': status_code, 'error': error}
+
+    def _summarize_bench(self, results, elapsed):
+        """Aggregate bench-chat results into latency percentiles and rates."""
+        def ms(seconds):
+            return round(seconds * 1000, 1) if seconds is not None else None
+        
+        total = len(results)
+        ok = [r for r in results if r['error'] is None]
+        rate_limited = sum(1 for r in results if r['status_code'] == 429)
+        missed = sum(1 for r in results if r.get('missed'))
+        latencies = [r['latency'] for r in ok]
+        ttfts = [r['ttft'] for r in ok if r['ttft'] is not None]
+        return {
+            'requests': total,
+            'succeeded': len(ok),
+            'errors': total - len(ok),
+            'rate_limited': rate_limited,
+            'missed': missed,
+            'error_rate': round((total - len(ok)) / total, 4) if total else 0,
+            'rate_limited_rate': round(rate_limited / total, 4) if total else 0,
+            'duration_s': round(elapsed, 2),
+            'throughput_rps': round(total / elapsed, 2) if elapsed > 0 else None,
+            'latency_ms': {
+                'p50': ms(percentile(latencies, 50)),
+                'p90': ms(percentile(latencies, 90)),
+                'p99': ms(percentile(latencies, 99)),
+                'max': ms(max(latencies)) if latencies else None
+            },
+            'ttft_ms': {
+                'p50': ms(percentile(ttfts, 50)),
+                'p90': ms(percentile(ttfts, 90)),
+                'p99': ms(percentile(ttfts, 99)),
+                'max': ms(max(ttfts)) if ttfts else None
+            }
+        }
+
+    @staticmethod
+    def _bench_concurrency(args):
+        """Requests bench-chat keeps in flight; the HTTP pool is sized from it too."""
+        return args.concurrency or (32 if args.rate else 1)
+    
+    def _handle_bench_chat(self, args):
+        """
+        Handle the bench-chat command.
+        
+        Without --rate, --concurrency workers send back to back (closed loop).
+        With --rate, requests are started on a fixed schedule (open loop) and
+        --concurrency only caps how many may be in flight.
+        """
+        if args.prompts_file:
+            try:
+                with open(args.prompts_file, 'r') as f:
+                    prompts = [line.strip() for line in f if line.strip()]
+            except OSError as e:
+                print(f"Error: Cannot read prompts file {args.prompts_file}: {e}", file=sys.stderr)
+                sys.exit(1)
+            if not prompts:
+                print(f"Error: No prompts found in {args.prompts_file}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            prompts = [args.prompt]
+            
+        max_requests = args.requests
+        if max_requests is None and args.duration is None:
+            max_requests = 10
+        concurrency = self._bench_concurrency(args)
+        
+        # Each worker thread sends to its own conversation unless one was given
+        sessions = threading.local()
+        def get_session_id():
+            if args.session_id:
+                return args.session_id
+            if not hasattr(sessions, 'session_id'):
+                sessions.session_id = self._create_conversation(args.project_id, 'bench-chat')
+            return sessions.session_id
+        
+        lock = threading.Lock()
+        counter = {'issued': 0}
+        results = []
+        
+        def claim():
+            """Reserve the next request slot, or return None when the run is over."""
+            with lock:
+                if max_requests is not None and counter['issued'] >= max_requests:
+                    return None
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+                counter['issued'] += 1
+                return counter['issued'] - 1
+        
+        def run_one(index, scheduled=None):
+            if scheduled is not None and deadline is not None and time.monotonic() >= deadline:
+                # Still queued when the run ended: count it instead of sending it late
+                result = {'latency': time.monotonic() - scheduled, 'ttft': None, 'status_code': None,
+                          'error': 'Not started before the end of the run', 'missed': True}
+                with lock:
+                    results.append(result)
+                return
+            session_id = get_session_id()
+            if not session_id:
+                result = {'latency': 0.0, 'ttft': None, 'status_code': None,
+                          'error': 'Failed to create conversation'}
+            else:
+                api_args = self._build_send_args(
+                    project_id=args.project_id,
+                    session_id=session_id,
+                    prompt=prompts[index % len(prompts)],
+                    stream=args.stream,
+                    persona=args.persona,
+                    model=args.model,
+                    response_source=args.response_source
+                )
+                result = self._bench_send(api_args, stream=args.stream, scheduled=scheduled)
+            with lock:
+                results.append(result)
+        
+        def worker():
+            while (index := claim()) is not None:
+                run_one(index)
+        
+        started = time.monotonic()
+        deadline = started + args.duration if args.duration is not None else None
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if args.rate:
+                interval = 1.0 / args.rate
+                next_start = started
+                while (index := claim()) is not None:
+                    executor.submit(run_one, index, next_start)
+                    next_start += interval
+                    delay = next_start - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+            else:
+                for _ in range(concurrency):
+                    executor.submit(worker)
+        elapsed = time.monotonic() - started
+        
+        summary = self._summarize_bench(results, elapsed)
+        if args.format == 'json':
+            print(json.dumps(summary, indent=2))
+            return
+            
+        from tabulate import tabulate
+        print("Benchmark Results:")
+        print(f"  Requests: {summary['requests']} ({summary['succeeded']} succeeded, "
+              f"{summary['errors']} failed, {summary['rate_limited']} rate limited, {summary['missed']} missed)")
+        print(f"  Duration: {summary['duration_s']}s")
+        print(f"  Throughput: {summary['throughput_rps']} req/s")
+        print(f"  Error Rate: {summary['error_rate'] * 100:.1f}%")
+        print(f"  429 Rate: {summary['rate_limited_rate'] * 100:.1f}%")
+        print()
+        rows = [['Latency (ms)', *summary['latency_ms'].values()]]
+        if args.stream:
+            rows.append(['Time to First Token (ms)', *summary['ttft_ms'].values()])
+        print(tabulate(rows, headers=['Metric', 'p50', 'p90', 'p99', 'max'], tablefmt='grid', missingval='N/A'))
 
     def _handle_conversation_commands(self, args):
         """Handle all conversation-related commands."""
@@ -1509,59 +3715,46 @@ class CustomGPTCLI:
                 sys.exit(1)
                 
         elif args.command == 'send-message':
-            api_args = {
-                'project_id': args.project_id,
-                'session_id': args.session_id,
-                'prompt': args.prompt,
-                'stream': args.stream
-            }
-            
-            # Add optional parameters if provided
-            if hasattr(args, 'persona') and args.persona:
-                api_args['custom_persona'] = args.persona
-            if hasattr(args, 'model') and args.model:
-                api_args['chatbot_model'] = args.model
-            if hasattr(args, 'response_source') and args.response_source:
-                api_args['response_source'] = args.response_source
+            api_args = self._build_send_args(
+                project_id=args.project_id,
+                session_id=args.session_id,
+                prompt=args.prompt,
+                stream=args.stream,
+                persona=getattr(args, 'persona', None),
+                model=getattr(args, 'model', None),
+                response_source=getattr(args, 'response_source', None)
+            )
 
             try:
                 if args.stream:
                     # Handle streaming response
-                    result = CustomGPT.Conversation.send(**api_args)
-                    if result and hasattr(result, 'events'):
-                        try:
-                            if args.format == 'json':
-                                # JSON format: print full event data
-                                for event in result.events():
-                                    if hasattr(event, 'data'):
-                                        print(event.data)
-                            else:
-                                # Typing effect: only print progress messages
-                                import sys
-                                import time
-
-                                for event in result.events():
-                                    if hasattr(event, 'data'):
-                                        try:
-                                            event_data = json.loads(event.data)
-                                            if event_data.get('status') == 'progress' and 'message' in event_data:
-                                                sys.stdout.write(event_data['message'])
-                                                sys.stdout.flush()
-                                                # Small delay for typing effect (50ms)
-                                                time.sleep(0.05)
-                                        except json.JSONDecodeError:
-                                            continue
-                                # Add newline at the end
-                                print()
-                        except Exception as e:
-                            print(f"Error in stream processing: {str(e)}", file=sys.stderr)
-                            sys.exit(1)
-                    else:
+                    def on_event(data, message):
+                        if args.format == 'json':
+                            # JSON format: print full event data
+                            sys.stdout.write(data.rstrip('\n') + '\n')
+                            sys.stdout.flush()
+                        elif message is not None:
+                            # Only print progress messages, as soon as they arrive
+                            sys.stdout.write(message)
+                            sys.stdout.flush()
+                    
+                    try:
+                        status_code, timings = self._stream_message(api_args, on_event=on_event)
+                    except Exception as e:
+                        print(f"Error in stream processing: {str(e)}", file=sys.stderr)
+                        sys.exit(1)
+                    if status_code is None:
                         print("Error: No streaming response received", file=sys.stderr)
                         sys.exit(1)
+                    if args.format != 'json':
+                        # Add newline at the end
+                        print()
                 else:
                     # Handle non-streaming response
+                    timings = StreamTimings(started=time.monotonic())
                     result = self._make_api_call(CustomGPT.Conversation.send, **api_args)
+                    timings.mark_connected()
+                    timings.mark_finished()
                     if result:
                         try:
                             response_data = json.loads(result.content)
@@ -1575,10 +3768,25 @@ class CustomGPTCLI:
                     else:
                         print("Error: Failed to send message", file=sys.stderr)
                         sys.exit(1)
+                        
+                if args.timings:
+                    self._print_timings(timings.summary(), args.format)
             except Exception as e:
                 print(f"Error sending message: {str(e)}", file=sys.stderr)
                 sys.exit(1)
 
+        elif args.command == 'batch-send':
+            self._handle_batch_send(args)
+
+        elif args.command == 'bench-chat':
+            self._handle_bench_chat(args)
+
+        elif args.command == 'export-conversations':
+            self._handle_export_conversations(args)
+
+        elif args.command == 'changes':
+            self._handle_changes(args)
+
         elif args.command == 'get-messages':
             result = self._make_api_call(
                 CustomGPT.Conversation.messages,
@@ -1648,46 +3856,684 @@ class CustomGPTCLI:
                 reaction=args.reaction
             )
             
-            if not result:
-                print("Error: Failed to update message feedback")
-                sys.exit(1)
-                
+            if not result:
+                print("Error: Failed to update message feedback")
+                sys.exit(1)
+                
+            try:
+                response_data = json.loads(result.content)
+                if args.format == 'json':
+                    print(json.dumps(response_data, indent=2))
+                else:
+                    print(f"Successfully updated feedback for message {args.prompt_id}")
+            except Exception as e:
+                print(f"Error parsing response: {str(e)}")
+                sys.exit(1)
+
+    def _handle_page_commands(self, args):
+        """Handle all page-related commands."""
+        if args.command == 'get-pages':
+            if args.all or args.format != 'json' or args.fields:
+                self._stream_pages(args)
+                return
+            result = self._make_api_call(
+                CustomGPT.Page.get,
+                project_id=args.project_id,
+                page=args.page,
+                duration=args.duration,
+                order=args.order
+            )
+            
+        elif args.command == 'delete-page':
+            result = self._make_api_call(
+                CustomGPT.Page.delete,
+                project_id=args.project_id,
+                page_id=args.page_id
+            )
+            
+        elif args.command == 'reindex-page':
+            result = self._make_api_call(
+                CustomGPT.Page.reindex,
+                project_id=args.project_id,
+                page_id=args.page_id
+            )
+            
+        elif args.command == 'reindex-pages':
+            pages = self._select_pages(args)
+            if args.dry_run:
+                self._print_selected_pages(pages)
+                return
+            self._run_page_action('Reindexed', CustomGPT.Page.reindex, args.project_id, pages,
+                                  concurrency=args.concurrency, checkpoint=args.checkpoint)
+            return
+            
+        elif args.command == 'delete-pages':
+            self._handle_delete_pages(args)
+            return
+        
+        self._handle_default_format(result)
+
+    # Days of pages the listing returns when no duration is requested
+    _DEFAULT_PAGE_HISTORY_DAYS = 90
+    
+    def _page_history_days(self, project_id, project=None):
+        """
+        Return a pages listing duration that covers a project's whole history.
+        
+        The pages endpoint only returns the last 90 days unless a longer
+        duration is requested, so the project's age is used instead.
+        
+        Args:
+            project_id: Project ID
+            project: Project dict, if already fetched (saves a lookup)
+            
+        Returns:
+            Optional[int]: Days to request, or None if the project's age is unknown
+        """
+        if project is None:
+            project = self._fetch_data(CustomGPT.Project.get, project_id=project_id)
+        created_at = self._parse_datetime((project or {}).get('created_at'))
+        if created_at is None:
+            return None
+        # A day of margin for pages created on the project's first day
+        age = (datetime.now(timezone.utc) - created_at).days + 2
+        return max(self._DEFAULT_PAGE_HISTORY_DAYS, age)
+    
+    def _select_pages(self, args):
+        """
+        Yield the pages chosen by the page selection arguments.
+        
+        Explicit IDs without other filters are used as-is, with no listing
+        request. Otherwise the page listing is streamed through
+        _iter_paginated and filtered as it arrives; explicit IDs then narrow
+        the listing down. Without --duration the listing covers the project's
+        whole history rather than the API's default 90 days.
+        
+        Args:
+            args: Parsed command line arguments (see _add_page_selection_arguments)
+            
+        Yields:
+            dict: Page objects (only 'id' when taken from explicit IDs)
+        """
+        import re
+        
+        try:
+            pattern = re.compile(args.url_regex) if args.url_regex else None
+        except re.error as e:
+            print(f"Error: Invalid --url-regex {args.url_regex!r}: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        page_ids = None
+        if args.page_ids or args.page_ids_file:
+            page_ids = [id.strip() for id in (args.page_ids or '').split(',') if id.strip()]
+            if args.page_ids_file:
+                try:
+                    ids_file = sys.stdin if args.page_ids_file == '-' else open(args.page_ids_file, 'r')
+                except OSError as e:
+                    print(f"Error: Cannot read page IDs file {args.page_ids_file}: {e}", file=sys.stderr)
+                    sys.exit(1)
+                page_ids.extend(line.strip() for line in ids_file if line.strip())
+                if ids_file is not sys.stdin:
+                    ids_file.close()
+            try:
+                page_ids = [int(id) for id in page_ids]
+            except ValueError as e:
+                print(f"Error: Invalid page ID: {e}", file=sys.stderr)
+                sys.exit(1)
+                
+        filtered = any(value is not None for value in (
+            args.url_regex, args.crawl_status, args.index_status, args.older_than, args.newer_than))
+        if page_ids is not None and not filtered:
+            yield from ({'id': id} for id in dict.fromkeys(page_ids))
+            return
+        
+        wanted = set(page_ids) if page_ids is not None else None
+        now = datetime.now(timezone.utc)
+        older_cutoff = now - timedelta(days=args.older_than) if args.older_than is not None else None
+        newer_cutoff = now - timedelta(days=args.newer_than) if args.newer_than is not None else None
+        
+        duration = args.duration
+        if duration is None:
+            duration = self._page_history_days(args.project_id)
+            if duration is None:
+                # --older-than N can only match pages inside a window longer than N days
+                if args.older_than is not None:
+                    duration = max(self._DEFAULT_PAGE_HISTORY_DAYS, args.older_than + 1)
+                print(f"Warning: Could not look up the age of project {args.project_id}; only pages from the last "
+                      f"{duration or self._DEFAULT_PAGE_HISTORY_DAYS} days are scanned", file=sys.stderr)
+            elif args.older_than is not None:
+                duration = max(duration, args.older_than + 1)
+        
+        failures = []
+        for page in self._iter_paginated(CustomGPT.Page.get, self._json_paginator('pages', failures=failures),
+                                         concurrency=args.concurrency, project_id=args.project_id,
+                                         duration=duration, order='asc'):
+            if wanted is not None and page.get('id') not in wanted:
+                continue
+            if pattern and not pattern.search(page.get('page_url') or ''):
+                continue
+            if args.crawl_status and page.get('crawl_status') not in args.crawl_status:
+                continue
+            if args.index_status and page.get('index_status') not in args.index_status:
+                continue
+            if older_cutoff or newer_cutoff:
+                updated_at = self._parse_datetime(page.get('updated_at'))
+                if updated_at is None:
+                    continue
+                if older_cutoff and updated_at >= older_cutoff:
+                    continue
+                if newer_cutoff and updated_at < newer_cutoff:
+                    continue
+            yield page
+        if failures:
+            print(f"Error: {len(failures)} listing pages could not be fetched; not every matching page was selected",
+                  file=sys.stderr)
+            sys.exit(1)
+    
+    def _handle_delete_pages(self, args):
+        """
+        Handle the delete-pages command.
+        
+        The selection is collected in full before the first delete: deleting
+        while the listing is still paged through would shift later offsets
+        and skip matching pages. Without --force the selection is confirmed
+        first, which needs a terminal; page IDs read from stdin therefore
+        need --force.
+        """
+        pages = self._select_pages(args)
+        if args.dry_run:
+            for page in pages:
+                print(json.dumps({'id': page['id'], 'page_url': page.get('page_url'), 'status': 'dry-run'}))
+            return
+        
+        if not args.force:
+            if args.page_ids_file == '-' or not sys.stdin.isatty():
+                print("Error: Cannot ask for confirmation without a terminal; use --force", file=sys.stderr)
+                sys.exit(1)
+        pages = list(pages)
+        if not pages:
+            print("No pages found matching the criteria", file=sys.stderr)
+            return
+        if not args.force:
+            confirm = input(f"Are you sure you want to delete {len(pages)} pages from project "
+                            f"{args.project_id}? (yes/no): ")
+            if confirm.lower() != 'yes':
+                print("Operation cancelled", file=sys.stderr)
+                return
+        
+        self._run_page_action('Deleted', CustomGPT.Page.delete, args.project_id, pages,
+                              concurrency=args.concurrency, checkpoint=args.checkpoint, ndjson=True)
+    
+    def _print_selected_pages(self, pages):
+        """Print the pages a bulk page command would act on."""
+        count = 0
+        for page in pages:
+            print(f"{page['id']}\t{page.get('page_url', '')}")
+            count += 1
+        print(f"\n{count} pages selected")
+    
+    def _run_page_action(self, label, api_func, project_id, pages, concurrency=1, checkpoint=None, ndjson=False):
+        """
+        Call a per-page API function for every selected page through a bounded worker pool.
+        
+        Pages are consumed lazily, so work starts while the listing is still
+        being fetched. Progress and throughput are shown on stderr, failures
+        are printed as they happen, and every result is appended to the
+        checkpoint file (if given) so an interrupted run can resume.
+        
+        Args:
+            label: Past-tense verb for progress output (e.g., 'Reindexed')
+            api_func: API function taking project_id and page_id
+            project_id: Project ID
+            pages: Iterable of page objects with an 'id'
+            concurrency: Maximum number of requests in flight
+            checkpoint: Optional JSONL checkpoint file path
+            ndjson: Write every result to stdout as a JSON line and the
+                summary to stderr, instead of printing only failures
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        
+        already_done = self._read_checkpoint(checkpoint)
+        counts = {'success': 0, 'failed': 0, 'skipped': 0}
+        started = time.monotonic()
+        last_progress = 0.0
+        interactive = sys.stderr.isatty()
+        
+        def run(page_id):
+            request_started = time.monotonic()
+            response = self._make_api_call(api_func, project_id=project_id, page_id=page_id)
+            status_code = getattr(response, 'status_code', None)
+            return page_id, status_code, time.monotonic() - request_started
+        
+        def show_progress(final=False):
+            nonlocal last_progress
+            now = time.monotonic()
+            if not final and now - last_progress < (0.2 if interactive else 10):
+                return
+            last_progress = now
+            elapsed = now - started
+            done = counts['success'] + counts['failed']
+            line = (f"{label} {counts['success']} pages, {counts['failed']} failed, "
+                    f"{counts['skipped']} skipped ({done / elapsed if elapsed > 0 else 0:.1f} pages/s)")
+            if interactive:
+                sys.stderr.write(f"\r{line}" + ('\n' if final else ''))
+            elif not final:
+                sys.stderr.write(line + '\n')
+            sys.stderr.flush()
+        
+        def collect(futures):
+            for future in futures:
+                page_id, status_code, latency = future.result()
+                status = 'success' if status_code is not None and status_code < 400 else 'failed'
+                counts[status] += 1
+                record = {
+                    'id': page_id,
+                    'status': status,
+                    'http_status': status_code,
+                    'latency_ms': round(latency * 1000)
+                }
+                if ndjson:
+                    sys.stdout.write(json.dumps(record) + '\n')
+                    sys.stdout.flush()
+                elif status == 'failed':
+                    print(f"Failed page {page_id}" + (f" (HTTP {status_code})" if status_code else ""))
+                if checkpoint_file:
+                    checkpoint_file.write(json.dumps(record) + '\n')
+                    checkpoint_file.flush()
+            show_progress()
+        
+        concurrency = max(1, concurrency)
+        checkpoint_file = open(checkpoint, 'a') if checkpoint else None
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending = set()
+                for page in pages:
+                    if page['id'] in already_done:
+                        counts['skipped'] += 1
+                        continue
+                    if len(pending) >= concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    pending.add(executor.submit(run, page['id']))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+        finally:
+            if checkpoint_file:
+                checkpoint_file.close()
+            show_progress(final=True)
+        
+        elapsed = time.monotonic() - started
+        summary = (f"{label} {counts['success']} pages, {counts['failed']} failed, {counts['skipped']} skipped "
+                   f"in {elapsed:.1f}s ({(counts['success'] + counts['failed']) / elapsed if elapsed > 0 else 0:.1f} pages/s)")
+        if ndjson:
+            print(summary, file=sys.stderr)
+        else:
+            print(f"\n{summary}")
+        if counts['failed']:
+            sys.exit(1)
+
+    # Settings apply-settings can diff and update; images are uploads and
+    # cannot be compared with the URLs ProjectSettings.get returns
+    _APPLY_SETTINGS_FIELDS = ('default_prompt', 'example_questions', 'response_source', 'chatbot_msg_lang',
+                              'chatbot_color', 'chatbot_toolbar_color', 'persona_instructions',
+                              'citations_answer_source_label_msg', 'citations_sources_label_msg',
+                              'hang_in_there_msg', 'chatbot_siesta_msg', 'is_loading_indicator_enabled',
+                              'enable_citations', 'enable_feedbacks', 'citations_view_type', 'no_answer_message',
+                              'ending_message', 'remove_branding', 'enable_recaptcha_for_public_chatbots',
+                              'chatbot_model', 'is_selling_enabled')
+    
+    # Settings the SDK's update model fills with a default when not given
+    _SETTINGS_UPDATE_DEFAULTS = ('is_loading_indicator_enabled', 'enable_feedbacks', 'no_answer_message',
+                                 'remove_branding', 'enable_recaptcha_for_public_chatbots', 'is_selling_enabled')
+    
+    def _load_settings_file(self, path):
+        """Load and validate an apply-settings file, exiting on errors."""
+        try:
+            with open(path, 'r') as f:
+                if path.lower().endswith(('.yaml', '.yml')):
+                    try:
+                        import yaml
+                    except ImportError:
+                        print("Error: YAML settings files require PyYAML (pip install pyyaml); "
+                              "JSON files work without it")
+                        sys.exit(1)
+                    try:
+                        settings = yaml.safe_load(f)
+                    except yaml.YAMLError as e:
+                        print(f"Error: Invalid settings file {path}: {e}")
+                        sys.exit(1)
+                else:
+                    settings = json.load(f)
+        except OSError as e:
+            print(f"Error: Cannot read settings file {path}: {e}")
+            sys.exit(1)
+        except ValueError as e:  # JSON and YAML parse errors
+            print(f"Error: Invalid settings file {path}: {e}")
+            sys.exit(1)
+        
+        if not isinstance(settings, dict) or not settings:
+            print(f"Error: Settings file {path} must contain a mapping of settings")
+            sys.exit(1)
+        unknown = [name for name in settings if name not in self._APPLY_SETTINGS_FIELDS]
+        if unknown:
+            print(f"Error: Unsupported settings: {', '.join(unknown)}")
+            print(f"Supported settings: {', '.join(self._APPLY_SETTINGS_FIELDS)}")
+            sys.exit(1)
+        # The multipart form would send null as the string 'None'
+        missing = [name for name, value in settings.items() if value is None]
+        if missing:
+            print(f"Error: Settings cannot be null: {', '.join(missing)}; use \"\" to clear a text setting")
+            sys.exit(1)
+        questions = settings.get('example_questions')
+        if 'example_questions' in settings and (
+                not isinstance(questions, list) or not all(isinstance(q, str) for q in questions)):
+            print("Error: example_questions must be a list of strings")
+            sys.exit(1)
+        return settings
+    
+    @staticmethod
+    def _normalize_setting(value):
+        """
+        Map a setting value to the form the multipart update sends, so values
+        compare equal once serialized (the API returns 3 for '3' and true for 'true').
+        """
+        if isinstance(value, bool):
+            return str(value).lower()
+        if isinstance(value, (list, tuple)):
+            return [CustomGPTCLI._normalize_setting(item) for item in value]
+        return value if value is None else str(value)
+    
+    def _apply_settings(self, args):
+        """
+        Apply a settings file to the selected projects.
+        
+        Current settings are fetched with ProjectSettings.get through a
+        bounded worker pool and compared field by field. ProjectSettings.update
+        is called only for projects that drifted, and only with the drifted
+        fields; settings the SDK would otherwise send with a default value
+        are explicitly left out.
+        """
+        import re
+        from concurrent.futures import FIRST_COMPLETED, wait
+        from customgpt_client.types import UNSET
+        
+        desired = self._load_settings_file(args.file)
+        
+        if args.projects.strip().lower() == 'all':
+            project_ids = None
+        else:
+            try:
+                project_ids = [int(id.strip()) for id in args.projects.split(',') if id.strip()]
+            except ValueError as e:
+                print(f"Error: Invalid project ID: {e}")
+                sys.exit(1)
+        if project_ids is None or args.name_filter:
+            projects = self._get_all_projects(concurrency=args.concurrency)
+            if args.name_filter:
+                pattern = re.compile(args.name_filter, re.IGNORECASE)
+                projects = [p for p in projects if pattern.search(p.project_name)]
+            listed = [p.id for p in projects]
+            project_ids = listed if project_ids is None else [id for id in project_ids if id in set(listed)]
+        project_ids = list(dict.fromkeys(project_ids))
+        if not project_ids:
+            print("No projects found matching the criteria")
+            return
+        
+        counts = {'updated': 0, 'unchanged': 0, 'failed': 0}
+        started = time.monotonic()
+        
+        def apply(project_id):
+            response = self._make_api_call(CustomGPT.ProjectSettings.get, project_id=project_id)
+            status_code = getattr(response, 'status_code', None)
+            if status_code is None or status_code >= 400:
+                return project_id, 'failed', status_code, {}
+            try:
+                current = json.loads(response.content).get('data') or {}
+            except (ValueError, AttributeError):  # not JSON, or not an object
+                return project_id, 'failed', status_code, {}
+            if not isinstance(current, dict):
+                return project_id, 'failed', status_code, {}
+            drift = {name: (current.get(name), value) for name, value in desired.items()
+                     if self._normalize_setting(current.get(name)) != self._normalize_setting(value)}
+            if not drift:
+                return project_id, 'unchanged', status_code, drift
+            if args.dry_run:
+                return project_id, 'updated', status_code, drift
+            changes = {name: UNSET for name in self._SETTINGS_UPDATE_DEFAULTS}
+            changes.update((name, value) for name, (_, value) in drift.items())
+            response = self._make_api_call(CustomGPT.ProjectSettings.update, project_id=project_id, **changes)
+            status_code = getattr(response, 'status_code', None)
+            if status_code is None or status_code >= 400:
+                return project_id, 'failed', status_code, drift
+            return project_id, 'updated', status_code, drift
+        
+        def collect(futures):
+            for future in futures:
+                project_id, result, status_code, drift = future.result()
+                counts[result] += 1
+                if args.format == 'ndjson':
+                    status = 'drifted' if args.dry_run and result == 'updated' else result
+                    print(json.dumps({
+                        'project_id': project_id,
+                        'status': status,
+                        'http_status': status_code,
+                        'drift': {name: {'current': old, 'desired': new} for name, (old, new) in drift.items()}
+                    }))
+                    continue
+                if result == 'failed':
+                    print(f"Failed project {project_id}" + (f" (HTTP {status_code})" if status_code else ""))
+                elif result == 'updated':
+                    verb = 'Drift in' if args.dry_run else 'Updated'
+                    print(f"{verb} project {project_id}: {len(drift)} settings")
+                    for name, (old, new) in drift.items():
+                        print(f"  {name}: {old!r} -> {new!r}")
+        
+        concurrency = max(1, args.concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            for project_id in project_ids:
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(apply, project_id))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        
+        elapsed = time.monotonic() - started
+        verb = 'Found drift in' if args.dry_run else 'Updated'
+        summary = (f"{verb} {counts['updated']} projects, {counts['unchanged']} unchanged, "
+                   f"{counts['failed']} failed in {elapsed:.1f}s")
+        if args.format == 'ndjson':
+            print(summary, file=sys.stderr)
+        else:
+            print(f"\n{summary}")
+        if counts['failed']:
+            sys.exit(1)
+    
+    # Page metadata fields accepted by PageMetadata.update
+    _PAGE_METADATA_FIELDS = ('title', 'url', 'description', 'image')
+    
+    def _read_page_metadata_rows(self, path, input_format=None):
+        """
+        Yield the rows of a page metadata file one at a time.
+        
+        Args:
+            path: CSV or JSONL file path, or '-' for stdin
+            input_format: 'csv' or 'jsonl'; guessed from the extension if None
+            
+        Yields:
+            tuple: (row number, page ID or None if invalid, dict of metadata fields)
+        """
+        import csv
+        
+        if input_format is None:
+            input_format = 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+        try:
+            input_file = sys.stdin if path == '-' else open(path, 'r', newline='')
+        except OSError as e:
+            print(f"Error: Cannot read metadata file {path}: {e}")
+            sys.exit(1)
+        try:
+            if input_format == 'csv':
+                rows = csv.DictReader(input_file)
+            else:
+                rows = (json.loads(line) for line in input_file if line.strip())
+            for number, row in enumerate(rows, 1):
+                if not isinstance(row, dict):
+                    yield number, None, {}
+                    continue
+                fields = {name: row[name] for name in self._PAGE_METADATA_FIELDS
+                          if name in row and not (input_format == 'csv' and row[name] in ('', None))}
+                try:
+                    page_id = int(row.get('page_id', row.get('id')))
+                except (TypeError, ValueError):
+                    page_id = None
+                yield number, page_id, fields
+        except ValueError as e:
+            print(f"Error: Invalid metadata file {path}: {e}")
+            sys.exit(1)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+    
+    def _sync_page_metadata(self, args):
+        """
+        Bring page metadata in line with an input file, updating only what differs.
+        
+        Each row is fetched with PageMetadata.get and compared name by name;
+        PageMetadata.update is called only for pages with differences and
+        only with the changed fields. Rows are processed through a bounded
+        worker pool while the file is still being read.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
+        
+        counts = {'updated': 0, 'unchanged': 0, 'failed': 0}
+        started = time.monotonic()
+        
+        def sync(number, page_id, fields):
+            if page_id is None:
+                return number, page_id, 'invalid', None, None
+            response = self._make_api_call(CustomGPT.PageMetadata.get, project_id=args.project_id, page_id=page_id)
+            status_code = getattr(response, 'status_code', None)
+            if status_code is None or status_code >= 400:
+                return number, page_id, 'failed', status_code, None
             try:
-                response_data = json.loads(result.content)
-                if args.format == 'json':
-                    print(json.dumps(response_data, indent=2))
-                else:
-                    print(f"Successfully updated feedback for message {args.prompt_id}")
-            except Exception as e:
-                print(f"Error parsing response: {str(e)}")
-                sys.exit(1)
+                current = json.loads(response.content).get('data') or {}
+            except (ValueError, AttributeError):  # not JSON, or not an object
+                return number, page_id, 'failed', status_code, None
+            if not isinstance(current, dict):
+                return number, page_id, 'failed', status_code, None
+            changes = {name: value for name, value in fields.items() if current.get(name) != value}
+            if not changes:
+                return number, page_id, 'unchanged', status_code, None
+            diff = {name: (current.get(name), value) for name, value in changes.items()}
+            if args.dry_run:
+                return number, page_id, 'updated', status_code, diff
+            response = self._make_api_call(CustomGPT.PageMetadata.update, project_id=args.project_id,
+                                           page_id=page_id, **changes)
+            status_code = getattr(response, 'status_code', None)
+            if status_code is None or status_code >= 400:
+                return number, page_id, 'failed', status_code, None
+            return number, page_id, 'updated', status_code, diff
+        
+        def collect(futures):
+            for future in futures:
+                number, page_id, result, status_code, diff = future.result()
+                if result == 'invalid':
+                    counts['failed'] += 1
+                    print(f"Invalid row {number}: missing or non-numeric page_id")
+                    continue
+                counts[result] += 1
+                if result == 'failed':
+                    print(f"Failed page {page_id}" + (f" (HTTP {status_code})" if status_code else ""))
+                elif result == 'updated' and args.dry_run:
+                    for name, (old, new) in diff.items():
+                        print(f"Would update page {page_id} {name}: {old!r} -> {new!r}")
+                elif result == 'updated':
+                    print(f"Updated page {page_id}: {', '.join(diff)}")
+        
+        concurrency = max(1, args.concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = set()
+            for row in self._read_page_metadata_rows(args.input, args.input_format):
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(sync, *row))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        
+        elapsed = time.monotonic() - started
+        verb = 'Would update' if args.dry_run else 'Updated'
+        print(f"\n{verb} {counts['updated']} pages, {counts['unchanged']} unchanged, {counts['failed']} failed "
+              f"in {elapsed:.1f}s")
+        if counts['failed']:
+            sys.exit(1)
+    
+    # Page fields written by get-pages --format csv unless --fields is given
+    _PAGE_CSV_FIELDS = ['id', 'page_url', 'crawl_status', 'index_status', 'is_file', 'filename',
+                        'created_at', 'updated_at']
 
-    def _handle_page_commands(self, args):
-        """Handle all page-related commands."""
-        if args.command == 'get-pages':
-            result = self._make_api_call(
-                CustomGPT.Page.get,
-                project_id=args.project_id,
-                page=args.page,
-                duration=args.duration,
-                order=args.order
-            )
-            
-        elif args.command == 'delete-page':
-            result = self._make_api_call(
-                CustomGPT.Page.delete,
-                project_id=args.project_id,
-                page_id=args.page_id
-            )
+    def _stream_pages(self, args):
+        """
+        Write the pages of a project one row at a time.
+        
+        With --all every page of the listing is fetched through
+        _iter_paginated, so rows are written in listing order while later
+        pages are still in flight and memory stays bounded by --concurrency.
+        
+        Args:
+            args: Parsed command line arguments
+        """
+        fields = [f.strip() for f in args.fields.split(',') if f.strip()] if args.fields else None
+        if fields is None and args.format == 'csv':
+            fields = self._PAGE_CSV_FIELDS
+        
+        failures = []
+        get_paginator = self._json_paginator('pages', failures=failures)
+        started = time.monotonic()
+        if args.all:
+            pages = self._iter_paginated(CustomGPT.Page.get, get_paginator, concurrency=args.concurrency,
+                                         project_id=args.project_id, duration=args.duration, order=args.order)
+        else:
+            paginator = get_paginator(self._make_api_call(CustomGPT.Page.get, project_id=args.project_id,
+                                                          page=args.page, duration=args.duration, order=args.order))
+            pages = paginator.data if paginator else []
+        
+        count = 0
+        if args.format == 'csv':
+            import csv
             
-        elif args.command == 'reindex-page':
-            result = self._make_api_call(
-                CustomGPT.Page.reindex,
-                project_id=args.project_id,
-                page_id=args.page_id
-            )
+            writer = csv.writer(sys.stdout)
+            writer.writerow(fields)
+            for page in pages:
+                writer.writerow(['' if page.get(f) is None else page.get(f) for f in fields])
+                count += 1
+        elif args.format == 'ndjson':
+            for page in pages:
+                row = {f: page.get(f) for f in fields} if fields else page
+                sys.stdout.write(json.dumps(row) + '\n')
+                count += 1
+        else:  # json array, written incrementally
+            sys.stdout.write('[')
+            for page in pages:
+                row = {f: page.get(f) for f in fields} if fields else page
+                sys.stdout.write((',\n' if count else '\n') + json.dumps(row, indent=2))
+                count += 1
+            sys.stdout.write('\n]\n' if count else ']\n')
+        sys.stdout.flush()
         
-        self._handle_default_format(result)
+        if args.all:
+            elapsed = time.monotonic() - started
+            rate = count / elapsed if elapsed > 0 else 0
+            print(f"Fetched {count} pages in {elapsed:.1f}s ({rate:.0f} pages/s)", file=sys.stderr)
+        if failures:
+            print(f"Error: {len(failures)} listing pages could not be fetched; the output is incomplete",
+                  file=sys.stderr)
+            sys.exit(1)
 
     def _handle_citations_commands(self, args):
         """Handle all citations-related commands."""
@@ -1715,16 +4561,16 @@ class CustomGPTCLI:
                         print(f"Error: File {args.file} does not exist")
                         sys.exit(1)
                     try:
+                        # Streamed from disk by the HTTP transport
                         with open(args.file, 'rb') as f:
-                            file_content = f.read()
-                        result = self._make_api_call(
-                            CustomGPT.Source.create,
-                            project_id=args.project_id,
-                            file_data_retension=args.file_data_retension,
-                            is_ocr_enabled=args.is_ocr_enabled,
-                            is_anonymized=args.is_anonymized,
-                            file=File(payload=file_content, file_name=os.path.basename(args.file))
-                        )
+                            result = self._make_api_call(
+                                CustomGPT.Source.create,
+                                project_id=args.project_id,
+                                file_data_retension=args.file_data_retension,
+                                is_ocr_enabled=args.is_ocr_enabled,
+                                is_anonymized=args.is_anonymized,
+                                file=File(payload=f, file_name=os.path.basename(args.file))
+                            )
                     except IOError as e:
                         print(f"Error reading file: {e}")
                         sys.exit(1)
@@ -1823,6 +4669,10 @@ class CustomGPTCLI:
     
     def _handle_project_settings_commands(self, args):
         """Handle all project settings-related commands based on OpenAPI/openapi.json."""
+        if args.command == 'apply-settings':
+            self._apply_settings(args)
+            return
+            
         try:
             if args.command == 'get-project-settings':
                 result = self._make_api_call(
@@ -1834,16 +4684,18 @@ class CustomGPTCLI:
                 kwargs = {
                     'project_id': args.project_id,
                 }
+                # Image files stay open only for the API call
+                uploads = contextlib.ExitStack()
                 if args.chatbot_avatar:
                     if not os.path.exists(args.chatbot_avatar):
                         print(f"Error: Avatar file '{args.chatbot_avatar}' does not exist")
                         sys.exit(1)
-                    kwargs['chat_bot_avatar'] = File(payload=open(args.chatbot_avatar, 'rb'), file_name=os.path.basename(args.chatbot_avatar))
+                    kwargs['chat_bot_avatar'] = File(payload=uploads.enter_context(open(args.chatbot_avatar, 'rb')), file_name=os.path.basename(args.chatbot_avatar))
                 if args.chatbot_background:
                     if not os.path.exists(args.chatbot_background):
                         print(f"Error: Background file '{args.chatbot_background}' does not exist")
                         sys.exit(1)
-                    kwargs['chat_bot_bg'] = File(payload=open(args.chatbot_background, 'rb'), file_name=os.path.basename(args.chatbot_background))
+                    kwargs['chat_bot_bg'] = File(payload=uploads.enter_context(open(args.chatbot_background, 'rb')), file_name=os.path.basename(args.chatbot_background))
                 if args.default_prompt:
                     kwargs['default_prompt'] = args.default_prompt
                 if args.example_questions:
@@ -1897,10 +4749,11 @@ class CustomGPTCLI:
                     kwargs['chatbot_model'] = args.chatbot_model
                 if args.is_selling_enabled:
                     kwargs['is_selling_enabled'] = args.is_selling_enabled
-                result = self._make_api_call(
-                    CustomGPT.ProjectSettings.update,
-                    **kwargs
-                )
+                with uploads:
+                    result = self._make_api_call(
+                        CustomGPT.ProjectSettings.update,
+                        **kwargs
+                    )
             
             self._handle_default_format(result)
         except Exception as e:
@@ -1956,6 +4809,10 @@ class CustomGPTCLI:
     
     def _handle_page_metadata_commands(self, args):
         """Handle all page metadata-related commands based on OpenAPI/openapi.json."""
+        if args.command == 'sync-page-metadata':
+            self._sync_page_metadata(args)
+            return
+            
         try:
             if args.command == 'get-page-metadata':
                 result = self._make_api_call(
@@ -1994,8 +4851,694 @@ class CustomGPTCLI:
             print(f"Failed to perform preview {args.command}")
             sys.exit(1)
 
-    def run(self):
-        args = self.parser.parse_args()
+    def _ingest_matches(self, rel_path, include, exclude):
+        """Check a relative path against --include/--exclude globs."""
+        from fnmatch import fnmatch
+        
+        if include and not any(fnmatch(rel_path, pattern) for pattern in include):
+            return False
+        return not (exclude and any(fnmatch(rel_path, pattern) for pattern in exclude))
+    
+    def _scan_directory(self, root, manifest, include=None, exclude=None, hash_workers=1, rehash=False):
+        """
+        Walk a directory and hash the files that may have changed since the manifest.
+        
+        Files whose size and mtime match their manifest entry are not re-read
+        unless rehash is set. The rest are hashed in a process pool.
+        
+        Args:
+            root: Directory to scan
+            manifest: SourceManifest of previously uploaded files
+            include: Optional globs a relative path must match
+            exclude: Optional globs that exclude a relative path
+            hash_workers: Number of hashing processes
+            rehash: Hash every file regardless of size and mtime
+            
+        Returns:
+            Dict[str, dict]: Relative path -> {'path', 'sha256', 'size', 'mtime_ns'}
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        files = {}
+        to_hash = []
+        for rel_path in walk_files(root):
+            if not self._ingest_matches(rel_path, include, exclude):
+                continue
+            st = os.stat(os.path.join(root, rel_path))
+            entry = {'path': rel_path, 'sha256': None, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+            previous = manifest.entries.get(rel_path)
+            if (not rehash and previous and previous.get('size') == st.st_size
+                    and previous.get('mtime_ns') == st.st_mtime_ns):
+                entry['sha256'] = previous.get('sha256')
+            else:
+                to_hash.append(entry)
+            files[rel_path] = entry
+                
+        paths = [os.path.join(root, entry['path']) for entry in to_hash]
+        if hash_workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(hash_workers, len(paths))) as pool:
+                digests = list(pool.map(file_sha256, paths, chunksize=max(1, len(paths) // (hash_workers * 4))))
+        else:
+            digests = [file_sha256(path) for path in paths]
+        for entry, digest in zip(to_hash, digests):
+            entry['sha256'] = digest
+        return files
+    
+    def _upload_source_file(self, project_id, root, entry, options):
+        """
+        Upload one file as a project source.
+        
+        Args:
+            project_id: Project to add the file to
+            root: Directory the entry's relative path is under
+            entry: Scanned file entry ('path', 'sha256', 'size', 'mtime_ns')
+            options: Create-source flags (file_data_retension, is_ocr_enabled, is_anonymized)
+            
+        Returns:
+            Optional[dict]: The entry with 'source_id' and 'page_id' added, or None on failure
+        """
+        full_path = os.path.join(root, entry['path'])
+        try:
+            with open(full_path, 'rb') as f:
+                result = self._make_api_call(
+                    CustomGPT.Source.create,
+                    project_id=project_id,
+                    file=File(payload=f, file_name=os.path.basename(full_path)),
+                    **options
+                )
+        except OSError as e:
+            logger.error(f"Error reading {full_path}: {str(e)}")
+            return None
+        
+        if not result or getattr(result, 'status_code', 500) >= 400:
+            return None
+        try:
+            data = json.loads(result.content).get('data') or {}
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        pages = data.get('pages') or []
+        return dict(entry, source_id=data.get('id'), page_id=pages[0].get('id') if pages else None)
+    
+    def _delete_source_file(self, project_id, entry):
+        """
+        Remove an uploaded file from the project.
+        
+        Uploaded files are listed under the project's shared uploads source, so
+        the page created for the file is deleted; Source.delete is only used
+        when the upload response did not include a page.
+        
+        Returns:
+            bool: True if the file's content was deleted
+        """
+        if entry.get('page_id') is not None:
+            result = self._make_api_call(CustomGPT.Page.delete, project_id=project_id, page_id=entry['page_id'])
+        elif entry.get('source_id') is not None:
+            result = self._make_api_call(CustomGPT.Source.delete, project_id=project_id, source_id=entry['source_id'])
+        else:
+            return True
+        # Already gone counts as deleted
+        return bool(result) and (getattr(result, 'status_code', 500) < 400 or result.status_code == 404)
+    
+    def _ingest_upload(self, project_id, root, entry, manifest, options):
+        """
+        Upload a new or changed file, delete its previous version and record it in the manifest.
+        
+        Returns:
+            Optional[dict]: The recorded manifest entry, or None if the upload failed
+        """
+        uploaded = self._upload_source_file(project_id, root, entry, options)
+        if uploaded:
+            previous = manifest.entries.get(entry['path'])
+            if previous and not self._delete_source_file(project_id, previous):
+                logger.warning(f"Uploaded new version of {entry['path']} but could not delete the old one")
+            manifest.record(uploaded)
+        return uploaded
+    
+    def _ingest_delete(self, project_id, entry, manifest):
+        """Delete a removed file's content and drop it from the manifest. Returns True on success."""
+        deleted = self._delete_source_file(project_id, entry)
+        if deleted:
+            manifest.remove(entry['path'])
+        return deleted
+    
+    def _print_ingest_result(self, action, path, result, seconds):
+        """Print one upload or delete outcome and return whether it succeeded."""
+        if action == 'delete':
+            print(f"Deleted {path} ({seconds * 1000:.0f} ms)" if result else f"Failed to delete {path}")
+        elif result:
+            print(f"Uploaded {path} -> source {result.get('source_id')} ({seconds * 1000:.0f} ms)")
+        else:
+            print(f"Failed to upload {path}")
+        return bool(result)
+    
+    def _ingest_options(self, args):
+        """Create-source flags shared by ingest-dir and watch-dir."""
+        return {
+            'file_data_retension': args.file_data_retension,
+            'is_ocr_enabled': args.is_ocr_enabled,
+            'is_anonymized': args.is_anonymized
+        }
+    
+    def _open_manifest(self, args):
+        """Check the directory argument and load its manifest, exiting if it is not a directory."""
+        if not os.path.isdir(args.path):
+            print(f"Error: Not a directory: {args.path}")
+            sys.exit(1)
+        return SourceManifest(args.manifest or os.path.join(args.path, f'.customgpt-manifest-{args.project_id}.jsonl'))
+    
+    def _handle_ingest_commands(self, args):
+        """Handle directory ingestion commands."""
+        if args.command == 'ingest-dir':
+            manifest = self._open_manifest(args)
+            try:
+                error_count = self._ingest_directory(args, manifest, rehash=args.rehash, dry_run=args.dry_run)
+            finally:
+                manifest.compact()
+            if error_count:
+                sys.exit(1)
+        elif args.command == 'watch-dir':
+            self._handle_watch_dir(args)
+    
+    def _ingest_directory(self, args, manifest, rehash=False, dry_run=False):
+        """
+        Upload new and changed files under a directory and optionally delete removed ones.
+        
+        Args:
+            args: Parsed command line arguments
+            manifest: SourceManifest for the directory and project
+            rehash: Hash every file regardless of size and mtime
+            dry_run: Only print what would be uploaded and deleted
+            
+        Returns:
+            int: Number of failed uploads and deletions
+        """
+        from concurrent.futures import as_completed
+        
+        root = args.path
+        started = time.monotonic()
+        files = self._scan_directory(root, manifest, args.include, args.exclude, args.hash_workers, rehash)
+        scan_seconds = time.monotonic() - started
+        
+        new, changed, unchanged = [], [], []
+        for rel_path, entry in files.items():
+            previous = manifest.entries.get(rel_path)
+            if previous is None:
+                new.append(entry)
+            elif previous.get('sha256') != entry['sha256']:
+                changed.append(entry)
+            else:
+                unchanged.append(entry)
+                if (previous.get('size'), previous.get('mtime_ns')) != (entry['size'], entry['mtime_ns']) and not dry_run:
+                    manifest.record(dict(previous, size=entry['size'], mtime_ns=entry['mtime_ns']))
+        removed = []
+        if args.delete_removed:
+            removed = [entry for rel_path, entry in sorted(manifest.entries.items())
+                       if rel_path not in files and self._ingest_matches(rel_path, args.include, args.exclude)]
+        
+        print(f"Scanned {len(files)} files in {scan_seconds:.1f}s: {len(new)} new, {len(changed)} changed, "
+              f"{len(unchanged)} unchanged" + (f", {len(removed)} removed" if args.delete_removed else ""))
+        
+        if dry_run:
+            for label, entries in (('upload (new)', new), ('upload (changed)', changed), ('delete', removed)):
+                for entry in entries:
+                    print(f"Would {label}: {entry['path']}")
+            return 0
+        
+        options = self._ingest_options(args)
+        
+        def timed(action, entry):
+            task_started = time.monotonic()
+            if action == 'delete':
+                result = self._ingest_delete(args.project_id, entry, manifest)
+            else:
+                result = self._ingest_upload(args.project_id, root, entry, manifest, options)
+            return action, entry['path'], result, time.monotonic() - task_started
+        
+        uploaded_count = deleted_count = error_count = 0
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+            futures = [executor.submit(timed, 'upload', entry) for entry in new + changed]
+            futures += [executor.submit(timed, 'delete', entry) for entry in removed]
+            for future in as_completed(futures):
+                action, path, result, seconds = future.result()
+                if not self._print_ingest_result(action, path, result, seconds):
+                    error_count += 1
+                elif action == 'delete':
+                    deleted_count += 1
+                else:
+                    uploaded_count += 1
+            
+        print(f"\nIngest complete: {uploaded_count} uploaded, {deleted_count} deleted, "
+              f"{len(unchanged)} unchanged, {error_count} failed")
+        return error_count
+
+    def _sync_watched_path(self, args, rel_path, manifest, options):
+        """
+        Bring one changed path in line with the project.
+        
+        A file is hashed and uploaded if its content differs from the manifest;
+        a path that no longer exists has its file, or every file under it if it
+        was a directory, deleted when --delete-removed is set.
+        
+        Returns:
+            list: (action, path, result, seconds) for each upload or delete made
+        """
+        root = args.path
+        full_path = os.path.join(root, rel_path)
+        started = time.monotonic()
+        if os.path.isfile(full_path):
+            if not self._ingest_matches(rel_path, args.include, args.exclude):
+                return []
+            try:
+                st = os.stat(full_path)
+                previous = manifest.entries.get(rel_path)
+                if previous and (previous.get('size'), previous.get('mtime_ns')) == (st.st_size, st.st_mtime_ns):
+                    return []
+                entry = {'path': rel_path, 'sha256': file_sha256(full_path), 'size': st.st_size,
+                         'mtime_ns': st.st_mtime_ns}
+            except OSError:
+                return []  # Removed again before it could be read; its delete event follows
+            if previous and previous.get('sha256') == entry['sha256']:
+                manifest.record(dict(previous, size=entry['size'], mtime_ns=entry['mtime_ns']))
+                return []
+            result = self._ingest_upload(args.project_id, root, entry, manifest, options)
+            return [('upload', rel_path, result, time.monotonic() - started)]
+        
+        if os.path.exists(full_path) or not args.delete_removed:
+            return []
+        results = []
+        for path, entry in sorted(manifest.entries.items()):
+            if (path == rel_path or path.startswith(rel_path + '/')) and \
+                    self._ingest_matches(path, args.include, args.exclude):
+                result = self._ingest_delete(args.project_id, entry, manifest)
+                results.append(('delete', path, result, time.monotonic() - started))
+        return results
+    
+    def _handle_watch_dir(self, args):
+        """
+        Watch a directory and push changed files to the project until interrupted.
+        
+        Events for a path are coalesced until it has been quiet for --debounce
+        seconds. At most --concurrency paths are synced at once; while all slots
+        are busy, further events keep coalescing instead of queueing uploads.
+        
+        Args:
+            args: Parsed command line arguments
+        """
+        import signal
+        
+        manifest = self._open_manifest(args)
+        watcher = None
+        if not args.poll:
+            try:
+                watcher = InotifyWatcher(args.path)
+            except OSError as e:
+                logger.warning(f"inotify unavailable ({e}); falling back to polling")
+        if watcher is None:
+            watcher = PollingWatcher(args.path, args.poll_interval)
+            
+        options = self._ingest_options(args)
+        pending: Dict[str, float] = {}  # path -> time of its latest event
+        in_flight: Dict[Future, str] = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, args.concurrency))
+        
+        def report(future):
+            try:
+                for action, path, result, seconds in future.result():
+                    self._print_ingest_result(action, path, result, seconds)
+            except Exception as e:
+                logger.error(f"Error syncing {in_flight[future]}: {str(e)}")
+            sys.stdout.flush()
+        
+        # Service managers stop watchers with SIGTERM; exit through the cleanup below
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            if not args.no_initial_sync:
+                self._ingest_directory(args, manifest)
+            print(f"Watching {args.path} for changes ({watcher.method}). Press Ctrl+C to stop.")
+            sys.stdout.flush()
+            
+            while True:
+                timeout = 1.0
+                if pending:
+                    timeout = max(0.05, min(pending.values()) + args.debounce - time.monotonic())
+                if in_flight:
+                    timeout = min(timeout, 0.1)
+                changed = watcher.wait(timeout)
+                now = time.monotonic()
+                if changed is None:
+                    logger.warning("Missed file events; rescanning the directory")
+                    changed = set(walk_files(args.path)) | set(manifest.entries)
+                for path in changed:
+                    pending[path] = now
+                    
+                for future in [future for future in in_flight if future.done()]:
+                    report(future)
+                    del in_flight[future]
+                    
+                busy = set(in_flight.values())
+                for path in sorted(path for path, seen in pending.items() if now - seen >= args.debounce):
+                    if len(in_flight) >= args.concurrency:
+                        break
+                    if any(path == other or path.startswith(other + '/') or other.startswith(path + '/')
+                           for other in busy):
+                        continue  # Waits for the sync of the same file or its directory to finish
+                    del pending[path]
+                    in_flight[executor.submit(self._sync_watched_path, args, path, manifest, options)] = path
+                    busy.add(path)
+        except KeyboardInterrupt:
+            print("\nStopping watcher")
+        finally:
+            executor.shutdown(wait=True)
+            for future in in_flight:
+                report(future)
+            watcher.close()
+            manifest.compact()
+
+    def _fetch_data(self, api_func, **kwargs):
+        """Call an API function and return the data object of its JSON body, or None on failure."""
+        response = self._make_api_call(api_func, **kwargs)
+        if not response or getattr(response, 'status_code', 500) >= 400:
+            return None
+        try:
+            return json.loads(response.content).get('data')
+        except (ValueError, AttributeError):
+            return None
+    
+    def _fetch_mirror_project(self, project, resources, fetch_details):
+        """
+        Fetch what the mirror stores for one project.
+        
+        Returns:
+            dict: 'project' plus each fetched resource; a resource that failed
+                is None and 'failed' lists its name
+        """
+        project_id = project['id']
+        result = {'project': project, 'failed': []}
+        fetchers = {
+            'stats': lambda: self._fetch_data(CustomGPT.Project.stats, project_id=project_id),
+            'sources': lambda: self._fetch_data(CustomGPT.Source.list, project_id=project_id),
+            'settings': lambda: self._fetch_data(CustomGPT.ProjectSettings.get, project_id=project_id),
+            'plugins': lambda: self._fetch_data(CustomGPT.ProjectPlugins.get, project_id=project_id),
+        }
+        for resource in resources:
+            if resource != 'stats' and not fetch_details:
+                continue
+            if resource == 'pages':
+                failures = []
+                # Without a duration the API only lists the last 90 days of pages
+                pages = list(self._iter_paginated(CustomGPT.Page.get, self._json_paginator('pages', failures=failures),
+                                                  project_id=project_id,
+                                                  duration=self._page_history_days(project_id, project=project)))
+                result['pages'] = None if failures else pages
+            else:
+                result[resource] = fetchers[resource]()
+            if result[resource] is None:
+                result['failed'].append(resource)
+        return result
+    
+    def _sync_mirror(self, mirror, args, resources):
+        """
+        Bring the mirror up to date with the account.
+        
+        Projects and stats are refreshed on every sync. Pages, sources,
+        settings and plugins are only refetched for projects whose updated_at
+        changed since they were last mirrored (or all projects with --full).
+        API calls run through a bounded worker pool; the results are written
+        from this thread, one transaction per project.
+        
+        Returns:
+            int: Number of projects with a resource that failed to sync
+        """
+        started = time.monotonic()
+        synced_at = datetime.now(timezone.utc).isoformat()
+        failures = []
+        projects = list(self._iter_paginated(CustomGPT.Project.list, self._json_paginator(failures=failures),
+                                             concurrency=args.concurrency))
+        if failures:
+            print("Error: Failed to list projects; the mirror was not changed", file=sys.stderr)
+            return len(failures)
+        
+        versions = mirror.details_versions()
+        changed_count = error_count = 0
+        
+        def save(result):
+            nonlocal changed_count, error_count
+            project = result['project']
+            with mirror.transaction():
+                mirror.save_project(project, synced_at)
+                if result.get('stats') is not None:
+                    mirror.save_stats(project['id'], result['stats'], synced_at)
+                if result.get('pages') is not None:
+                    mirror.replace_pages(project['id'], result['pages'])
+                if result.get('sources') is not None:
+                    mirror.replace_sources(project['id'], result['sources'])
+                for table in ('settings', 'plugins'):
+                    if result.get(table) is not None:
+                        mirror.save_document(table, project['id'], result[table])
+                details = [resource for resource in resources if resource != 'stats']
+                if details and any(resource in result for resource in details):
+                    changed_count += 1
+                    if not result['failed']:
+                        mirror.mark_details_synced(project['id'], project.get('updated_at') or '')
+            if result['failed']:
+                error_count += 1
+                logger.warning(f"Could not mirror {', '.join(result['failed'])} of project {project['id']}")
+        
+        concurrency = max(1, args.concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque()
+            for project in projects:
+                fetch_details = args.full or versions.get(project['id']) != (project.get('updated_at') or '')
+                if len(pending) >= concurrency * 2:
+                    save(pending.popleft().result())
+                pending.append(executor.submit(self._fetch_mirror_project, project, resources, fetch_details))
+            while pending:
+                save(pending.popleft().result())
+        
+        with mirror.transaction():
+            removed_count = mirror.remove_projects_except(project['id'] for project in projects)
+        
+        print(f"Mirrored {len(projects)} projects in {time.monotonic() - started:.1f}s: "
+              f"{changed_count} with changed details, {removed_count} removed, {error_count} failed")
+        return error_count
+    
+    def _open_mirror(self, path, must_exist=False):
+        """Open the mirror database, exiting if must_exist and it has not been synced yet."""
+        from customgpt_cli.mirror import DEFAULT_PATH, Mirror
+        
+        path = path or DEFAULT_PATH
+        if must_exist and not os.path.exists(path):
+            print(f"Error: No mirror at {path}; run 'customgpt-cli mirror sync' first")
+            sys.exit(1)
+        return Mirror(path)
+    
+    def _handle_mirror_commands(self, args):
+        """Handle local mirror commands."""
+        if args.mirror_command == 'sync':
+            resources = [r.strip() for r in args.resources.split(',') if r.strip()]
+            unknown = set(resources) - {'stats', 'pages', 'sources', 'settings', 'plugins'}
+            if unknown:
+                print(f"Error: Unknown resources: {', '.join(sorted(unknown))}")
+                sys.exit(1)
+                
+            mirror = self._open_mirror(args.mirror)
+            try:
+                while True:
+                    error_count = self._sync_mirror(mirror, args, resources)
+                    if args.interval is None:
+                        break
+                    sys.stdout.flush()
+                    time.sleep(args.interval)
+            except KeyboardInterrupt:
+                return
+            finally:
+                mirror.close()
+            if error_count:
+                sys.exit(1)
+                
+        elif args.mirror_command == 'status':
+            mirror = self._open_mirror(args.mirror, must_exist=True)
+            try:
+                status = mirror.status()
+            finally:
+                mirror.close()
+            if args.format == 'json':
+                print(json.dumps(status, indent=2))
+            else:
+                from tabulate import tabulate
+                print(tabulate(status.items(), tablefmt='plain'))
+    
+    def _list_projects_from_mirror(self, args, stats_filters):
+        """
+        Run list-projects against the local mirror.
+        
+        The filters become a single SQL query, and stats for the output come
+        from the mirror through the stats store, so no API call is made.
+        """
+        import re
+        from customgpt_client.models.project import Project
+        from customgpt_client.models.stats_project_response_200_data import StatsProjectResponse200Data
+        
+        # The mirror runs the regex inside SQLite, where a bad pattern only
+        # surfaces as an opaque OperationalError
+        if args.name_filter:
+            try:
+                re.compile(args.name_filter)
+            except re.error as e:
+                print(f"Error: Invalid --name-filter regex {args.name_filter!r}: {e}")
+                sys.exit(1)
+        
+        inactive_before = None
+        if args.inactive_days is not None:
+            inactive_before = datetime.now(timezone.utc) - timedelta(days=args.inactive_days)
+        mirror = self._open_mirror(args.mirror, must_exist=True)
+        try:
+            rows = mirror.query_projects(args.name_filter, inactive_before, stats_filters)
+        finally:
+            mirror.close()
+        
+        projects = [Project.from_dict(project) for project, _ in rows]
+        stats_by_id = {project['id']: StatsProjectResponse200Data.from_dict(stats) if stats else None
+                       for project, stats in rows}
+        self._stats_store = ProjectStatsStore(stats_by_id.get)
+        
+        if args.format == 'ndjson':
+            for p in projects:
+                sys.stdout.write(json.dumps(self._project_to_dict(p, stats_by_id[p.id]), cls=DateTimeEncoder) + '\n')
+        else:
+            print(self._format_project_output(projects, args.format))
+
+    def _handle_daemon_commands(self, args):
+        """Handle the serve command."""
+        if args.command == 'serve':
+            self._serve(args.socket, args.cache_ttl)
+    
+    def _serve(self, socket_path, cache_ttl):
+        """
+        Execute commands sent by clients over a Unix socket until interrupted.
+        
+        The SDK stays imported and authenticated, and the rate limiter and
+        project stats caches are shared by every command. Commands run one at a
+        time because handlers write to the process-wide stdout.
+        
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            cache_ttl: Seconds cached project stats are reused
+        """
+        import signal
+        import socket
+        import socketserver
+        
+        cli = self
+        
+        class DaemonRequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline())
+                except ValueError:
+                    return
+                exit_code = cli._serve_request(request, self.wfile, cache_ttl)
+                try:
+                    self.wfile.write(json.dumps({'exit': exit_code}).encode('utf-8') + b'\n')
+                except OSError:
+                    pass
+        
+        # Commands without credentials of their own use the daemon's
+        os.environ['CUSTOMGPT_API_KEY'] = CustomGPT.api_key
+        if os.path.exists(socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(socket_path)
+                except OSError:
+                    os.unlink(socket_path)  # stale socket from a previous daemon
+                else:
+                    print(f"Error: A daemon is already listening on {socket_path}")
+                    sys.exit(1)
+        
+        server = socketserver.UnixStreamServer(socket_path, DaemonRequestHandler)
+        os.chmod(socket_path, 0o600)
+        # Service managers stop daemons with SIGTERM; exit through the cleanup below
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        logger.info(f"Serving CLI commands on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.unlink(socket_path)
+    
+    def _serve_request(self, request, wfile, cache_ttl):
+        """
+        Run one forwarded command with its output streamed back to the client.
+        
+        Args:
+            request: Dict with the client's argv, cwd and DAEMON_ENV_VARS settings
+            wfile: Binary stream connected to the client
+            cache_ttl: Seconds cached project stats are reused
+            
+        Returns:
+            int: Exit code of the command
+        """
+        argv = request.get('argv', [])
+        env = {name: value for name, value in request.get('env', {}).items() if name in DAEMON_ENV_VARS}
+        saved_env = {name: os.environ.get(name) for name in DAEMON_ENV_VARS}
+        saved_cwd = os.getcwd()
+        saved_base_url = getattr(CustomGPT, 'base_url', None)
+        
+        lock = threading.Lock()
+        stdout = SocketStream(wfile, 'stdout', lock)
+        stderr = SocketStream(wfile, 'stderr', lock)
+        
+        # Send log records to the client while the command runs
+        handlers = [h for h in logging.getLogger().handlers
+                    if type(h) is logging.StreamHandler and h.stream in (sys.__stdout__, sys.__stderr__)]
+        saved_streams = [h.setStream(stdout) for h in handlers]
+        
+        exit_code = 0
+        try:
+            os.environ.update(env)
+            if request.get('cwd'):
+                os.chdir(request['cwd'])
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                cli = CustomGPTCLI(argv)
+                cli._rate_limiter = self._rate_limiter
+                cli._transport = self._transport
+                cli._stats_store = self._daemon_stats_store(
+                    os.environ.get('CUSTOMGPT_API_KEY'), os.environ.get('CUSTOMGPT_BASE_URL'), cache_ttl)
+                try:
+                    cli.run(argv)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    print(f"Error: {str(e)}", file=sys.stderr)
+                    exit_code = 1
+        finally:
+            for handler, stream in zip(handlers, saved_streams):
+                handler.setStream(stream)
+            os.chdir(saved_cwd)
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            if saved_base_url is not None:
+                CustomGPT.base_url = saved_base_url
+            elif hasattr(CustomGPT, 'base_url'):
+                del CustomGPT.base_url
+        return exit_code
+    
+    def _daemon_stats_store(self, api_key, base_url, cache_ttl):
+        """Return the project stats cache for one set of credentials, replacing it once it expires."""
+        key = (api_key, base_url)
+        created, store = self._daemon_stats_stores.get(key, (None, None))
+        if store is None or time.monotonic() - created > cache_ttl:
+            store = ProjectStatsStore(self._fetch_project_stats)
+            self._daemon_stats_stores[key] = (time.monotonic(), store)
+        return store
+
+    def run(self, argv=None):
+        args = self.parser.parse_args(argv)
         
         if not args.command:
             self.parser.print_help()
@@ -2010,33 +5553,52 @@ class CustomGPTCLI:
         # Set API key
         CustomGPT.api_key = api_key
         
+        # Point the SDK at another server (e.g. python -m customgpt_cli.mock_server)
+        base_url = args.base_url or os.environ.get('CUSTOMGPT_BASE_URL')
+        if base_url:
+            CustomGPT.base_url = base_url.rstrip('/')
+        
+        # Configure retries for every API call in this run
+        self._retry_policy = RetryPolicy(
+            max_retries=args.max_retries,
+            deadline=args.request_deadline,
+            retry_budget=args.retry_budget
+        )
+        
+        # One pooled HTTP session for every API call; listing and stats workers can be in flight together
+        concurrency = getattr(args, 'concurrency', None)
+        if args.command == 'bench-chat':
+            concurrency = self._bench_concurrency(args)
+        pool_size = args.pool_size or max(4, 2 * (concurrency or 1))
+        if self._transport is None:
+            self._transport = HttpTransport(pool_size)
+        else:
+            self._transport.ensure_pool_size(pool_size)
+        self._transport.install()
+        
         # Handle commands by category
-        if args.command in ['create-project', 'show-project', 'list-projects', 'update-project', 'delete-projects', 'replicate-project', 'project-stats']:
-            self._handle_project_commands(args)
-        elif args.command in ['create-conversation', 'update-conversation', 'delete-conversation', 'send-message', 'get-messages', 'get-message', 'update-message-feedback' ]:
-            self._handle_conversation_commands(args)
-        elif args.command in ['get-pages', 'delete-page', 'reindex-page']:
-            self._handle_page_commands(args)
-        elif args.command in ['get-citation']:
-            self._handle_citations_commands(args)
-        elif args.command in ['list-sources', 'create-source', 'update-source', 'delete-source', 'sync-source']:
-            self._handle_sources_commands(args)
-        elif args.command in ['get-traffic-report', 'get-queries-report', 'get-conversations-report', 'get-analysis-report']:
-            self._handle_reports_commands(args)
-        elif args.command in ['get-user']:
-            self._handle_user_commands(args)
-        elif args.command in ['get-project-settings', 'update-project-settings']:
-            self._handle_project_settings_commands(args)
-        elif args.command in ['list-plugins', 'create-plugin', 'update-plugin', 'delete-plugin']:
-            self._handle_plugins_commands(args)
-        elif args.command in ['preview-file']:
-            self._handle_preview_commands(args)
-        elif args.command in ['get-page-metadata', 'update-page-metadata']:
-            self._handle_page_metadata_commands(args)
-        elif args.command in ['get-limits']:
-            self._handle_limits_commands(args)
+        try:
+            for commands, _, handle_commands in self._COMMAND_GROUPS:
+                if args.command in commands:
+                    getattr(self, handle_commands)(args)
+                    break
+        finally:
+            if args.transport_stats:
+                stats = self._transport.stats()
+                print(f"HTTP connections: {stats['connections_opened']} opened, "
+                      f"{stats['connections_reused']} reused ({stats['requests']} requests)", file=sys.stderr)
 
 def main():
+    # Hand the command to a running daemon (customgpt-cli serve) if one is configured
+    socket_path = os.environ.get('CUSTOMGPT_CLI_SOCKET')
+    if socket_path:
+        command = CustomGPTCLI._selected_command(sys.argv[1:])
+        if command and command not in CustomGPTCLI._LOCAL_COMMANDS:
+            exit_code = forward_to_daemon(socket_path, sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+    
+    setup_logging()
     cli = CustomGPTCLI()
     cli.run()
 
@@ -0,0 +1,278 @@
+"""
+Local SQLite mirror of account state.
+
+`customgpt-cli mirror sync` materializes projects, project stats, pages,
+sources, settings and plugins into a SQLite database, and
+`customgpt-cli list-projects --from-mirror` runs the list-projects filters as
+SQL against it instead of making one stats call per project.
+
+Every row keeps the API's JSON in a `data` column, next to the indexed columns
+used for filtering, so readers get back exactly what the API returned.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+JsonDict = Dict[str, Any]
+
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.customgpt-cli', 'mirror.sqlite3')
+
+# Stats columns, keyed by the suffix of the matching list-projects --min-*/--max-* options
+STATS_FILTER_COLUMNS = {
+    'queries': 'total_queries',
+    'pages_found': 'pages_found',
+    'pages_crawled': 'pages_crawled',
+    'pages_indexed': 'pages_indexed',
+    'words_indexed': 'total_words_indexed',
+    'storage_credits': 'total_storage_credits_used',
+    'crawl_credits': 'crawl_credits_used',
+    'query_credits': 'query_credits_used',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    project_name TEXT,
+    type TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    updated_at_epoch REAL,
+    is_chat_active INTEGER,
+    is_shared INTEGER,
+    data TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    details_version TEXT
+);
+CREATE INDEX IF NOT EXISTS projects_updated_at ON projects (updated_at_epoch);
+CREATE INDEX IF NOT EXISTS projects_type ON projects (type);
+
+CREATE TABLE IF NOT EXISTS project_stats (
+    project_id INTEGER PRIMARY KEY REFERENCES projects (id) ON DELETE CASCADE,
+    pages_found INTEGER,
+    pages_crawled INTEGER,
+    pages_indexed INTEGER,
+    total_words_indexed INTEGER,
+    total_storage_credits_used INTEGER,
+    crawl_credits_used INTEGER,
+    query_credits_used INTEGER,
+    total_queries INTEGER,
+    data TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS project_stats_total_queries ON project_stats (total_queries);
+CREATE INDEX IF NOT EXISTS project_stats_pages_found ON project_stats (pages_found);
+CREATE INDEX IF NOT EXISTS project_stats_pages_crawled ON project_stats (pages_crawled);
+CREATE INDEX IF NOT EXISTS project_stats_pages_indexed ON project_stats (pages_indexed);
+CREATE INDEX IF NOT EXISTS project_stats_total_words_indexed ON project_stats (total_words_indexed);
+CREATE INDEX IF NOT EXISTS project_stats_total_storage_credits_used ON project_stats (total_storage_credits_used);
+CREATE INDEX IF NOT EXISTS project_stats_crawl_credits_used ON project_stats (crawl_credits_used);
+CREATE INDEX IF NOT EXISTS project_stats_query_credits_used ON project_stats (query_credits_used);
+
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    page_url TEXT,
+    crawl_status TEXT,
+    index_status TEXT,
+    is_file INTEGER,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_project ON pages (project_id, index_status);
+CREATE INDEX IF NOT EXISTS pages_crawl_status ON pages (project_id, crawl_status);
+CREATE INDEX IF NOT EXISTS pages_url ON pages (page_url);
+
+CREATE TABLE IF NOT EXISTS sources (
+    project_id INTEGER NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    id INTEGER,
+    type TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sources_project ON sources (project_id, type);
+
+CREATE TABLE IF NOT EXISTS settings (
+    project_id INTEGER PRIMARY KEY REFERENCES projects (id) ON DELETE CASCADE,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS plugins (
+    project_id INTEGER PRIMARY KEY REFERENCES projects (id) ON DELETE CASCADE,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _epoch(value: Any) -> Optional[float]:
+    """Convert an API timestamp to a UTC epoch, or None if it cannot be parsed."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+_patterns: Dict[str, Any] = {}
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    """SQLite REGEXP function: case-insensitive re.search, like list-projects --name-filter."""
+    if value is None:
+        return False
+    compiled = _patterns.get(pattern)
+    if compiled is None:
+        compiled = _patterns[pattern] = re.compile(pattern, re.IGNORECASE)
+    return compiled.search(value) is not None
+
+
+class Mirror:
+    """
+    SQLite database holding the mirrored account state.
+
+    The database runs in WAL mode, so list-projects can read while a sync is
+    writing. Writes are expected from a single thread; group the writes for
+    one project in transaction().
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.create_function('REGEXP', 2, _regexp, deterministic=True)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Commit the enclosed writes together, or roll them back on error."""
+        with self.conn:
+            yield self.conn
+
+    def details_versions(self) -> Dict[int, Optional[str]]:
+        """Return project ID -> updated_at of the project when its details were last synced."""
+        return dict(self.conn.execute('SELECT id, details_version FROM projects'))
+
+    def save_project(self, project: JsonDict, synced_at: str):
+        """Insert or update a project row, keeping its details version."""
+        self.conn.execute(
+            """
+            INSERT INTO projects (id, project_name, type, created_at, updated_at, updated_at_epoch,
+                                  is_chat_active, is_shared, data, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                project_name = excluded.project_name, type = excluded.type,
+                created_at = excluded.created_at, updated_at = excluded.updated_at,
+                updated_at_epoch = excluded.updated_at_epoch, is_chat_active = excluded.is_chat_active,
+                is_shared = excluded.is_shared, data = excluded.data, synced_at = excluded.synced_at
+            """,
+            (project['id'], project.get('project_name'), project.get('type'), project.get('created_at'),
+             project.get('updated_at'), _epoch(project.get('updated_at')), project.get('is_chat_active'),
+             project.get('is_shared'), json.dumps(project), synced_at)
+        )
+
+    def save_stats(self, project_id: int, stats: JsonDict, synced_at: str):
+        """Insert or replace the stats of a project."""
+        columns = list(STATS_FILTER_COLUMNS.values())
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO project_stats (project_id, {', '.join(columns)}, data, synced_at) "
+            f"VALUES (?, {', '.join('?' for _ in columns)}, ?, ?)",
+            (project_id, *(stats.get(column) for column in columns), json.dumps(stats), synced_at)
+        )
+
+    def replace_pages(self, project_id: int, pages: List[JsonDict]):
+        """Replace every mirrored page of a project."""
+        self.conn.execute('DELETE FROM pages WHERE project_id = ?', (project_id,))
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO pages (id, project_id, page_url, crawl_status, index_status, is_file, '
+            'updated_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(page.get('id'), project_id, page.get('page_url'), page.get('crawl_status'), page.get('index_status'),
+              page.get('is_file'), page.get('updated_at'), json.dumps(page)) for page in pages]
+        )
+
+    def replace_sources(self, project_id: int, sources: JsonDict):
+        """Replace the mirrored sources of a project from a list-sources response."""
+        rows = [source for source in sources.get('sitemaps') or []]
+        if sources.get('uploads'):
+            rows.append(dict(sources['uploads'], type=sources['uploads'].get('type') or 'upload'))
+        self.conn.execute('DELETE FROM sources WHERE project_id = ?', (project_id,))
+        self.conn.executemany(
+            'INSERT INTO sources (project_id, id, type, data) VALUES (?, ?, ?, ?)',
+            [(project_id, source.get('id'), source.get('type'), json.dumps(source)) for source in rows]
+        )
+
+    def save_document(self, table: str, project_id: int, data: JsonDict):
+        """Insert or replace a per-project JSON document (settings or plugins)."""
+        if table not in ('settings', 'plugins'):
+            raise ValueError(f"Unknown document table: {table}")
+        self.conn.execute(f'INSERT OR REPLACE INTO {table} (project_id, data) VALUES (?, ?)',
+                          (project_id, json.dumps(data)))
+
+    def mark_details_synced(self, project_id: int, version: Optional[str]):
+        """Record the project updated_at its pages, sources, settings and plugins were synced at."""
+        self.conn.execute('UPDATE projects SET details_version = ? WHERE id = ?', (version, project_id))
+
+    def remove_projects_except(self, project_ids) -> int:
+        """Delete projects (and, by cascade, their rows) that are no longer in the account."""
+        keep = set(project_ids)
+        stale = [(project_id,) for (project_id,) in self.conn.execute('SELECT id FROM projects')
+                 if project_id not in keep]
+        self.conn.executemany('DELETE FROM projects WHERE id = ?', stale)
+        return len(stale)
+
+    def query_projects(self, name_filter: Optional[str] = None, inactive_before: Optional[datetime] = None,
+                       stats_filters: Optional[Dict[str, Optional[int]]] = None
+                       ) -> List[Tuple[JsonDict, Optional[JsonDict]]]:
+        """
+        Select projects with the list-projects filters, newest ID first.
+
+        Args:
+            name_filter: Case-insensitive regex the project name must contain
+            inactive_before: Only projects last updated before this time
+            stats_filters: list-projects --min-*/--max-* values keyed like
+                'min_queries'; None values are ignored. Projects without
+                mirrored stats never match a stats filter.
+
+        Returns:
+            list: (project JSON, stats JSON or None) pairs
+        """
+        conditions = []
+        params: List[Any] = []
+        if name_filter:
+            conditions.append('p.project_name REGEXP ?')
+            params.append(name_filter)
+        if inactive_before is not None:
+            conditions.append('p.updated_at_epoch < ?')
+            params.append(inactive_before.timestamp())
+        for name, value in (stats_filters or {}).items():
+            if value is None:
+                continue
+            bound, _, suffix = name.partition('_')
+            column = STATS_FILTER_COLUMNS[suffix]
+            conditions.append(f"s.{column} {'>=' if bound == 'min' else '<='} ?")
+            params.append(value)
+        sql = 'SELECT p.data, s.data FROM projects p LEFT JOIN project_stats s ON s.project_id = p.id'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY p.id DESC'
+        return [(json.loads(project), json.loads(stats) if stats else None)
+                for project, stats in self.conn.execute(sql, params)]
+
+    def status(self) -> JsonDict:
+        """Row counts per table and the time of the last sync."""
+        counts = {table: self.conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                  for table in ('projects', 'project_stats', 'pages', 'sources', 'settings', 'plugins')}
+        last_sync = self.conn.execute('SELECT MAX(synced_at) FROM projects').fetchone()[0]
+        return {'path': self.path, 'size_bytes': os.path.getsize(self.path), 'last_sync': last_sync, **counts}
@@ -0,0 +1,996 @@
+#!/usr/bin/env python3
+"""
+Offline mock of the CustomGPT API, driven by an OpenAPI specification.
+
+Routes and response bodies come from the `paths` and schemas of the spec
+(by default the openapi.json bundled with this package). Projects, pages,
+conversations, messages, settings, plugins and sources are kept in memory so
+the CLI can be tested and benchmarked deterministically without network
+access. Pages are generated on demand, so seeded datasets of hundreds of
+thousands of pages cost no memory until they are modified.
+
+Faults can be injected to exercise the CLI's concurrency and retry handling:
+fixed or jittered latency, a fixed-window rate limit answered with 429 and
+Retry-After / X-RateLimit-* headers, and random 503 responses.
+
+Usage:
+    python -m customgpt_cli.mock_server --port 8080 --projects 3000 --pages-per-project 100
+    customgpt-cli --base-url http://127.0.0.1:8080 --api-key test list-projects
+"""
+
+import argparse
+import bisect
+import copy
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+SPEC_PATH = Path(__file__).with_name('openapi.json')
+
+# Base timestamp for generated records, so datasets are identical across runs
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Page IDs are project_id * PAGE_ID_STRIDE + page index + 1
+PAGE_ID_STRIDE = 1_000_000
+
+JsonDict = Dict[str, Any]
+
+
+def load_spec(path=None) -> JsonDict:
+    """Load an OpenAPI specification from path (default: the bundled openapi.json)."""
+    with open(path or SPEC_PATH, 'r') as f:
+        return json.load(f)
+
+
+def _timestamp(offset_minutes):
+    return (EPOCH + timedelta(minutes=offset_minutes)).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+
+
+class SchemaExamples:
+    """Build example values from OpenAPI schemas, resolving $ref pointers."""
+
+    def __init__(self, spec):
+        self.spec = spec
+
+    def resolve(self, node):
+        """Follow $ref pointers until a concrete schema or response is reached."""
+        while isinstance(node, dict) and '$ref' in node:
+            target = self.spec
+            for part in node['$ref'].lstrip('#/').split('/'):
+                target = target[part]
+            node = target
+        return node
+
+    def example(self, schema):
+        """Return an example value for a schema."""
+        schema = self.resolve(schema or {})
+        if 'example' in schema:
+            return copy.deepcopy(schema['example'])
+        for key in ('allOf', 'oneOf', 'anyOf'):
+            if key in schema:
+                parts = [self.example(part) for part in schema[key]]
+                if key == 'allOf' and all(isinstance(p, dict) for p in parts):
+                    merged = {}
+                    for part in parts:
+                        merged.update(part)
+                    return merged
+                return parts[0] if parts else None
+
+        schema_type = schema.get('type')
+        if schema_type == 'object' or 'properties' in schema:
+            return {name: self.example(prop) for name, prop in schema.get('properties', {}).items()}
+        if schema_type == 'array':
+            return [self.example(schema['items'])] if 'items' in schema else []
+        if 'default' in schema:
+            return copy.deepcopy(schema['default'])
+        if schema.get('enum'):
+            return schema['enum'][0]
+        return {'integer': 0, 'number': 0, 'boolean': False, 'string': ''}.get(schema_type)
+
+    def response(self, operation, status):
+        """Return the example JSON body for one of an operation's responses."""
+        response = self.resolve(operation.get('responses', {}).get(str(status), {}))
+        schema = response.get('content', {}).get('application/json', {}).get('schema')
+        return self.example(schema) if schema else {}
+
+    def schema(self, name):
+        """Return an example for a component schema by name."""
+        return self.example({'$ref': f'#/components/schemas/{name}'})
+
+
+class Route:
+    """A method and path template from the spec, matched against request paths."""
+
+    def __init__(self, method, template, operation):
+        self.method = method
+        self.template = template
+        self.operation = operation
+        self.pattern = re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', template) + '/?$')
+
+    def match(self, method, path):
+        if method != self.method:
+            return None
+        found = self.pattern.match(path)
+        return found.groupdict() if found else None
+
+
+class MockResponse:
+    """Status, headers and body of a mock response; body may be a chunk iterator for SSE."""
+
+    def __init__(self, status, body=None, headers=None, stream=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.stream = stream
+
+
+class MockAPI:
+    """
+    In-memory CustomGPT backend.
+
+    Every route of the spec is served. Routes with a handler below are
+    stateful; all others answer with the example body of their first 2xx
+    response.
+    """
+
+    # (method, path template) -> handler method name
+    HANDLERS = {
+        ('get', '/api/v1/projects'): 'list_projects',
+        ('post', '/api/v1/projects'): 'create_project',
+        ('get', '/api/v1/projects/{projectId}'): 'get_project',
+        ('post', '/api/v1/projects/{projectId}'): 'update_project',
+        ('delete', '/api/v1/projects/{projectId}'): 'delete_project',
+        ('post', '/api/v1/projects/{projectId}/replicate'): 'replicate_project',
+        ('get', '/api/v1/projects/{projectId}/stats'): 'project_stats',
+        ('get', '/api/v1/projects/{projectId}/pages'): 'list_pages',
+        ('delete', '/api/v1/projects/{projectId}/pages/{pageId}'): 'delete_page',
+        ('post', '/api/v1/projects/{projectId}/pages/{pageId}/reindex'): 'reindex_page',
+        ('get', '/api/v1/projects/{projectId}/pages/{pageId}/metadata'): 'get_page_metadata',
+        ('put', '/api/v1/projects/{projectId}/pages/{pageId}/metadata'): 'update_page_metadata',
+        ('get', '/api/v1/projects/{projectId}/settings'): 'get_settings',
+        ('post', '/api/v1/projects/{projectId}/settings'): 'update_settings',
+        ('get', '/api/v1/projects/{projectId}/plugins'): 'get_plugin',
+        ('post', '/api/v1/projects/{projectId}/plugins'): 'save_plugin',
+        ('put', '/api/v1/projects/{projectId}/plugins'): 'save_plugin',
+        ('get', '/api/v1/projects/{projectId}/conversations'): 'list_conversations',
+        ('post', '/api/v1/projects/{projectId}/conversations'): 'create_conversation',
+        ('put', '/api/v1/projects/{projectId}/conversations/{sessionId}'): 'update_conversation',
+        ('delete', '/api/v1/projects/{projectId}/conversations/{sessionId}'): 'delete_conversation',
+        ('get', '/api/v1/projects/{projectId}/conversations/{sessionId}/messages'): 'list_messages',
+        ('post', '/api/v1/projects/{projectId}/conversations/{sessionId}/messages'): 'send_message',
+        ('get', '/api/v1/projects/{projectId}/conversations/{sessionId}/messages/{promptId}'): 'get_message',
+        ('get', '/api/v1/user'): 'get_user',
+        ('post', '/api/v1/user'): 'update_user',
+        ('get', '/api/v1/projects/{projectId}/sources'): 'list_sources',
+        ('post', '/api/v1/projects/{projectId}/sources'): 'create_source',
+        ('delete', '/api/v1/projects/{projectId}/sources/{sourceId}'): 'delete_source',
+    }
+
+    def __init__(self, spec, projects=100, pages_per_project=50, conversations_per_project=5,
+                 messages_per_conversation=5, page_size=10, latency=0.0, latency_jitter=0.0,
+                 rate_limit=None, rate_window=60.0, error_rate=0.0, stream_delay=0.0, seed=0):
+        """
+        Args:
+            spec: Parsed OpenAPI specification
+            projects: Number of seeded projects
+            pages_per_project: Number of seeded pages per project
+            conversations_per_project: Number of seeded conversations per project
+            messages_per_conversation: Number of seeded messages per conversation
+            page_size: Items per page for every paginated listing
+            latency: Seconds added to every response
+            latency_jitter: Extra random latency of up to this many seconds
+            rate_limit: Requests allowed per rate window (default: unlimited)
+            rate_window: Length of the rate limit window in seconds
+            error_rate: Probability of answering a request with 503
+            stream_delay: Seconds between streamed message chunks
+            seed: Seed for generated data and injected faults
+        """
+        self.examples = SchemaExamples(spec)
+        self.routes = [
+            Route(method, template, operation)
+            for template, operations in spec.get('paths', {}).items()
+            for method, operation in operations.items()
+            if method in ('get', 'post', 'put', 'delete', 'patch')
+        ]
+        self.pages_per_project = pages_per_project
+        self.conversations_per_project = conversations_per_project
+        self.messages_per_conversation = messages_per_conversation
+        self.page_size = page_size
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_rate = error_rate
+        self.stream_delay = stream_delay
+        self.seed = seed
+
+        self.requests = Counter()  # (method, template) -> number of requests served
+        self._lock = threading.RLock()
+        self._rng = random.Random(seed)
+        self._window_started = time.monotonic()
+        self._window_count = 0
+
+        self.projects: Dict[int, JsonDict] = {}
+        self._next_project_id = 1
+        for _ in range(projects):
+            self._add_project()
+
+        self._page_counts: Dict[int, int] = {}
+        self._deleted_pages: Dict[int, List[int]] = {}
+        self._page_overrides: Dict[int, JsonDict] = {}
+        self._page_metadata: Dict[int, JsonDict] = {}
+        self._settings: Dict[int, JsonDict] = {}
+        self._plugins: Dict[int, JsonDict] = {}
+        self._sources: Dict[int, List[JsonDict]] = {}
+        self._conversations: Dict[int, List[JsonDict]] = {}
+        self._messages: Dict[str, List[JsonDict]] = {}
+        self._next_id = 1
+        self.user = self.examples.schema('User')
+
+    # Dispatch
+
+    def handle(self, method, path, query, headers, body) -> MockResponse:
+        """Route one request and apply authentication, injected faults and rate limit headers."""
+        if self.latency or self.latency_jitter:
+            with self._lock:
+                jitter = self._rng.uniform(0, self.latency_jitter)
+            time.sleep(self.latency + jitter)
+
+        for route in self.routes:
+            params = route.match(method, path)
+            if params is not None:
+                break
+        else:
+            return MockResponse(404, {'status': 'error', 'data': {'code': 404, 'message': 'Route not found'}})
+
+        with self._lock:
+            self.requests[(route.method, route.template)] += 1
+
+        rate_headers, retry_after = self._take_rate_limit()
+        if retry_after is not None:
+            return MockResponse(429, {'status': 'error', 'data': {'code': 429, 'message': 'Too Many Requests'}},
+                                headers={**rate_headers, 'Retry-After': str(retry_after)})
+
+        authorization = headers.get('Authorization', '')
+        if not authorization.startswith('Bearer ') or not authorization[len('Bearer '):].strip():
+            body_401 = self.examples.response(route.operation, 401) or {
+                'status': 'error', 'data': {'code': 401, 'message': 'API Token is either missing or invalid'}}
+            return MockResponse(401, body_401, headers=rate_headers)
+
+        with self._lock:
+            inject_error = self.error_rate and self._rng.random() < self.error_rate
+        if inject_error:
+            return MockResponse(503, {'status': 'error', 'data': {'code': 503, 'message': 'Service unavailable'}},
+                                headers=rate_headers)
+
+        handler = self.HANDLERS.get((route.method, route.template))
+        if handler is None:
+            response = self._example_response(route.operation)
+        else:
+            request = {'method': route.method, 'params': params, 'query': query, 'headers': headers, 'body': body,
+                       'operation': route.operation}
+            with self._lock:
+                response = getattr(self, handler)(request)
+        response.headers.update(rate_headers)
+        return response
+
+    def _take_rate_limit(self):
+        """Count a request against the fixed rate window; return (headers, retry_after or None)."""
+        if not self.rate_limit:
+            return {}, None
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_started >= self.rate_window:
+                self._window_started = now
+                self._window_count = 0
+            reset_in = max(1, math.ceil(self._window_started + self.rate_window - now))
+            if self._window_count >= self.rate_limit:
+                headers = {'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Remaining': '0',
+                           'X-RateLimit-Reset': str(reset_in)}
+                return headers, reset_in
+            self._window_count += 1
+            headers = {'X-RateLimit-Limit': str(self.rate_limit),
+                       'X-RateLimit-Remaining': str(self.rate_limit - self._window_count),
+                       'X-RateLimit-Reset': str(reset_in)}
+            return headers, None
+
+    def _example_response(self, operation):
+        statuses = sorted(code for code in operation.get('responses', {}) if code.startswith('2'))
+        status = int(statuses[0]) if statuses else 200
+        return MockResponse(status, self.examples.response(operation, status))
+
+    def _ok(self, request, data, status=200):
+        body = self.examples.response(request['operation'], status) or {'status': 'success'}
+        body['status'] = 'success'
+        body['data'] = data
+        return MockResponse(status, body)
+
+    def _not_found(self, request, message):
+        body = self.examples.response(request['operation'], 404) or {'status': 'error', 'data': {}}
+        body['status'] = 'error'
+        body['data'] = {'code': 404, 'message': message}
+        return MockResponse(404, body)
+
+    def _paginate(self, total, page, get_item, path):
+        """Build a Laravel-style paginator over `total` items fetched by index."""
+        last_page = max(1, math.ceil(total / self.page_size))
+        start = (page - 1) * self.page_size
+        end = min(start + self.page_size, total)
+        items = [get_item(i) for i in range(start, end)] if start < total else []
+        return {
+            'current_page': page,
+            'data': items,
+            'first_page_url': f'{path}?page=1',
+            'from': start + 1 if items else None,
+            'last_page': last_page,
+            'last_page_url': f'{path}?page={last_page}',
+            'next_page_url': f'{path}?page={page + 1}' if page < last_page else None,
+            'path': path,
+            'per_page': self.page_size,
+            'prev_page_url': f'{path}?page={page - 1}' if page > 1 else None,
+            'to': end if items else None,
+            'total': total,
+        }
+
+    @staticmethod
+    def _int_param(request, name, default=1):
+        try:
+            return max(1, int(request['query'].get(name, default)))
+        except (TypeError, ValueError):
+            return default
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    # Projects
+
+    def _add_project(self, name=None, sitemap_path=None, project_type='SITEMAP'):
+        project_id = self._next_project_id
+        self._next_project_id += 1
+        project = self.examples.schema('Project')
+        project.update({
+            'id': project_id,
+            'project_name': name or f'Mock Project {project_id}',
+            'sitemap_path': sitemap_path if sitemap_path is not None else f'https://example.com/{project_id}/sitemap.xml',
+            'is_chat_active': 1,
+            'created_at': _timestamp(project_id * 60),
+            'updated_at': _timestamp(project_id * 90),
+            'deleted_at': None,
+            'type': project_type,
+            'is_shared': 0,
+            'shareable_slug': hashlib.md5(str(project_id).encode()).hexdigest(),
+        })
+        self.projects[project_id] = project
+        return project
+
+    def _project(self, request):
+        try:
+            return self.projects.get(int(request['params']['projectId']))
+        except (TypeError, ValueError):
+            return None
+
+    def list_projects(self, request):
+        projects = list(self.projects.values())
+        name = request['query'].get('name')
+        if name:
+            projects = [p for p in projects if name.lower() in p['project_name'].lower()]
+        if request['query'].get('order', 'desc') == 'desc':
+            projects.reverse()
+        page = self._int_param(request, 'page')
+        return self._ok(request, self._paginate(len(projects), page, lambda i: projects[i], '/api/v1/projects'))
+
+    def create_project(self, request):
+        body = request['body']
+        if not body.get('project_name'):
+            return MockResponse(400, {'status': 'error', 'data': {'code': 400, 'message': 'project_name is required'}})
+        project_type = 'UPLOAD' if body.get('file') is not None else 'SITEMAP'
+        project = self._add_project(body['project_name'], body.get('sitemap_path'), project_type)
+        return self._ok(request, project, status=201)
+
+    def get_project(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        return self._ok(request, project)
+
+    def update_project(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        for field in ('project_name', 'is_shared', 'sitemap_path'):
+            if field in request['body']:
+                project[field] = request['body'][field]
+        project['updated_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+        return self._ok(request, project)
+
+    def delete_project(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        del self.projects[project['id']]
+        return self._ok(request, {'deleted': True})
+
+    def replicate_project(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        replica = self._add_project(f"{project['project_name']} (copy)", project['sitemap_path'], project['type'])
+        return self._ok(request, replica, status=201)
+
+    def project_stats(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        rng = random.Random(self.seed * 7919 + project['id'])
+        pages = self._page_count(project['id'])
+        data = self.examples.response(request['operation'], 200).get('data') or {}
+        data.update({
+            'pages_found': pages,
+            'pages_crawled': pages,
+            'pages_indexed': pages,
+            'crawl_credits_used': pages,
+            'query_credits_used': rng.randint(0, 5000),
+            'index_credits_used': pages,
+            'total_words_indexed': pages * rng.randint(100, 2000),
+            'total_storage_credits_used': rng.randint(0, 1000),
+            'total_queries': rng.randint(0, 5000),
+        })
+        return self._ok(request, data)
+
+    # Pages
+
+    def _page_count(self, project_id):
+        return self._page_counts.get(project_id, self.pages_per_project) - len(self._deleted_pages.get(project_id, []))
+
+    def _page_index(self, project_id, n):
+        """Map the n-th live page of a project to its generated page index, skipping deleted pages."""
+        deleted = self._deleted_pages.get(project_id, [])
+        index = n
+        while True:
+            shifted = n + bisect.bisect_right(deleted, index)
+            if shifted == index:
+                return index
+            index = shifted
+
+    def _page(self, project_id, index):
+        page_id = project_id * PAGE_ID_STRIDE + index + 1
+        if page_id in self._page_overrides:
+            return self._page_overrides[page_id]
+        page = self.examples.schema('Page')
+        page_url = f'https://example.com/{project_id}/page-{index + 1}'
+        page.update({
+            'id': page_id,
+            'page_url': page_url,
+            'page_url_hash': hashlib.md5(page_url.encode()).hexdigest(),
+            'project_id': project_id,
+            's3_path': None,
+            'crawl_status': 'ok',
+            'index_status': 'ok',
+            'is_file': False,
+            'filename': None,
+            'filesize': None,
+            'created_at': _timestamp(project_id * 60 + index),
+            'updated_at': _timestamp(project_id * 60 + index),
+            'deleted_at': None,
+        })
+        return page
+
+    def _find_page(self, request):
+        project = self._project(request)
+        try:
+            page_id = int(request['params']['pageId'])
+        except (TypeError, ValueError):
+            return project, None
+        if not project or page_id // PAGE_ID_STRIDE != project['id']:
+            return project, None
+        index = page_id % PAGE_ID_STRIDE - 1
+        total = self._page_counts.get(project['id'], self.pages_per_project)
+        deleted = self._deleted_pages.get(project['id'], [])
+        position = bisect.bisect_left(deleted, index)
+        if index < 0 or index >= total or (position < len(deleted) and deleted[position] == index):
+            return project, None
+        return project, index
+
+    def list_pages(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        project_id = project['id']
+        total = self._page_count(project_id)
+        descending = request['query'].get('order', 'desc') == 'desc'
+
+        def get_item(n):
+            position = total - 1 - n if descending else n
+            return self._page(project_id, self._page_index(project_id, position))
+
+        page = self._int_param(request, 'page')
+        path = f'/api/v1/projects/{project_id}/pages'
+        return self._ok(request, {'project': project, 'pages': self._paginate(total, page, get_item, path)})
+
+    def delete_page(self, request):
+        project, index = self._find_page(request)
+        if index is None:
+            return self._not_found(request, 'Page not found')
+        bisect.insort(self._deleted_pages.setdefault(project['id'], []), index)
+        self._page_overrides.pop(project['id'] * PAGE_ID_STRIDE + index + 1, None)
+        return self._ok(request, {'deleted': True})
+
+    def reindex_page(self, request):
+        project, index = self._find_page(request)
+        if index is None:
+            return self._not_found(request, 'Page not found')
+        page = self._page(project['id'], index)
+        page.update({'crawl_status': 'queued', 'index_status': 'queued',
+                     'updated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000000Z')})
+        self._page_overrides[page['id']] = page
+        return self._ok(request, {'updated': True})
+
+    def _metadata(self, project_id, index):
+        page = self._page(project_id, index)
+        metadata = self._page_metadata.get(page['id'])
+        if metadata is None:
+            metadata = {'id': page['id'], 'url': page['page_url'], 'title': f'Page {index + 1}',
+                        'description': f'Generated page {index + 1} of project {project_id}', 'image': None}
+        return metadata
+
+    def get_page_metadata(self, request):
+        project, index = self._find_page(request)
+        if index is None:
+            return self._not_found(request, 'Page not found')
+        return self._ok(request, self._metadata(project['id'], index))
+
+    def update_page_metadata(self, request):
+        project, index = self._find_page(request)
+        if index is None:
+            return self._not_found(request, 'Page not found')
+        metadata = dict(self._metadata(project['id'], index))
+        for field in ('title', 'url', 'description', 'image'):
+            if field in request['body']:
+                metadata[field] = request['body'][field]
+        self._page_metadata[metadata['id']] = metadata
+        return self._ok(request, metadata)
+
+    # Settings and plugins
+
+    def _project_settings(self, project_id):
+        settings = self._settings.get(project_id)
+        if settings is None:
+            settings = self.examples.schema('ProjectSettings')
+            settings['default_prompt'] = 'Ask Me Anything ...'  # default of newly created projects
+            self._settings[project_id] = settings
+        return settings
+
+    def get_settings(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        return self._ok(request, self._project_settings(project['id']))
+
+    def update_settings(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        settings = self._project_settings(project['id'])
+        for field, value in request['body'].items():
+            if field.endswith('_name') and isinstance(request['body'].get(field[:-len('_name')]), bytes):
+                continue  # file name of an uploaded image
+            if isinstance(value, bytes):
+                value = f'https://example.com/{project["id"]}/{field}.png'
+            elif isinstance(settings.get(field), bool) and value in ('true', 'false'):
+                value = value == 'true'  # multipart form values arrive as strings
+            elif isinstance(settings.get(field), int) and isinstance(value, str) and value.isdigit():
+                value = int(value)
+            settings[field] = value
+        return self._ok(request, {'updated': True})
+
+    def get_plugin(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        plugin = self._plugins.setdefault(project['id'], self.examples.schema('ProjectPlugin'))
+        return self._ok(request, plugin)
+
+    def save_plugin(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        plugin = self._plugins.setdefault(project['id'], self.examples.schema('ProjectPlugin'))
+        plugin.update({k: v for k, v in request['body'].items() if k in plugin})
+        return self._ok(request, plugin, status=201 if request['method'] == 'post' else 200)
+
+    # User
+
+    def get_user(self, request):
+        return self._ok(request, self.user)
+
+    def update_user(self, request):
+        if 'name' in request['body']:
+            self.user['name'] = request['body']['name']
+        if isinstance(request['body'].get('profile_photo'), bytes):
+            self.user['profile_photo_url'] = 'https://example.com/profile.png'
+        return self._ok(request, self.user)
+
+    # Sources
+
+    def list_sources(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        sources = self._sources.get(project['id'], [])
+        return self._ok(request, {
+            'sitemaps': [s for s in sources if s['type'] == 'sitemap'],
+            'uploads': {'id': None, 'type': 'upload', 'settings': {},
+                        'created_at': project['created_at'], 'updated_at': project['updated_at'],
+                        'pages': [p for s in sources if s['type'] == 'upload' for p in s['pages']]},
+        })
+
+    def create_source(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        body = request['body']
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+        project_id = project['id']
+        index = self._page_counts.get(project_id, self.pages_per_project)
+        self._page_counts[project_id] = index + 1
+        page = self._page(project_id, index)
+        source = {'id': self._new_id(), 'created_at': now, 'updated_at': now, 'settings': {}, 'pages': [page]}
+        if body.get('file') is not None:
+            source['type'] = 'upload'
+            page.update({'is_file': True, 'filename': body.get('file_name') or 'upload',
+                         'filesize': len(body['file']) if isinstance(body['file'], bytes) else None})
+        else:
+            source['type'] = 'sitemap'
+            source['sitemap_path'] = body.get('sitemap_path')
+        self._page_overrides[page['id']] = page
+        self._sources.setdefault(project_id, []).append(source)
+        return self._ok(request, source, status=201)
+
+    def delete_source(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        sources = self._sources.get(project['id'], [])
+        for source in sources:
+            if str(source['id']) == request['params']['sourceId']:
+                sources.remove(source)
+                return self._ok(request, {'deleted': True})
+        return self._not_found(request, 'Source not found')
+
+    # Conversations and messages
+
+    def _project_conversations(self, project_id):
+        conversations = self._conversations.get(project_id)
+        if conversations is None:
+            rng = random.Random(self.seed * 104729 + project_id)
+            conversations = []
+            for i in range(self.conversations_per_project):
+                conversations.append(self._new_conversation(project_id, f'Conversation {i + 1}',
+                                                            str(uuid.UUID(int=rng.getrandbits(128))),
+                                                            _timestamp(project_id * 60 + i)))
+            self._conversations[project_id] = conversations
+        return conversations
+
+    def _new_conversation(self, project_id, name, session_id, created_at):
+        conversation = self.examples.schema('Conversation')
+        conversation.update({'id': self._new_id(), 'name': name, 'project_id': project_id,
+                             'session_id': session_id, 'created_at': created_at,
+                             'updated_at': created_at, 'deleted_at': None})
+        return conversation
+
+    def _find_conversation(self, request):
+        project = self._project(request)
+        if not project:
+            return project, None
+        for conversation in self._project_conversations(project['id']):
+            if conversation['session_id'] == request['params']['sessionId']:
+                return project, conversation
+        return project, None
+
+    def _conversation_messages(self, conversation):
+        messages = self._messages.get(conversation['session_id'])
+        if messages is None:
+            messages = [self._new_message(conversation, f'Question {i + 1}', conversation['created_at'])
+                        for i in range(self.messages_per_conversation)]
+            self._messages[conversation['session_id']] = messages
+        return messages
+
+    def _new_message(self, conversation, prompt, created_at):
+        message = self.examples.schema('PromptHistory')
+        message.update({'id': self._new_id(), 'user_query': prompt,
+                        'openai_response': self._answer(prompt),
+                        'conversation_id': conversation['id'], 'citations': [self._next_id],
+                        'created_at': created_at, 'updated_at': created_at})
+        return message
+
+    @staticmethod
+    def _answer(prompt):
+        return f'This is a mock answer to: {prompt}'
+
+    def list_conversations(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        conversations = list(self._project_conversations(project['id']))
+        if request['query'].get('order', 'desc') == 'desc':
+            conversations.reverse()
+        page = self._int_param(request, 'page')
+        path = f"/api/v1/projects/{project['id']}/conversations"
+        return self._ok(request, self._paginate(len(conversations), page, lambda i: conversations[i], path))
+
+    def create_conversation(self, request):
+        project = self._project(request)
+        if not project:
+            return self._not_found(request, 'Project not found')
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+        conversation = self._new_conversation(project['id'], request['body'].get('name') or 'New Conversation',
+                                              str(uuid.uuid4()), now)
+        self._project_conversations(project['id']).append(conversation)
+        self._messages[conversation['session_id']] = []
+        return self._ok(request, conversation, status=201)
+
+    def update_conversation(self, request):
+        project, conversation = self._find_conversation(request)
+        if not conversation:
+            return self._not_found(request, 'Conversation not found')
+        if 'name' in request['body']:
+            conversation['name'] = request['body']['name']
+        return self._ok(request, conversation)
+
+    def delete_conversation(self, request):
+        project, conversation = self._find_conversation(request)
+        if not conversation:
+            return self._not_found(request, 'Conversation not found')
+        self._conversations[project['id']].remove(conversation)
+        self._messages.pop(conversation['session_id'], None)
+        return self._ok(request, {'deleted': True})
+
+    def list_messages(self, request):
+        project, conversation = self._find_conversation(request)
+        if not conversation:
+            return self._not_found(request, 'Conversation not found')
+        messages = list(self._conversation_messages(conversation))
+        if request['query'].get('order', 'desc') == 'desc':
+            messages.reverse()
+        page = self._int_param(request, 'page')
+        path = f"/api/v1/projects/{project['id']}/conversations/{conversation['session_id']}/messages"
+        return self._ok(request, {'conversation': conversation,
+                                  'messages': self._paginate(len(messages), page, lambda i: messages[i], path)})
+
+    def get_message(self, request):
+        project, conversation = self._find_conversation(request)
+        if not conversation:
+            return self._not_found(request, 'Conversation not found')
+        for message in self._conversation_messages(conversation):
+            if str(message['id']) == request['params']['promptId']:
+                return self._ok(request, message)
+        return self._not_found(request, 'Message not found')
+
+    def send_message(self, request):
+        project, conversation = self._find_conversation(request)
+        if not conversation:
+            return self._not_found(request, 'Conversation not found')
+        prompt = request['body'].get('prompt')
+        if not prompt:
+            return MockResponse(400, {'status': 'error', 'data': {'code': 400, 'message': 'prompt is required'}})
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000000Z')
+        message = self._new_message(conversation, prompt, now)
+        self._conversation_messages(conversation).append(message)
+        conversation['updated_at'] = now
+
+        stream = request['query'].get('stream', request['body'].get('stream', 0))
+        wants_stream = (str(stream).lower() in ('1', 'true')
+                        or 'text/event-stream' in request['headers'].get('Accept', ''))
+        if not wants_stream:
+            return self._ok(request, message)
+        return MockResponse(200, headers={'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache'},
+                            stream=self._stream_events(message))
+
+    def _stream_events(self, message):
+        """Yield SSE chunks: one progress event per word, then a finish event."""
+        words = message['openai_response'].split(' ')
+        for i, word in enumerate(words):
+            if self.stream_delay:
+                time.sleep(self.stream_delay)
+            text = word if i == 0 else ' ' + word
+            yield f"data: {json.dumps({'status': 'progress', 'message': text})}\n\n".encode()
+        finish = {'status': 'finish', 'id': message['id'], 'citations': message['citations']}
+        yield f"data: {json.dumps(finish)}\n\n".encode()
+
+
+def parse_body(headers, raw) -> JsonDict:
+    """Parse a JSON, urlencoded or multipart request body into a dict (file parts become bytes)."""
+    content_type = headers.get('Content-Type', '')
+    if not raw:
+        return {}
+    if 'application/json' in content_type:
+        try:
+            body = json.loads(raw)
+        except json.JSONDecodeError:
+            return {}
+        return body if isinstance(body, dict) else {}
+    if 'multipart/form-data' in content_type:
+        message = BytesParser(policy=policy.default).parsebytes(f'Content-Type: {content_type}\r\n\r\n'.encode() + raw)
+        body = {}
+        for part in message.iter_parts() if message.is_multipart() else []:
+            name = part.get_param('name', header='content-disposition')
+            if not name:
+                continue
+            payload = part.get_payload(decode=True) or b''
+            filename = part.get_filename()
+            if filename:
+                body[name] = payload
+                body[f'{name}_name'] = filename
+            else:
+                _set_form_field(body, name, payload.decode('utf-8', errors='replace'))
+        return body
+    if 'application/x-www-form-urlencoded' in content_type:
+        body = {}
+        for name, values in parse_qs(raw.decode('utf-8', errors='replace')).items():
+            _set_form_field(body, name, values[0])
+        return body
+    return {}
+
+
+def _set_form_field(body, name, value):
+    """Store a form field, collecting PHP-style `name[0]`, `name[1]` fields into a list."""
+    array_field = re.match(r'^(\w+)\[\d*\]$', name)
+    if array_field:
+        body.setdefault(array_field.group(1), []).append(value)
+    else:
+        body[name] = value
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that forwards requests to the server's MockAPI."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without TCP_NODELAY, keep-alive
+    # connections stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        url = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        response = self.server.api.handle(self.command.lower(), url.path, query, self.headers,
+                                          parse_body(self.headers, raw))
+
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        if response.stream is not None:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in response.stream:
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+                self.wfile.flush()
+            self.wfile.write(b'0\r\n\r\n')
+            return
+        payload = json.dumps(response.body).encode()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockServer:
+    """
+    Threaded HTTP server around a MockAPI, usable as a context manager.
+
+    Example:
+        with MockServer(projects=3000) as server:
+            CustomGPT.base_url = server.url
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, spec_path=None, verbose=False, **options):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            spec_path: OpenAPI specification (default: the bundled openapi.json)
+            verbose: Log every request to stderr
+            **options: MockAPI options (dataset sizes, latency and fault injection)
+        """
+        self.api = MockAPI(load_spec(spec_path), **options)
+        self.httpd = ThreadingHTTPServer((host, port), MockRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self.api
+        self.httpd.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Offline mock CustomGPT API server')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--spec', help='OpenAPI specification to serve (default: bundled openapi.json)')
+    parser.add_argument('--projects', type=int, default=100, help='Number of seeded projects (default: 100)')
+    parser.add_argument('--pages-per-project', type=int, default=50, help='Seeded pages per project (default: 50)')
+    parser.add_argument('--conversations-per-project', type=int, default=5,
+                        help='Seeded conversations per project (default: 5)')
+    parser.add_argument('--messages-per-conversation', type=int, default=5,
+                        help='Seeded messages per conversation (default: 5)')
+    parser.add_argument('--page-size', type=int, default=10, help='Items per page in listings (default: 10)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help='Extra random latency of up to N seconds')
+    parser.add_argument('--rate-limit', type=int, help='Requests allowed per rate window (default: unlimited)')
+    parser.add_argument('--rate-window', type=float, default=60.0, help='Rate limit window in seconds (default: 60)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of answering with 503')
+    parser.add_argument('--stream-delay', type=float, default=0.0, help='Seconds between streamed message chunks')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for generated data and faults (default: 0)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args(argv)
+
+    server = MockServer(
+        host=args.host,
+        port=args.port,
+        spec_path=args.spec,
+        verbose=args.verbose,
+        projects=args.projects,
+        pages_per_project=args.pages_per_project,
+        conversations_per_project=args.conversations_per_project,
+        messages_per_conversation=args.messages_per_conversation,
+        page_size=args.page_size,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        error_rate=args.error_rate,
+        stream_delay=args.stream_delay,
+        seed=args.seed,
+    )
+    print(f'Mock CustomGPT API listening on {server.url}')
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ setup(
     name="customgpt-cli",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"customgpt_cli": ["openapi.json"]},
     install_requires=[
         "customgpt-client>=1.1.6",
         "tabulate>=0.9.0",
@@ -11,6 +12,7 @@ setup(
     entry_points={
         "console_scripts": [
             "customgpt-cli=customgpt_cli.cli:main",
+            "customgpt-mock-server=customgpt_cli.mock_server:main",
         ],
     },
 )
@@ -76,6 +76,17 @@ customgpt-cli send-message \
 # 12a. Test streaming mode 
 customgpt-cli send-message --project-id $PROJECT_ID --session-id $SESSION_ID --prompt "Write a story" --stream
 
+# 12b. Test streaming mode with latency metrics
+customgpt-cli send-message --project-id $PROJECT_ID --session-id $SESSION_ID --prompt "Write a story" --stream --timings --format json
+
+# 12c. Test batch send (one line reuses the session, one creates a new conversation)
+printf '{"project_id": %s, "session_id": "%s", "prompt": "Hello"}\n{"project_id": %s, "prompt": "Explain agile"}\n' \
+    $PROJECT_ID $SESSION_ID $PROJECT_ID | customgpt-cli batch-send --concurrency 2
+
+# 12d. Test chat benchmark (closed loop, then open loop with streaming)
+customgpt-cli bench-chat --project-id $PROJECT_ID --session-id $SESSION_ID --requests 3 --concurrency 2
+customgpt-cli bench-chat --project-id $PROJECT_ID --session-id $SESSION_ID --rate 1 --duration 3 --stream --format json
+
 # 13. Delete the conversation
 customgpt-cli delete-conversation --project-id $PROJECT_ID --session-id $SESSION_ID --force
 
@@ -0,0 +1,100 @@
+"""
+Daemon tests: commands forwarded over the Unix socket behave like local runs.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from customgpt_cli.mock_server import MockServer
+
+SHOW_PROJECT = ('get', '/api/v1/projects/{projectId}')
+REINDEX_PAGE = ('post', '/api/v1/projects/{projectId}/pages/{pageId}/reindex')
+DELETE_PAGE = ('delete', '/api/v1/projects/{projectId}/pages/{pageId}')
+UPDATE_PAGE_METADATA = ('put', '/api/v1/projects/{projectId}/pages/{pageId}/metadata')
+
+
+def cli(*args, env=None, cwd=None, input=None):
+    return subprocess.run([sys.executable, '-m', 'customgpt_cli.cli', *args], env=env, cwd=cwd,
+                          capture_output=True, text=True, input=input)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    socket_path = str(tmp_path / 'cli.sock')
+    with MockServer(projects=5) as server:
+        process = subprocess.Popen([sys.executable, '-m', 'customgpt_cli.cli', '--api-key', 'daemon-key',
+                                    '--base-url', server.url, 'serve', '--socket', socket_path])
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        env = {k: v for k, v in os.environ.items() if not k.startswith('CUSTOMGPT_')}
+        env['CUSTOMGPT_CLI_SOCKET'] = socket_path
+        yield server, env
+        process.terminate()
+        process.wait(timeout=10)
+    assert not os.path.exists(socket_path)
+
+
+def test_forwarded_command_uses_daemon_credentials(daemon):
+    server, env = daemon
+    result = cli('show-project', '--project-id', '2', '--format', 'json', env=env)
+    assert result.returncode == 0
+    assert '"project_name": "Mock Project 2"' in result.stdout
+    assert server.api.requests[SHOW_PROJECT] == 1
+
+
+def test_forwarded_exit_codes_and_stderr(daemon):
+    server, env = daemon
+    result = cli('show-project', env=env)
+    assert result.returncode == 2
+    assert 'required: --project-id' in result.stderr
+
+
+def test_relative_paths_resolve_in_client_directory(daemon, tmp_path):
+    server, env = daemon
+    (tmp_path / 'notes.txt').write_text('hello')
+    result = cli('create-project', '--name', 'Uploaded', '--file', 'notes.txt', '--format', 'json',
+                 env=env, cwd=tmp_path)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert any(p['project_name'] == 'Uploaded' and p['type'] == 'UPLOAD' for p in server.api.projects.values())
+
+
+def test_falls_back_to_local_run_without_daemon(tmp_path):
+    with MockServer(projects=1) as server:
+        env = dict(os.environ, CUSTOMGPT_CLI_SOCKET=str(tmp_path / 'missing.sock'),
+                   CUSTOMGPT_API_KEY='local-key', CUSTOMGPT_BASE_URL=server.url)
+        result = cli('show-project', '--project-id', '1', '--format', 'json', env=env)
+    assert result.returncode == 0
+    assert '"project_name": "Mock Project 1"' in result.stdout
+
+
+def test_reindex_pages_from_stdin_runs_locally(daemon):
+    server, env = daemon
+    result = cli('--api-key', 'local-key', '--base-url', server.url, 'reindex-pages', '--project-id', '3',
+                 '--page-ids-file', '-', env=env, input='3000001\n3000002\n')
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'Reindexed 2 pages' in result.stdout
+    assert server.api.requests[REINDEX_PAGE] == 2
+
+
+def test_delete_pages_from_stdin_runs_locally(daemon):
+    server, env = daemon
+    result = cli('--api-key', 'local-key', '--base-url', server.url, 'delete-pages', '--project-id', '4',
+                 '--page-ids-file', '-', '--force', env=env, input='4000001\n4000002\n')
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert len(result.stdout.splitlines()) == 2
+    assert server.api.requests[DELETE_PAGE] == 2
+
+
+def test_sync_page_metadata_from_stdin_runs_locally(daemon):
+    server, env = daemon
+    result = cli('--api-key', 'local-key', '--base-url', server.url, 'sync-page-metadata', '--project-id', '5',
+                 '--input', '-', env=env, input='page_id,title\n5000001,Renamed\n')
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert 'Updated 1 pages, 0 unchanged, 0 failed' in result.stdout
+    assert server.api.requests[UPDATE_PAGE_METADATA] == 1
@@ -0,0 +1,450 @@
+"""
+CLI tests against the offline mock server.
+
+Run with: python -m pytest customgpt-cli/tests
+"""
+
+import gzip
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from customgpt_cli.cli import CustomGPT, CustomGPTCLI
+from customgpt_cli.mock_server import MockResponse, MockServer
+
+LIST_PROJECTS = ('get', '/api/v1/projects')
+PROJECT_STATS = ('get', '/api/v1/projects/{projectId}/stats')
+PROJECT_DETAIL = ('get', '/api/v1/projects/{projectId}')
+PAGES = ('get', '/api/v1/projects/{projectId}/pages')
+PAGE_METADATA = ('get', '/api/v1/projects/{projectId}/pages/{pageId}/metadata')
+UPDATE_PAGE_METADATA = ('put', '/api/v1/projects/{projectId}/pages/{pageId}/metadata')
+PROJECT_SETTINGS = ('get', '/api/v1/projects/{projectId}/settings')
+UPDATE_PROJECT_SETTINGS = ('post', '/api/v1/projects/{projectId}/settings')
+REINDEX_PAGE = ('post', '/api/v1/projects/{projectId}/pages/{pageId}/reindex')
+CREATE_SOURCE = ('post', '/api/v1/projects/{projectId}/sources')
+DELETE_PAGE = ('delete', '/api/v1/projects/{projectId}/pages/{pageId}')
+LIST_MESSAGES = ('get', '/api/v1/projects/{projectId}/conversations/{sessionId}/messages')
+
+
+def run_cli(server, monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, 'argv', ['customgpt-cli', '--api-key', 'test', '--base-url', server.url, *args])
+    CustomGPTCLI().run()
+    return capsys.readouterr().out
+
+
+@pytest.fixture
+def server():
+    with MockServer(projects=35, pages_per_project=25) as server:
+        yield server
+
+
+def test_list_projects_concurrent_pages_keep_order(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'list-projects', '--format', 'id-only', '--concurrency', '4')
+    assert out.split() == [str(i) for i in range(35, 0, -1)]
+    assert server.api.requests[LIST_PROJECTS] == 4
+
+
+def test_stats_filter_fetches_each_project_once(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'list-projects', '--min-queries', '2500', '--format', 'ndjson')
+    projects = [json.loads(line) for line in out.splitlines()]
+    assert projects and all(p['stats']['total_queries'] >= 2500 for p in projects)
+    assert server.api.requests[PROJECT_STATS] == 35
+
+
+def test_rate_limit_is_retried(monkeypatch, capsys):
+    with MockServer(projects=3, rate_limit=2, rate_window=1) as server:
+        out = run_cli(server, monkeypatch, capsys, 'show-project', '--project-id', '1', '--format', 'json')
+        out += run_cli(server, monkeypatch, capsys, 'show-project', '--project-id', '2', '--format', 'json')
+        out += run_cli(server, monkeypatch, capsys, 'show-project', '--project-id', '3', '--format', 'json')
+    assert '"project_name": "Mock Project 3"' in out
+    assert server.api.requests[PROJECT_DETAIL] == 4  # third call is rejected once with 429
+
+
+def test_server_errors_exhaust_retries(monkeypatch, capsys):
+    with MockServer(projects=1, error_rate=1.0) as server:
+        run_cli(server, monkeypatch, capsys, '--max-retries', '2', 'project-stats', '--project-id', '1')
+    assert server.api.requests[PROJECT_STATS] == 3
+
+
+def test_streamed_message(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'create-conversation', '--project-id', '1', '--name', 'Test',
+                  '--format', 'json')
+    session_id = json.loads(out)['data']['session_id']
+    out = run_cli(server, monkeypatch, capsys, 'send-message', '--project-id', '1', '--session-id', session_id,
+                  '--prompt', 'Hello', '--stream')
+    assert 'This is a mock answer to: Hello' in out
+
+
+def test_api_calls_reuse_pooled_connections(server, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['customgpt-cli', '--api-key', 'test', '--base-url', server.url,
+                                      '--transport-stats', 'list-projects', '--format', 'id-only',
+                                      '--concurrency', '1'])
+    CustomGPTCLI().run()
+    assert 'HTTP connections: 1 opened, 3 reused (4 requests)' in capsys.readouterr().err
+
+
+def test_file_upload_is_streamed(server, monkeypatch, capsys, tmp_path):
+    upload = tmp_path / 'manual.pdf'
+    upload.write_bytes(b'%PDF' + b'x' * 3_000_000)
+    monkeypatch.setattr(sys, 'argv', ['customgpt-cli', '--api-key', 'test', '--base-url', server.url,
+                                      'create-source', '--project-id', '1', '--file', str(upload)])
+    CustomGPTCLI().run()
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)['data']['pages'][0]['filesize'] == 3_000_004
+    assert captured.err.startswith('Uploaded manual.pdf: 2.9 MB in ')
+
+
+def test_ingest_dir_uploads_only_changes(server, monkeypatch, capsys, tmp_path):
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        (tmp_path / name).write_text(name)
+    ingest = ('ingest-dir', '--project-id', '1', '--hash-workers', '2', '--delete-removed', str(tmp_path))
+    assert 'Ingest complete: 3 uploaded, 0 deleted' in run_cli(server, monkeypatch, capsys, *ingest)
+    assert 'Ingest complete: 0 uploaded, 0 deleted, 3 unchanged' in run_cli(server, monkeypatch, capsys, *ingest)
+
+    (tmp_path / 'b.txt').write_text('changed')
+    (tmp_path / 'c.txt').unlink()
+    out = run_cli(server, monkeypatch, capsys, *ingest)
+    assert 'Ingest complete: 1 uploaded, 1 deleted, 1 unchanged' in out
+    assert server.api.requests[CREATE_SOURCE] == 4
+    assert server.api.requests[DELETE_PAGE] == 2  # removed file and the old version of the changed one
+
+
+def test_export_conversations_to_gzip(server, monkeypatch, capsys, tmp_path):
+    output = tmp_path / 'export.jsonl.gz'
+    run_cli(server, monkeypatch, capsys, 'export-conversations', '--project-id', '2', '--output', str(output))
+    records = [json.loads(line) for line in gzip.open(output, 'rt')]
+    assert [r['conversation']['name'] for r in records] == [f'Conversation {i}' for i in range(1, 6)]
+    assert [m['user_query'] for m in records[0]['messages']] == [f'Question {i}' for i in range(1, 6)]
+
+
+def test_export_conversations_fails_on_missing_project(server, monkeypatch, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(server, monkeypatch, capsys, 'export-conversations', '--project-id', '999')
+    assert excinfo.value.code == 1
+    assert 'the export is incomplete' in capsys.readouterr().err
+
+
+def test_changes_emits_only_new_records(server, monkeypatch, capsys, tmp_path):
+    changes = ('changes', '--project-id', '3', '--state', str(tmp_path / 'state.json'))
+    records = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *changes).splitlines()]
+    assert [r['type'] for r in records].count('conversation') == 5
+    assert [r['type'] for r in records].count('message') == 25
+    fetched = server.api.requests[LIST_MESSAGES]
+    assert run_cli(server, monkeypatch, capsys, *changes) == ''
+    assert server.api.requests[LIST_MESSAGES] == fetched
+
+    old_session = records[0]['data']['session_id']
+    run_cli(server, monkeypatch, capsys, 'send-message', '--project-id', '3', '--session-id', old_session,
+            '--prompt', 'Follow-up')
+    out = run_cli(server, monkeypatch, capsys, 'create-conversation', '--project-id', '3', '--name', 'New',
+                  '--format', 'json')
+    new_session = json.loads(out)['data']['session_id']
+    run_cli(server, monkeypatch, capsys, 'send-message', '--project-id', '3', '--session-id', new_session,
+            '--prompt', 'First')
+
+    records = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *changes).splitlines()]
+    assert [(r['type'], r.get('session_id')) for r in records] == [
+        ('message', old_session), ('conversation', None), ('message', new_session)]
+    assert records[0]['data']['user_query'] == 'Follow-up'
+
+
+def test_list_projects_from_mirror_matches_live(server, monkeypatch, capsys, tmp_path):
+    mirror = str(tmp_path / 'mirror.sqlite3')
+    assert 'Mirrored 35 projects' in run_cli(server, monkeypatch, capsys, 'mirror', 'sync', '--mirror', mirror)
+    assert server.api.requests[PAGES] == 35 * 3
+
+    filters = ('list-projects', '--min-queries', '2500', '--name-filter', 'project 1', '--format', 'json')
+    live = run_cli(server, monkeypatch, capsys, *filters)
+    requests = sum(server.api.requests.values())
+    assert run_cli(server, monkeypatch, capsys, *filters, '--from-mirror', '--mirror', mirror) == live
+    assert sum(server.api.requests.values()) == requests
+
+    stats_requests = server.api.requests[PROJECT_STATS]
+    run_cli(server, monkeypatch, capsys, 'mirror', 'sync', '--mirror', mirror)
+    assert server.api.requests[PAGES] == 35 * 3  # unchanged projects only refresh stats
+    assert server.api.requests[PROJECT_STATS] == stats_requests + 35
+
+
+def test_get_pages_all_streams_every_page(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'get-pages', '--project-id', '4', '--all', '--format', 'ndjson',
+                  '--fields', 'id,index_status', '--order', 'asc')
+    rows = [json.loads(line) for line in out.splitlines()]
+    assert [row['id'] for row in rows] == list(range(4_000_001, 4_000_026))
+    assert set(rows[0]) == {'id', 'index_status'}
+    assert server.api.requests[PAGES] == 3
+
+
+def test_reindex_pages_resumes_from_checkpoint(server, monkeypatch, capsys, tmp_path):
+    checkpoint = str(tmp_path / 'reindex.jsonl')
+    reindex = ('reindex-pages', '--project-id', '5', '--url-regex', r'page-1\d$', '--checkpoint', checkpoint)
+    assert 'Reindexed 10 pages, 0 failed, 0 skipped' in run_cli(server, monkeypatch, capsys, *reindex)
+    assert 'Reindexed 0 pages, 0 failed, 10 skipped' in run_cli(server, monkeypatch, capsys, *reindex)
+    assert server.api.requests[REINDEX_PAGE] == 10
+
+    out = run_cli(server, monkeypatch, capsys, 'reindex-pages', '--project-id', '5', '--index-status', 'queued',
+                  '--dry-run')
+    assert '10 pages selected' in out
+
+
+def test_delete_pages_reports_ndjson(server, monkeypatch, capsys, tmp_path):
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('6000001\n6000002\n999\n')
+    with pytest.raises(SystemExit):
+        run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '6', '--page-ids-file', str(ids_file),
+                '--force')
+    results = {r['id']: r for r in map(json.loads, capsys.readouterr().out.splitlines())}
+    assert results[6000001]['status'] == 'success'
+    assert results[999] == dict(results[999], status='failed', http_status=404)
+
+    out = run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '6', '--url-regex', r'page-2\d$',
+                  '--force', '--concurrency', '8')
+    assert sorted(json.loads(line)['id'] for line in out.splitlines()) == list(range(6_000_020, 6_000_026))
+    assert server.api.requests[DELETE_PAGE] == 9
+
+
+def test_sync_page_metadata_updates_only_changes(server, monkeypatch, capsys, tmp_path):
+    metadata = tmp_path / 'metadata.jsonl'
+    metadata.write_text(json.dumps({'page_id': 7000001, 'title': 'Page 1'}) + '\n' +
+                        json.dumps({'page_id': 7000002, 'title': 'Renamed', 'image': None}) + '\n')
+    sync = ('sync-page-metadata', '--project-id', '7', '--input', str(metadata))
+    assert 'Updated 1 pages, 1 unchanged, 0 failed' in run_cli(server, monkeypatch, capsys, *sync)
+    assert 'Updated 0 pages, 2 unchanged, 0 failed' in run_cli(server, monkeypatch, capsys, *sync)
+    assert server.api.requests[PAGE_METADATA] == 4
+    assert server.api.requests[UPDATE_PAGE_METADATA] == 1
+
+
+def test_apply_settings_pushes_only_drift(server, monkeypatch, capsys, tmp_path):
+    spec = tmp_path / 'settings.json'
+    spec.write_text(json.dumps({'citations_sources_label_msg': 'References', 'remove_branding': True,
+                                'enable_citations': 3}))
+    apply = ('apply-settings', '--file', str(spec), '--projects', '1,2,3', '--format', 'ndjson')
+    results = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *apply).splitlines()]
+    assert {r['status'] for r in results} == {'updated'}
+    assert set(results[0]['drift']) == {'citations_sources_label_msg', 'remove_branding'}
+
+    results = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *apply).splitlines()]
+    assert {r['status'] for r in results} == {'unchanged'}
+    assert server.api.requests[PROJECT_SETTINGS] == 6
+    assert server.api.requests[UPDATE_PROJECT_SETTINGS] == 3
+
+    settings = json.loads(run_cli(server, monkeypatch, capsys, 'get-project-settings', '--project-id', '2'))['data']
+    assert settings['no_answer_message'] == "Sorry, I don't have an answer for that."  # not reset by the SDK default
+
+
+def test_delete_pages_spanning_listing_pages(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '8', '--url-regex', '.',
+                  '--force', '--concurrency', '1')
+    assert len(out.splitlines()) == 25
+    assert server.api.requests[DELETE_PAGE] == 25
+    assert run_cli(server, monkeypatch, capsys, 'get-pages', '--project-id', '8', '--all',
+                   '--format', 'ndjson') == ''
+
+
+def test_apply_settings_rejects_null(server, monkeypatch, capsys, tmp_path):
+    spec = tmp_path / 'settings.json'
+    spec.write_text(json.dumps({'persona_instructions': None}))
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(server, monkeypatch, capsys, 'apply-settings', '--file', str(spec), '--projects', '1')
+    assert excinfo.value.code == 1
+    assert 'Settings cannot be null: persona_instructions' in capsys.readouterr().out
+    assert server.api.requests[UPDATE_PROJECT_SETTINGS] == 0
+
+
+def test_changes_keeps_interleaved_follow_up(server, monkeypatch, capsys, tmp_path):
+    changes = ('changes', '--project-id', '9', '--state', str(tmp_path / 'state.json'))
+    records = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *changes).splitlines()]
+    old_session = records[0]['data']['session_id']
+    out = run_cli(server, monkeypatch, capsys, 'create-conversation', '--project-id', '9', '--name', 'New',
+                  '--format', 'json')
+    new_session = json.loads(out)['data']['session_id']
+    time.sleep(1.1)  # updated_at has second resolution
+
+    # After the listing, a follow-up lands in the old conversation before the new one gets a message
+    fetch = CustomGPTCLI._fetch_new_messages
+
+    def interleaved_fetch(self, project_id, session_id, after_id):
+        if session_id == new_session:
+            for session, prompt in ((old_session, 'Late follow-up'), (new_session, 'First')):
+                self._make_api_call(CustomGPT.Conversation.send, project_id=project_id, session_id=session,
+                                    prompt=prompt)
+        return fetch(self, project_id, session_id, after_id)
+
+    monkeypatch.setattr(CustomGPTCLI, '_fetch_new_messages', interleaved_fetch)
+    records = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *changes).splitlines()]
+    assert [r['data'].get('user_query') for r in records if r['type'] == 'message'] == ['First']
+
+    monkeypatch.setattr(CustomGPTCLI, '_fetch_new_messages', fetch)
+    records = [json.loads(line) for line in run_cli(server, monkeypatch, capsys, *changes).splitlines()]
+    assert [(r['session_id'], r['data']['user_query']) for r in records] == [(old_session, 'Late follow-up')]
+
+
+def test_retry_warnings_stay_off_stdout():
+    with MockServer(projects=35, error_rate=0.3) as server:
+        result = subprocess.run([sys.executable, '-m', 'customgpt_cli.cli', '--api-key', 'test', '--base-url',
+                                 server.url, 'list-projects', '--min-queries', '0', '--format', 'ndjson'],
+                                capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert len([json.loads(line) for line in result.stdout.splitlines()]) == 35
+    assert 'Retrying in' in result.stderr
+
+
+def test_streamed_json_matches_buffered(server, monkeypatch, capsys):
+    filters = ('list-projects', '--min-queries', '2500', '--format', 'json')
+    streamed = run_cli(server, monkeypatch, capsys, *filters, '--stream')
+    assert streamed == run_cli(server, monkeypatch, capsys, *filters)
+    assert json.loads(streamed)
+
+
+def test_open_loop_bench_counts_queueing_and_missed(monkeypatch, capsys):
+    with MockServer(projects=1, latency=0.1) as server:
+        started = time.monotonic()
+        out = run_cli(server, monkeypatch, capsys, 'bench-chat', '--project-id', '1',
+                      '--rate', '40', '--duration', '1', '--concurrency', '1', '--format', 'json')
+        elapsed = time.monotonic() - started
+    summary = json.loads(out)
+    assert summary['missed'] > 10  # one worker keeps up with ~10 of the 40 scheduled requests
+    assert summary['latency_ms']['max'] > 500  # queueing behind the slow worker is part of the latency
+    assert elapsed < 2
+
+
+def test_batch_send_survives_unexpected_errors(server, monkeypatch, capsys, tmp_path):
+    batch = tmp_path / 'prompts.jsonl'
+    batch.write_text(''.join(json.dumps({'project_id': 1, 'prompt': f'Q{i}'}) + '\n' for i in range(3)))
+    send_item = CustomGPTCLI._send_batch_item
+
+    def flaky_send_item(self, index, line, conversation_name):
+        if index == 1:
+            raise AttributeError("'list' object has no attribute 'get'")
+        return send_item(self, index, line, conversation_name)
+
+    monkeypatch.setattr(CustomGPTCLI, '_send_batch_item', flaky_send_item)
+    out = run_cli(server, monkeypatch, capsys, 'batch-send', '--input', str(batch))
+    records = sorted((json.loads(line) for line in out.splitlines()), key=lambda r: r['index'])
+    assert [r['status'] for r in records] == ['success', 'failed', 'success']
+    assert records[1]['error'].startswith('Unexpected error')
+
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(server, monkeypatch, capsys, 'batch-send', '--input', str(batch),
+                '--output', str(tmp_path / 'missing' / 'results.jsonl'))
+    assert excinfo.value.code == 1
+    assert 'Cannot write output file' in capsys.readouterr().err
+
+
+def test_mirror_rejects_invalid_name_filter(server, monkeypatch, capsys, tmp_path):
+    mirror = str(tmp_path / 'mirror.sqlite3')
+    run_cli(server, monkeypatch, capsys, 'mirror', 'sync', '--mirror', mirror, '--resources', 'stats')
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(server, monkeypatch, capsys, 'list-projects', '--from-mirror', '--mirror', mirror,
+                '--name-filter', '(')
+    assert excinfo.value.code == 1
+    assert 'Invalid --name-filter regex' in capsys.readouterr().out
+
+
+def test_get_pages_fields_apply_to_single_page(server, monkeypatch, capsys):
+    out = run_cli(server, monkeypatch, capsys, 'get-pages', '--project-id', '4', '--page', '2', '--fields', 'id',
+                  '--order', 'asc')
+    assert json.loads(out) == [{'id': id} for id in range(4_000_011, 4_000_021)]
+
+
+def test_open_loop_bench_sizes_pool_for_default_concurrency(server, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['customgpt-cli', '--api-key', 'test', '--base-url', server.url,
+                                      'bench-chat', '--project-id', '1', '--rate', '20', '--requests', '2',
+                                      '--format', 'json'])
+    cli = CustomGPTCLI()
+    cli.run()
+    assert cli._transport.pool_size == 64  # 32 requests in flight under --rate
+
+
+def test_delete_pages_errors_stay_off_stdout(server, monkeypatch, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '8', '--page-ids', '1,x', '--force')
+    assert excinfo.value.code == 1
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'Error: Invalid page ID' in captured.err
+
+
+def listing_durations(server, monkeypatch):
+    """Record the duration parameter of every pages listing request."""
+    durations = []
+    list_pages = server.api.list_pages
+
+    def recording_list_pages(request):
+        durations.append(request['query'].get('duration'))
+        return list_pages(request)
+
+    monkeypatch.setattr(server.api, 'list_pages', recording_list_pages)
+    return durations
+
+
+def test_page_selection_lists_full_history(server, monkeypatch, capsys):
+    durations = listing_durations(server, monkeypatch)
+    out = run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '8', '--url-regex', 'page-1$',
+                  '--dry-run')
+    assert [json.loads(line)['id'] for line in out.splitlines()] == [8_000_001]
+    assert durations and all(int(d) > 365 for d in durations)  # mock projects date from 2024
+
+    durations.clear()
+    run_cli(server, monkeypatch, capsys, 'delete-pages', '--project-id', '8', '--url-regex', '.', '--duration',
+            '30', '--dry-run')
+    assert set(durations) == {'30'}
+
+
+def test_page_selection_validates_regex_and_covers_older_than(server, monkeypatch, capsys):
+    for command in ('reindex-pages', 'delete-pages'):
+        with pytest.raises(SystemExit) as excinfo:
+            run_cli(server, monkeypatch, capsys, command, '--project-id', '8', '--url-regex', '(', '--dry-run')
+        assert excinfo.value.code == 1
+        assert 'Error: Invalid --url-regex' in capsys.readouterr().err
+
+    durations = listing_durations(server, monkeypatch)
+    monkeypatch.setattr(CustomGPTCLI, '_page_history_days', lambda self, project_id, project=None: None)
+    run_cli(server, monkeypatch, capsys, 'reindex-pages', '--project-id', '8', '--older-than', '400', '--dry-run')
+    assert set(durations) == {'401'}
+
+
+def test_mirror_lists_full_page_history(server, monkeypatch, capsys, tmp_path):
+    durations = listing_durations(server, monkeypatch)
+    run_cli(server, monkeypatch, capsys, 'mirror', 'sync', '--mirror', str(tmp_path / 'mirror.sqlite3'),
+            '--resources', 'pages')
+    assert len(durations) == 35 * 3
+    assert all(int(d) > 365 for d in durations)  # mock projects date from 2024
+
+
+def test_sync_page_metadata_counts_bad_responses_as_failed(server, monkeypatch, capsys, tmp_path):
+    metadata = tmp_path / 'metadata.csv'
+    metadata.write_text('page_id,title\n7000003,A\n7000004,B\n')
+    get_page_metadata = server.api.get_page_metadata
+
+    def garbled_get_page_metadata(request):
+        if str(request['params']['pageId']) == '7000003':
+            return MockResponse(202, headers={'Content-Type': 'text/html'}, stream=iter([b'<html>accepted</html>']))
+        return get_page_metadata(request)
+
+    monkeypatch.setattr(server.api, 'get_page_metadata', garbled_get_page_metadata)
+    with pytest.raises(SystemExit):
+        run_cli(server, monkeypatch, capsys, 'sync-page-metadata', '--project-id', '7', '--input', str(metadata))
+    out = capsys.readouterr().out
+    assert 'Failed page 7000003 (HTTP 202)' in out
+    assert 'Updated 1 pages, 0 unchanged, 1 failed' in out
+
+
+def test_apply_settings_counts_bad_responses_as_failed(server, monkeypatch, capsys, tmp_path):
+    spec = tmp_path / 'settings.json'
+    spec.write_text(json.dumps({'citations_sources_label_msg': 'References'}))
+    get_settings = server.api.get_settings
+
+    def garbled_get_settings(request):
+        if str(request['params']['projectId']) == '1':
+            return MockResponse(202, headers={'Content-Type': 'text/html'}, stream=iter([b'<html>accepted</html>']))
+        return get_settings(request)
+
+    monkeypatch.setattr(server.api, 'get_settings', garbled_get_settings)
+    with pytest.raises(SystemExit):
+        run_cli(server, monkeypatch, capsys, 'apply-settings', '--file', str(spec), '--projects', '1,2')
+    out = capsys.readouterr().out
+    assert 'Failed project 1 (HTTP 202)' in out
+    assert 'Updated 1 projects, 0 unchanged, 1 failed' in out
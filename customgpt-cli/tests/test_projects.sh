@@ -105,6 +105,15 @@ customgpt-cli list-projects \
     --format json
 check_success "List projects with comprehensive stats filters"
 
+customgpt-cli list-projects --concurrency 8 --format csv
+check_success "List projects with parallel stats requests"
+
+customgpt-cli list-projects --format ndjson
+check_success "List projects (NDJSON format)"
+
+customgpt-cli list-projects --stream --min-queries 1
+check_success "List projects (streaming table)"
+
 # Final summary
 print_header "Test Summary"
 echo -e "${GREEN}Project command tests completed.${NC}"
@@ -0,0 +1,38 @@
+"""
+Startup tests: parsing a command must not pay for the SDK or unrelated parsers.
+"""
+
+import argparse
+import subprocess
+import sys
+
+from customgpt_cli.cli import CustomGPTCLI
+
+
+def registered_commands(cli):
+    for action in cli.parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return set(action.choices)
+    return set()
+
+
+def test_parsing_does_not_import_sdk():
+    code = (
+        'import sys\n'
+        'from customgpt_cli.cli import CustomGPTCLI\n'
+        'CustomGPTCLI(["get-user"]).parser.parse_args(["get-user"])\n'
+        'assert "customgpt_client" not in sys.modules\n'
+        'assert "requests" not in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_only_selected_command_group_is_registered():
+    cli = CustomGPTCLI(['--api-key', 'x', 'get-pages', '--project-id', '1'])
+    assert registered_commands(cli) == {'get-pages', 'delete-page', 'reindex-page', 'reindex-pages', 'delete-pages'}
+
+
+def test_help_registers_every_command():
+    commands = {command for commands, _, _ in CustomGPTCLI._COMMAND_GROUPS for command in commands}
+    assert registered_commands(CustomGPTCLI(['--help'])) == commands
+    assert registered_commands(CustomGPTCLI(['not-a-command'])) == commands
@@ -0,0 +1,51 @@
+"""
+watch-dir tests: bursts of edits are coalesced and only changed files are pushed.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from customgpt_cli.mock_server import MockServer
+
+CREATE_SOURCE = ('post', '/api/v1/projects/{projectId}/sources')
+DELETE_PAGE = ('delete', '/api/v1/projects/{projectId}/pages/{pageId}')
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.05)
+
+
+@pytest.mark.parametrize('mode', [[], ['--poll', '--poll-interval', '0.1']], ids=['inotify', 'polling'])
+def test_watch_dir_syncs_changes(tmp_path, mode):
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'a.txt').write_text('a')
+    with MockServer(projects=1) as server:
+        process = subprocess.Popen([sys.executable, '-m', 'customgpt_cli.cli', '--api-key', 'test',
+                                    '--base-url', server.url, 'watch-dir', '--project-id', '1',
+                                    str(tmp_path), '--debounce', '0.5', '--delete-removed', *mode],
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        try:
+            wait_for(lambda: server.api.requests[CREATE_SOURCE] == 1)  # initial sync
+            time.sleep(0.5)
+            for i in range(5):
+                (tmp_path / 'b.txt').write_text('b' * i)
+                time.sleep(0.05)
+            wait_for(lambda: server.api.requests[CREATE_SOURCE] == 2)
+
+            (tmp_path / 'docs' / 'a.txt').unlink()
+            (tmp_path / 'docs').rmdir()
+            wait_for(lambda: server.api.requests[DELETE_PAGE] == 1)
+            time.sleep(1)
+        finally:
+            process.terminate()
+            output = process.communicate(timeout=10)[0]
+    assert 'Uploaded b.txt -> source' in output
+    assert output.count('Deleted docs/a.txt') == 1
+    assert server.api.requests[CREATE_SOURCE] == 2
+    assert (tmp_path / '.customgpt-manifest-1.jsonl').read_text().count('"path"') == 1
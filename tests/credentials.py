@@ -1,5 +1,9 @@
 # Credentials File for easy handling across the test suite
+import os
 
 def credentials():
 	# (base_url, api_key)
-	return ('https://app.customgpt.ai/api/v1/', '')
+	# Set CUSTOMGPT_API_ENDPOINT=http://127.0.0.1:8080/api/v1/ to run against
+	# the offline mock server (python -m customgpt_cli.mock_server)
+	return (os.environ.get('CUSTOMGPT_API_ENDPOINT', 'https://app.customgpt.ai/api/v1/'),
+	        os.environ.get('CUSTOMGPT_API_KEY', ''))